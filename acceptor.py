@@ -1,7 +1,8 @@
 '''
 acceptor.py
 '''
-from my_types import State
+from typing import Optional
+from my_types import Alphabet, State
 from helpers import compact
 from brzozowski import brzozowski, opt, pretty
 
@@ -59,6 +60,98 @@ class Acceptor:
       alphabet_set.add(a)
     return str(''.join(sorted(alphabet_set)))
 
+  def canonical(self, alphabet: Optional[Alphabet] = None) -> 'Acceptor':
+    '''
+    renumber the reachable states 0..n-1 in breadth-first order from q0,
+    taking symbols in alphabet order; unreachable states are dropped
+
+    Args:
+        alphabet (Optional[Alphabet]): input alphabet (default: the acceptor's)
+
+    Returns:
+        Acceptor: an isomorphic acceptor whose numbering depends only on its structure
+    '''
+    if alphabet is None:
+      alphabet = self.get_alphabet()
+    number: dict[State, State] = {self.q0: 0}
+    order: list[State] = [self.q0]
+    d: dict[tuple[State, str], State] = {}
+    for q in order:
+      for a in alphabet:
+        if (q, a) in self.d:
+          p = self.d[(q, a)]
+          if p not in number:
+            number[p] = len(order)
+            order.append(p)
+          d[(number[q], a)] = number[p]
+    F = {number[q] for q in order if q in self.F}
+    return Acceptor(set(range(len(order))), 0, F, d)
+
+  def minimize(self, alphabet: Optional[Alphabet] = None) -> 'Acceptor':
+    '''
+    the minimal equivalent acceptor, by Hopcroft's partition refinement,
+    numbered as by canonical()
+
+    missing transitions go to an implicit rejecting sink; the sink is only
+    kept as a state if some state of this acceptor is equivalent to it
+
+    Args:
+        alphabet (Optional[Alphabet]): input alphabet (default: the acceptor's)
+
+    Returns:
+        Acceptor: an equivalent acceptor with the fewest states
+    '''
+    if alphabet is None:
+      alphabet = self.get_alphabet()
+    reachable = self.canonical(alphabet)
+    n = len(reachable.Q)
+    sink = n
+    delta = [[reachable.d.get((q, a), sink) for a in alphabet] for q in range(n)]
+    delta.append([sink] * len(alphabet))
+    inverse: list[list[list[State]]] = [[[] for _ in range(n + 1)] for _ in alphabet]
+    for q, targets in enumerate(delta):
+      for i, p in enumerate(targets):
+        inverse[i][p].append(q)
+
+    accepting = set(reachable.F)
+    blocks: list[set[State]] = [b for b in (set(accepting), set(range(n + 1)) - accepting) if b]
+    block_of = [0] * (n + 1)
+    for b, block in enumerate(blocks):
+      for q in block:
+        block_of[q] = b
+    todo = {min(range(len(blocks)), key=lambda b: len(blocks[b]))}
+    while todo:
+      splitter = list(blocks[todo.pop()])
+      for i in range(len(alphabet)):
+        # the states with an a-transition into the splitter, by block
+        touched: dict[int, set[State]] = {}
+        for p in splitter:
+          for q in inverse[i][p]:
+            touched.setdefault(block_of[q], set()).add(q)
+        for b, part in touched.items():
+          if len(part) == len(blocks[b]):
+            continue
+          blocks[b] -= part
+          blocks.append(part)
+          new = len(blocks) - 1
+          for q in part:
+            block_of[q] = new
+          if b in todo:
+            todo.add(new)
+          else:
+            todo.add(b if len(blocks[b]) < len(part) else new)
+
+    # the block of the sink is dropped unless it holds a real state
+    dead = block_of[sink] if blocks[block_of[sink]] == {sink} else -1
+    d: dict[tuple[State, str], State] = {}
+    for q in range(n):
+      for i, a in enumerate(alphabet):
+        if block_of[delta[q][i]] != dead:
+          d[(block_of[q], a)] = block_of[delta[q][i]]
+    Q = {block_of[q] for q in range(n)}
+    F = {block_of[q] for q in accepting}
+    return Acceptor(Q, block_of[0], F, d).canonical(alphabet)
+
   def print_acceptor(self) -> None:
     '''
     print this DFA to standard output
@@ -66,14 +159,11 @@ class Acceptor:
     print('DFA')
     print('===')
     alphabet: str = self.get_alphabet()
-    # TODO(pcr): map states to 1..n before printing
-    states: list[int] = list(sorted(self.Q))
-    i = states.index(self.q0)
-    if i != 0:
-      # make initial state at index 0
-      states[0], states[i] = states[i], states[0]
+    # number the states 0..n-1, with the initial state at 0
+    states: list[State] = [self.q0, *sorted(self.Q - {self.q0})]
+    number: dict[State, int] = {q: i for i, q in enumerate(states)}
     initial_state = 0
-    accepting_states: set[int] = {states.index(state) for state in self.F}
+    accepting_states: set[int] = {number[state] for state in self.F}
     transition_function: dict[tuple[int, str], set[int]] = {}
     print('state |', end='')
     for a in alphabet:
@@ -81,7 +171,7 @@ class Acceptor:
     print()
     print(f"------+{'+---'*len(alphabet)}")
     for q in states:
-      q_i = states.index(q)
+      q_i = number[q]
       t = ''
       if q_i == initial_state:
         # initial state
@@ -95,18 +185,24 @@ class Acceptor:
         t += '*'
       print(f'{t:5s} |', end='')
       for a in alphabet:
+        if (q, a) not in self.d:
+          # transition doesn't exist -> reject
+          print('| - ', end='')
+          continue
         # next state (print the _index_)
-        print(f'| {states.index(self.d[(q, a)])} ', end='')
+        print(f'| {number[self.d[(q, a)]]} ', end='')
         key = (q_i, a)
         if key not in transition_function:
           transition_function[key] = set()
-        transition_function[key].add(states.index(self.d[(q, a)]))
+        transition_function[key].add(number[self.d[(q, a)]])
       print()
     print('REGEX')
     print('=====')
-    ans = brzozowski(
+    ans = opt(brzozowski(
       len(states),
       alphabet,
       accepting_states,
-      transition_function)
-    print(pretty(opt(ans)))
+      transition_function,
+      order='weight'))
+    print(pretty(ans))
+    print(f'({ans.size} nodes)')
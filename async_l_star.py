@@ -0,0 +1,85 @@
+'''
+The Learner L*, for teachers behind an asynchronous boundary
+'''
+
+import asyncio
+from typing import Optional
+from async_teacher import AsyncTeacher
+from teacher import Teacher
+from my_types import Alphabet
+from obervation_table import ObservationTable
+from acceptor import Acceptor
+from counterexamples import CounterexampleHandler, add_prefixes
+from l_star import refine
+
+class _BlockingTeacher(Teacher):
+  '''
+  a synchronous view of an AsyncTeacher for counterexample handlers,
+  which run in a worker thread while the event loop answers their queries
+  '''
+  def __init__(self, teacher: AsyncTeacher, loop: asyncio.AbstractEventLoop):
+    self.teacher = teacher
+    self.loop = loop
+
+  def membership_query(self, string: str) -> bool:
+    return asyncio.run_coroutine_threadsafe(self.teacher.membership_query(string), self.loop).result()
+
+  def respond_to_conjecture(self, conjecture: Acceptor) -> Optional[str]:
+    return asyncio.run_coroutine_threadsafe(self.teacher.respond_to_conjecture(conjecture), self.loop).result()
+
+  def query_history(self) -> list[str]:
+    return self.teacher.query_history()
+
+async def extend(table: ObservationTable, teacher: AsyncTeacher, limit: asyncio.Semaphore) -> None:
+  '''
+  extend T to (S U S*A) * E, asking all the missing membership queries concurrently
+
+  Args:
+      table (ObservationTable): the table to extend
+      teacher (AsyncTeacher): a minimally adequate teacher
+      limit (asyncio.Semaphore): bounds the number of queries in flight
+  '''
+  async def ask(string: str) -> bool:
+    async with limit:
+      return await teacher.membership_query(string)
+  answers = await asyncio.gather(*(ask(string) for string in table.pending_queries()))
+  table.extend_with(list(answers))
+
+async def async_l_star(
+    alphabet: Alphabet,
+    teacher: AsyncTeacher,
+    concurrency: int = 8,
+    table_type: type[ObservationTable] = ObservationTable,
+    counterexample_handler: CounterexampleHandler = add_prefixes) -> Acceptor:
+  '''
+  learn a regular language, overlapping the latency of membership queries
+
+  the table is refined exactly as in l_star; only filling it is concurrent.
+  the counterexample handler runs in a worker thread, so the queries of
+  e.g. rivest_schapire are asked one at a time
+
+  Args:
+      alphabet (Alphabet): input alphabet
+      teacher (AsyncTeacher): a minimally adequate teacher
+      concurrency (int): maximum number of membership queries in flight
+      table_type (type[ObservationTable]): observation table backend
+      counterexample_handler (CounterexampleHandler): how counterexamples refine the table
+
+  Returns:
+      Acceptor: a DFA for the language
+  '''
+  limit = asyncio.Semaphore(concurrency)
+  blocking = _BlockingTeacher(teacher, asyncio.get_running_loop())
+  table = table_type(alphabet)
+  await extend(table, teacher, limit)
+
+  while True:
+    for _ in refine(table):
+      await extend(table, teacher, limit)
+
+    M = table.to_acceptor()
+    t = await teacher.respond_to_conjecture(M)
+    if t is None:
+      return M
+    await asyncio.to_thread(counterexample_handler, table, t, blocking)
+    await extend(table, teacher, limit)
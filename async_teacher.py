@@ -0,0 +1,45 @@
+'''
+AsyncTeacher
+'''
+
+from typing import Optional
+from abc import ABC, abstractmethod
+from acceptor import Acceptor
+
+class AsyncTeacher(ABC):
+  '''
+  Abstract base class for minimally adequate teachers behind an asynchronous boundary
+  (e.g. an RPC or a subprocess), so that many queries can be in flight at once
+  '''
+  @abstractmethod
+  async def membership_query(self, string: str) -> bool:
+    '''
+    ask the teacher whether the given string is in the language
+
+    Args:
+        string (str): string in question
+
+    Returns:
+        bool: True iff string is in the language
+    '''
+
+  @abstractmethod
+  async def respond_to_conjecture(self, conjecture: Acceptor) -> Optional[str]:
+    '''
+    ask the teacher to verify a conjectured acceptor
+
+    Args:
+      conjecture (Acceptor): the acceptor in question
+
+    Returns:
+      Optional[str]: a counterexample if the conjecture is incorrect or None otherwise
+    '''
+
+  @abstractmethod
+  def query_history(self) -> list[str]:
+    '''
+    get the query history
+
+    Returns:
+      list[str]: a list of queries in the order they were answered
+    '''
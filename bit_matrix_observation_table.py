@@ -0,0 +1,131 @@
+'''
+BitMatrixObservationTable
+'''
+
+from typing import Generator
+import numpy as np
+import numpy.typing as npt
+from my_types import Alphabet, Signature
+from obervation_table import ObservationTable
+from helpers import compact
+
+class BitMatrixObservationTable(ObservationTable):
+  '''
+  an observation table that stores (S U S*A) x E in a NumPy boolean matrix
+
+  matrix rows are numbered in the order their prefixes were added and
+  columns in the order their suffixes were added to E.
+  closedness and consistency are decided from the equivalence classes of
+  the bit-packed rows, as computed by np.unique
+  '''
+  def __init__(self, A: Alphabet):
+    # node of u -> matrix row, and back
+    self._row_of: dict[int, int] = {}
+    self._node_of: list[int] = []
+    # T(u*e) and whether it is known yet, grown by doubling
+    self._bits: npt.NDArray[np.bool_] = np.zeros((16, 4), dtype=np.bool_)
+    self._known: npt.NDArray[np.bool_] = np.zeros((16, 4), dtype=np.bool_)
+    # matrix rows of each s in S and of each s*a, in the order S grew
+    self._s_rows: list[int] = []
+    self._sa_rows: list[list[int]] = []
+    super().__init__(A)
+
+  def _grow(self, rows: int, columns: int) -> None:
+    '''
+    make room for at least rows x columns cells
+    '''
+    old_rows, old_columns = self._bits.shape
+    if rows <= old_rows and columns <= old_columns:
+      return
+    new_rows, new_columns = old_rows, old_columns
+    while new_rows < rows:
+      new_rows *= 2
+    while new_columns < columns:
+      new_columns *= 2
+    for name in ('_bits', '_known'):
+      old = getattr(self, name)
+      new = np.zeros((new_rows, new_columns), dtype=np.bool_)
+      new[:old_rows, :old_columns] = old
+      setattr(self, name, new)
+
+  def _add_rows(self, node: int) -> None:
+    super()._add_rows(node)
+    self._s_rows.append(self._row_of[node])
+    self._sa_rows.append([self._row_of[self.T.children[node][a]] for a in range(len(self.A))])
+
+  def _has_row(self, node: int) -> bool:
+    return node in self._row_of
+
+  def _row_nodes(self) -> list[int]:
+    return list(self._node_of)
+
+  def _add_row(self, node: int) -> None:
+    if self._has_row(node):
+      return
+    r = len(self._node_of)
+    self._row_of[node] = r
+    self._node_of.append(node)
+    self._grow(r + 1, len(self._columns))
+    for column, word in enumerate(self._column_words):
+      self._add_cell(node, column, word)
+
+  def _set_cell(self, node: int, column: int, value: bool | None) -> None:
+    r = self._row_of[node]
+    self._grow(r + 1, column + 1)
+    self._known[r, column] = value is not None
+    self._bits[r, column] = bool(value)
+
+  def _row(self, node: int) -> Signature:
+    r = self._row_of[node]
+    n = len(self._columns)
+    return tuple(
+      t if k else None
+      for t, k in zip(self._bits[r, :n].tolist(), self._known[r, :n].tolist()))
+
+  def _classes(self) -> npt.NDArray[np.intp]:
+    '''
+    number each matrix row by its equivalence class (equal rows, equal class)
+    '''
+    n_rows, n_columns = len(self._node_of), len(self._columns)
+    packed = np.packbits(self._bits[:n_rows, :n_columns], axis=1)
+    if self._pending:
+      # unknown cells must not compare equal to known False cells
+      known = np.packbits(self._known[:n_rows, :n_columns], axis=1)
+      packed = np.concatenate((packed, known), axis=1)
+    _, classes = np.unique(packed, axis=0, return_inverse=True)
+    return classes.reshape(-1)
+
+  def _unclosed(self) -> npt.NDArray[np.bool_]:
+    '''
+    mask over (S, A) of the rows s*a that match no row of S
+    '''
+    classes = self._classes()
+    s_classes = classes[np.array(self._s_rows)]
+    sa_classes = classes[np.array(self._sa_rows, dtype=np.intp).reshape(len(self._s_rows), len(self.A))]
+    return ~np.isin(sa_classes, s_classes)
+
+  def closed(self) -> bool:
+    return not self._unclosed().any()
+
+  def find_not_closed(self) -> str:
+    unclosed = np.argwhere(self._unclosed())
+    if len(unclosed) == 0:
+      raise ValueError('failed to find s1,a to increase closure')
+    i, a = unclosed[0]
+    return self.T.string(self._node_of[self._sa_rows[i][a]])
+
+  def _inconsistencies(self) -> Generator[str, None, None]:
+    '''
+    each member of S is compared against the first member of S in its class
+    '''
+    classes = self._classes()
+    s = np.array(self._s_rows)
+    sa = np.array(self._sa_rows, dtype=np.intp).reshape(len(self._s_rows), len(self.A))
+    _, first, inverse = np.unique(classes[s], return_index=True, return_inverse=True)
+    leader = first[inverse.reshape(-1)]
+    n = len(self._columns)
+    for i, a in np.argwhere(classes[sa] != classes[sa[leader]]):
+      r1, r2 = sa[leader[i], a], sa[i, a]
+      differ = (self._bits[r1, :n] != self._bits[r2, :n]) | (self._known[r1, :n] != self._known[r2, :n])
+      e = self._columns[int(np.argmax(differ))]
+      yield compact(f'{self.A[a]}{e}')
@@ -2,6 +2,8 @@
 brzozowski algebraic method
 '''
 
+from collections import Counter
+from collections.abc import Callable
 from sexpr import sexpr
 
 EMPTY_LANGUAGE = '∅'
@@ -14,43 +16,44 @@ UNION = 'union'
 
 
 class literal(sexpr):
-  def __init__(self, symbol: str):
-    sexpr.__init__(self, symbol)
+  __slots__ = ()
+  def __new__(cls, symbol: str):
+    return sexpr.__new__(cls, symbol)
 
 class concat(sexpr):
-  def __init__(self, left: sexpr, right: sexpr):
-    sexpr.__init__(self, CONCAT)
-    self.left = left
-    self.right = right
+  __slots__ = ()
+  def __new__(cls, left: sexpr, right: sexpr):
+    return sexpr.__new__(cls, CONCAT, left, right)
 
 class union(sexpr):
-  def __init__(self, left: sexpr, right: sexpr):
-    sexpr.__init__(self, UNION)
-    self.left = left
-    self.right = right
+  __slots__ = ()
+  def __new__(cls, left: sexpr, right: sexpr):
+    return sexpr.__new__(cls, UNION, left, right)
 
 class star(sexpr):
-  def __init__(self, child: sexpr):
-    sexpr.__init__(self, STAR)
-    self.left = child
+  __slots__ = ()
+  def __new__(cls, child: sexpr):
+    return sexpr.__new__(cls, STAR, child)
 
 class optional(sexpr):
-  def __init__(self, child: sexpr):
-    sexpr.__init__(self, OPTIONAL)
-    self.left = child
+  __slots__ = ()
+  def __new__(cls, child: sexpr):
+    return sexpr.__new__(cls, OPTIONAL, child)
 
 class some(sexpr):
-  def __init__(self, child: sexpr):
-    sexpr.__init__(self, SOME)
-    self.left = child
+  __slots__ = ()
+  def __new__(cls, child: sexpr):
+    return sexpr.__new__(cls, SOME, child)
 
 class empty_string(sexpr):
-  def __init__(self):
-    sexpr.__init__(self, EMPTY_STRING)
+  __slots__ = ()
+  def __new__(cls):
+    return sexpr.__new__(cls, EMPTY_STRING)
 
 class empty_language(sexpr):
-  def __init__(self):
-    sexpr.__init__(self, EMPTY_LANGUAGE)
+  __slots__ = ()
+  def __new__(cls):
+    return sexpr.__new__(cls, EMPTY_LANGUAGE)
 
 def combine(symbols: list[str]) -> sexpr:
   n = len(symbols)
@@ -58,95 +61,169 @@ def combine(symbols: list[str]) -> sexpr:
     case 0:
       return empty_language()
     case 1:
-      return sexpr(symbols[0])
+      return literal(symbols[0])
     case 2:
-      return union(sexpr(symbols[0]), sexpr(symbols[1]))
+      return union(literal(symbols[0]), literal(symbols[1]))
     case _:
       m = int(n/2) + 1
       return union(combine(symbols[:m]), combine(symbols[m:]))
 
-def brzozowski(m: int, alphabet: str, final: set[int], trans: dict[tuple[int, str], set[int]]) -> sexpr:
-  B: list[sexpr] = []
-  for i in range(m):
-    if i in final:
-      B.append(empty_string())
-    else:
-      B.append(empty_language())
-  # print(f"[DEBUG] {B=}")
-
-  A: list[list[sexpr]] = []
-  for i in range(m):
-    A.append([])
-    for j in range(m):
-      symbols: list[str] = []
-      for a in alphabet:
-        if (i, a) in trans and j in trans[(i, a)]:
-          symbols.append(a)
-      A[i].append(combine(symbols))
-  # print(f"[DEBUG] {A=}")
-
-  for n in range(m-1,-1,-1):
-    B[n] = concat(star(A[n][n]), B[n])
-    # print(f"[DEBUG] B[{n}]={B[n]}")
-    for j in range(n):
-      A[n][j] = concat(star(A[n][n]), A[n][j])
-      # print(f"[DEBUG] A[{n}][{j}]={A[n][j]}")
-    for i in range(n):
-      B[i] = union(B[i], concat(A[i][n], B[n]))
-      # print(f"[DEBUG] B[{i}]={B[i]}")
-      for j in range(n):
-        A[i][j] = union(A[i][j], concat(A[i][n], A[n][j]))
-        # print(f"[DEBUG] A[{i}][{j}]={A[i][j]}")
-
-  return B[0]
-
-def simplify(expr: sexpr | None) -> sexpr:
-  if expr is None:
-    return sexpr(EMPTY_LANGUAGE)
+# state -> {successor: label} for the states not yet eliminated
+Edges = dict[int, dict[int, sexpr]]
+# (out edges, in edges, candidates) -> the next state to eliminate
+Order = Callable[[Edges, Edges, set[int]], int]
+
+def by_index(out: Edges, inn: Edges, candidates: set[int]) -> int:
+  '''
+  the highest-numbered state first (the textbook order)
+  '''
+  return max(candidates)
+
+def by_min_degree(out: Edges, inn: Edges, candidates: set[int]) -> int:
+  '''
+  the state whose elimination adds the fewest edges (in x out, loops excluded)
+  '''
+  def degree(n: int) -> tuple[int, int]:
+    ins = len(inn[n]) - (n in inn[n])
+    outs = len(out[n]) - (n in out[n])
+    return ins * outs, -n
+  return min(candidates, key=degree)
+
+def by_weight(out: Edges, inn: Edges, candidates: set[int]) -> int:
+  '''
+  the state whose elimination adds the least to the expression size
+  (the weight heuristic of Delgado and Morais)
+  '''
+  def weight(n: int) -> tuple[int, int]:
+    ins = [e for i, e in inn[n].items() if i != n]
+    outs = [e for j, e in out[n].items() if j != n]
+    loop = out[n][n].size if n in out[n] else 0
+    w = sum(e.size for e in ins) * (len(outs) - 1) \
+      + sum(e.size for e in outs) * (len(ins) - 1) \
+      + loop * (len(ins) * len(outs) - 1)
+    return w, -n
+  return min(candidates, key=weight)
+
+ORDERS: dict[str, Order] = {
+  'index': by_index,
+  'min_degree': by_min_degree,
+  'weight': by_weight,
+}
+
+def brzozowski(
+    m: int,
+    alphabet: str,
+    final: set[int],
+    trans: dict[tuple[int, str], set[int]],
+    order: str | Order = 'index') -> sexpr:
+  '''
+  a regular expression for the language of state 0, by state elimination
+
+  solves X_i = sum_j A[i][j] X_j + B[i], eliminating one state at a time
+  (X_n = A[n][n]* (sum_j A[n][j] X_j + B[n])) and state 0 last.
+  only the edges that exist are stored
+
+  Args:
+      m (int): number of states
+      alphabet (str): input alphabet
+      final (set[int]): accepting states
+      trans (dict[tuple[int, str], set[int]]): transitions
+      order (str | Order): elimination order: 'index', 'min_degree', 'weight'
+        or a function choosing the next state
+
+  Returns:
+      sexpr: an expression (not simplified) for the accepted language
+  '''
+  choose = ORDERS[order] if isinstance(order, str) else order
+  B: dict[int, sexpr] = {i: empty_string() for i in final if i < m}
+  symbols: dict[tuple[int, int], list[str]] = {}
+  for a in alphabet:
+    for i in range(m):
+      for j in sorted(trans.get((i, a), ())):
+        symbols.setdefault((i, j), []).append(a)
+  out: Edges = {i: {} for i in range(m)}
+  inn: Edges = {i: {} for i in range(m)}
+  for (i, j), labels in symbols.items():
+    out[i][j] = inn[j][i] = combine(labels)
+
+  candidates = set(range(1, m))
+  for _ in range(m):
+    n = choose(out, inn, candidates) if candidates else 0
+    candidates.discard(n)
+    edges = out.pop(n)
+    preds = inn.pop(n)
+    loop = edges.pop(n, None)
+    preds.pop(n, None)
+    if loop is not None:
+      for j in edges:
+        edges[j] = concat(star(loop), edges[j])
+      if n in B:
+        B[n] = concat(star(loop), B[n])
+    for j in edges:
+      del inn[j][n]
+    for i in preds:
+      a = out[i].pop(n)
+      if n in B:
+        B[i] = union(B[i], concat(a, B[n])) if i in B else concat(a, B[n])
+      for j, e in edges.items():
+        label = union(out[i][j], concat(a, e)) if j in out[i] else concat(a, e)
+        out[i][j] = inn[j][i] = label
+    if n == 0:
+      break
+  return B.get(0, empty_language())
+
+def _rewrite(expr: sexpr) -> tuple[str, sexpr] | None:
+  '''
+  one rewrite at the root of expr, whose children are already simplified
+
+  Returns:
+      tuple[str, sexpr] | None: the rule and its result, or None if no rule applies
+  '''
+  e, f = expr.left, expr.right
   match expr.name:
     case 'union':
-      assert isinstance(expr.left, sexpr)
-      assert isinstance(expr.right, sexpr)
+      assert isinstance(e, sexpr)
+      assert isinstance(f, sexpr)
 
       # (e|e) => e
-      if expr.left == expr.right:
-        return simplify(expr.left)
+      if e == f:
+        return '(e|e)', e
 
       # (∅|e) => e
-      if expr.left.name == EMPTY_LANGUAGE:
-        return simplify(expr.right)
+      if e.name == EMPTY_LANGUAGE:
+        return '(∅|e)', f
 
       # (e|∅) => e
-      if expr.right.name == EMPTY_LANGUAGE:
-        return simplify(expr.left)
+      if f.name == EMPTY_LANGUAGE:
+        return '(e|∅)', e
 
       # (ε|e) => e?
-      if expr.left.name == EMPTY_STRING:
-        return simplify(optional(expr.right))
+      if e.name == EMPTY_STRING:
+        return '(ε|e)', optional(f)
 
       # (e|ε) => e?
-      if expr.right.name == EMPTY_STRING:
-        return simplify(optional(expr.left))
+      if f.name == EMPTY_STRING:
+        return '(e|ε)', optional(e)
 
       # (e|fe) => f?e
       # (e|ef) => ef?
-      if expr.right.name == 'concat':
-        if expr.left == expr.right.right:
-          assert isinstance(expr.right.left, sexpr)
-          return simplify(concat(optional(expr.right.left), expr.left))
-        if expr.left == expr.right.left:
-          assert isinstance(expr.right.right, sexpr)
-          return simplify(concat(expr.left, optional(expr.right.right)))
+      if f.name == CONCAT:
+        assert isinstance(f.left, sexpr)
+        assert isinstance(f.right, sexpr)
+        if e == f.right:
+          return '(e|fe)', concat(optional(f.left), e)
+        if e == f.left:
+          return '(e|ef)', concat(e, optional(f.right))
 
       # (fe|e) => f?e
       # (ef|e) => ef?
-      if expr.left.name == 'concat':
-        if expr.right == expr.left.right:
-          assert isinstance(expr.left.left, sexpr)
-          return simplify(concat(optional(expr.left.left), expr.right))
-        if expr.right == expr.left.left:
-          assert isinstance(expr.left.right, sexpr)
-          return simplify(concat(expr.right, optional(expr.left.right)))
+      if e.name == CONCAT:
+        assert isinstance(e.left, sexpr)
+        assert isinstance(e.right, sexpr)
+        if f == e.right:
+          return '(fe|e)', concat(optional(e.left), f)
+        if f == e.left:
+          return '(ef|e)', concat(f, optional(e.right))
 
       # TODO
       # (e+|e*) => e*
@@ -154,112 +231,164 @@ def simplify(expr: sexpr | None) -> sexpr:
       # (e*|e?) => e*
 
       # ((e|f)|g) => (e|(f|g))
-      if expr.left.name == 'union':
-        e, f, g = expr.left.left, expr.left.right, expr.right
-        assert isinstance(e, sexpr)
-        assert isinstance(f, sexpr)
-        assert isinstance(g, sexpr)
-        return simplify(union(e, union(f, g)))
-
-      return union(simplify(expr.left), simplify(expr.right))
+      if e.name == UNION:
+        assert isinstance(e.left, sexpr)
+        assert isinstance(e.right, sexpr)
+        return '((e|f)|g)', union(e.left, union(e.right, f))
 
     case 'concat':
-      assert isinstance(expr.left, sexpr)
-      assert isinstance(expr.right, sexpr)
+      assert isinstance(e, sexpr)
+      assert isinstance(f, sexpr)
 
       # ∅e => ∅
-      if expr.left.name == EMPTY_LANGUAGE:
-        return empty_language()
-
       # e∅ => ∅
-      if expr.right.name == EMPTY_LANGUAGE:
-        return empty_language()
+      if e.name == EMPTY_LANGUAGE or f.name == EMPTY_LANGUAGE:
+        return '∅e', empty_language()
 
       # εe => e
-      if expr.left.name == EMPTY_STRING:
-        return simplify(expr.right)
+      if e.name == EMPTY_STRING:
+        return 'εe', f
 
       # eε => e
-      if expr.right.name == EMPTY_STRING:
-        return simplify(expr.left)
+      if f.name == EMPTY_STRING:
+        return 'eε', e
 
       # ee* = e*e => e+
-      if expr.right.name == 'star' and expr.right.left == expr.left:
-        return some(simplify(expr.left))
-      if expr.left.name == 'star' and expr.left.left == expr.right:
-        return some(simplify(expr.right))
+      if f.name == STAR and f.left == e:
+        return 'ee*', some(e)
+      if e.name == STAR and e.left == f:
+        return 'e*e', some(f)
+
+      # e(e*g) = e*(eg) => e+g, as ee* within a right-nested concatenation
+      if f.name == CONCAT:
+        assert isinstance(f.left, sexpr)
+        assert isinstance(f.right, sexpr)
+        if f.left.name == STAR and f.left.left == e:
+          return 'e(e*g)', concat(some(e), f.right)
+        if e.name == STAR and f.left == e.left:
+          return 'e*(eg)', concat(some(f.left), f.right)
 
       # e*e* => e*
-      if expr.left.name == 'star' and expr.left == expr.right:
-        return simplify(expr.left)
+      if e.name == STAR and e == f:
+        return 'e*e*', e
 
       # e+e+ => ee+
-      if expr.left.name == 'some' and expr.left == expr.right:
-        assert isinstance(expr.left.left, sexpr)
-        return simplify(concat(expr.left.left, expr.right))
+      if e.name == SOME and e == f:
+        assert isinstance(e.left, sexpr)
+        return 'e+e+', concat(e.left, f)
 
       # (ef)g => e(fg)
-      if expr.left.name == 'concat':
-        e, f, g = expr.left.left, expr.left.right, expr.right
-        assert isinstance(e, sexpr)
-        assert isinstance(f, sexpr)
-        assert isinstance(g, sexpr)
-        return simplify(concat(e, concat(f, g)))
-
-      return concat(simplify(expr.left), simplify(expr.right))
+      if e.name == CONCAT:
+        assert isinstance(e.left, sexpr)
+        assert isinstance(e.right, sexpr)
+        return '(ef)g', concat(e.left, concat(e.right, f))
 
     case 'star':
-      assert isinstance(expr.left, sexpr)
+      assert isinstance(e, sexpr)
       # ∅* => ε
       # ε* => ε
-      if expr.left.name == EMPTY_STRING or expr.left.name == EMPTY_LANGUAGE:
-        return empty_string()
-
-      return star(simplify(expr.left))
+      if e.name == EMPTY_STRING or e.name == EMPTY_LANGUAGE:
+        return 'ε*', empty_string()
 
     case 'option':
-      assert isinstance(expr.left, sexpr)
+      assert isinstance(e, sexpr)
       # ∅? => ε
       # ε? => ε
-      if expr.left.name == EMPTY_STRING or expr.left.name == EMPTY_LANGUAGE:
-        return empty_string()
+      if e.name == EMPTY_STRING or e.name == EMPTY_LANGUAGE:
+        return 'ε?', empty_string()
 
-      return optional(simplify(expr.left))
+      # (e+)? => e*
+      if e.name == SOME:
+        assert isinstance(e.left, sexpr)
+        return '(e+)?', star(e.left)
 
     case 'some':
-      assert isinstance(expr.left, sexpr)
+      assert isinstance(e, sexpr)
       # ∅+ => ∅
-      if expr.left.name == EMPTY_LANGUAGE:
-        return empty_language()
+      if e.name == EMPTY_LANGUAGE:
+        return '∅+', empty_language()
 
       # ε+ => ε
-      if expr.left.name == EMPTY_STRING:
-        return empty_string()
+      if e.name == EMPTY_STRING:
+        return 'ε+', empty_string()
 
       # (e+)+ => e+
-      if expr.left.name == 'some':
-        return simplify(expr.left)
-
       # (e*)+ => e*
-      if expr.left.name == 'star':
-        return simplify(expr.left)
+      if e.name == SOME or e.name == STAR:
+        return '(e+)+', e
 
       # (e?)+ => e*
-      if expr.left.name == 'option':
-        assert isinstance(expr.left.left, sexpr)
-        return simplify(star(expr.left.left))
+      if e.name == OPTIONAL:
+        assert isinstance(e.left, sexpr)
+        return '(e?)+', star(e.left)
 
-      return some(simplify(expr.left))
+  return None
 
-    case _:
-      return expr
+def _rebuild(expr: sexpr, left: sexpr | None, right: sexpr | None) -> sexpr:
+  if left is expr.left and right is expr.right:
+    return expr
+  return sexpr.__new__(type(expr), expr.name, left, right)
+
+def simplify(expr: sexpr | None, rewrites: Counter[str] | None = None) -> sexpr:
+  '''
+  rewrite expr bottom-up until no rule applies anywhere
+
+  each node is simplified once: results are memoized by node (nodes are
+  interned, so shared subexpressions are shared work), and the rules are
+  applied at a node until they reach a fixpoint there, after its children.
+  an explicit stack replaces recursion, so deep expressions are fine
 
-def opt(e: sexpr) -> sexpr:
-  e2 = simplify(e)
-  if e == e2:
-    return e2
-  # print(f"[DEBUG] e2={e2}")
-  return opt(e2)
+  Args:
+      expr (sexpr | None): expression to simplify
+      rewrites (Counter[str] | None): counts each rule applied, for profiling
+
+  Returns:
+      sexpr: the simplified expression
+  '''
+  if expr is None:
+    return empty_language()
+  # node -> its simplified form; simplified forms map to themselves
+  done: dict[sexpr, sexpr] = {}
+  # node -> what a rule rewrote it to, until that is simplified
+  waiting: dict[sexpr, sexpr] = {}
+  stack: list[sexpr] = [expr]
+  while stack:
+    node = stack[-1]
+    if node in done:
+      stack.pop()
+      continue
+    if node in waiting:
+      if waiting[node] in done:
+        done[node] = done[waiting.pop(node)]
+        stack.pop()
+      else:
+        stack.append(waiting[node])
+      continue
+    children = [c for c in (node.left, node.right) if c is not None and c not in done]
+    if children:
+      stack.extend(children)
+      continue
+    built = _rebuild(
+      node,
+      done[node.left] if node.left is not None else None,
+      done[node.right] if node.right is not None else None)
+    rewritten = _rewrite(built)
+    if rewritten is None:
+      done[built] = built
+      done[node] = built
+      stack.pop()
+      continue
+    rule, result = rewritten
+    if rewrites is not None:
+      rewrites[rule] += 1
+    waiting[node] = result
+  return done[expr]
+
+def opt(e: sexpr, rewrites: Counter[str] | None = None) -> sexpr:
+  '''
+  simplify e (simplify already rewrites to a fixpoint)
+  '''
+  return simplify(e, rewrites)
 
 def pretty(expr: sexpr | None) -> str:
   if expr is None:
@@ -290,6 +419,155 @@ def pretty(expr: sexpr | None) -> str:
     case _:
       return expr.name
 
+OPERATORS = '()|*?+'
+
+def parse(text: str) -> sexpr:
+  '''
+  the expression written by pretty()
+
+  every other character is a literal; a|b|c groups as a|(b|c),
+  and abc as a(bc), as simplify leaves them
+
+  Args:
+      text (str): e.g. '(ba|(a|bb)(ab)*(b|aa))*'
+
+  Returns:
+      sexpr: the expression
+  '''
+  # one frame per open parenthesis: the alternatives so far and the current sequence
+  frames: list[tuple[list[sexpr], list[sexpr]]] = [([], [])]
+
+  def sequence(items: list[sexpr]) -> sexpr:
+    if not items:
+      return empty_string()
+    expr = items[-1]
+    for item in reversed(items[:-1]):
+      expr = concat(item, expr)
+    return expr
+
+  def alternatives(options: list[sexpr], items: list[sexpr]) -> sexpr:
+    expr = sequence(items)
+    for option in reversed(options):
+      expr = union(option, expr)
+    return expr
+
+  for i, c in enumerate(text):
+    options, items = frames[-1]
+    if c == '(':
+      frames.append(([], []))
+    elif c == ')':
+      if len(frames) == 1:
+        raise ValueError(f'unbalanced ) at {i} in {text}')
+      frames.pop()
+      frames[-1][1].append(alternatives(options, items))
+    elif c == '|':
+      options.append(sequence(items))
+      items.clear()
+    elif c in '*?+':
+      if not items:
+        raise ValueError(f'nothing to repeat at {i} in {text}')
+      items[-1] = {'*': star, '?': optional, '+': some}[c](items[-1])
+    elif c == EMPTY_STRING:
+      items.append(empty_string())
+    elif c == EMPTY_LANGUAGE:
+      items.append(empty_language())
+    elif not c.isspace():
+      items.append(literal(c))
+  if len(frames) != 1:
+    raise ValueError(f'unbalanced ( in {text}')
+  return alternatives(*frames[0])
+
+def nullable(expr: sexpr) -> bool:
+  '''
+  whether expr matches the empty string
+  '''
+  match expr.name:
+    case 'union':
+      assert expr.left is not None and expr.right is not None
+      return nullable(expr.left) or nullable(expr.right)
+    case 'concat':
+      assert expr.left is not None and expr.right is not None
+      return nullable(expr.left) and nullable(expr.right)
+    case 'some':
+      assert expr.left is not None
+      return nullable(expr.left)
+    case 'star' | 'option':
+      return True
+    case _:
+      return expr.name == EMPTY_STRING
+
+def _union(e: sexpr, f: sexpr) -> sexpr:
+  # union up to associativity, commutativity and idempotence, without ∅:
+  # a right-nested union of distinct terms in a fixed order
+  terms: dict[sexpr, None] = {}
+  for g in (e, f):
+    while g.name == UNION:
+      assert g.left is not None and g.right is not None
+      terms[g.left] = None
+      g = g.right
+    if g.name != EMPTY_LANGUAGE:
+      terms[g] = None
+  if not terms:
+    return empty_language()
+  ordered = sorted(terms, key=str)
+  expr = ordered[-1]
+  for g in reversed(ordered[:-1]):
+    expr = union(g, expr)
+  return expr
+
+def _concat(e: sexpr, f: sexpr) -> sexpr:
+  if e.name == EMPTY_LANGUAGE or f.name == EMPTY_LANGUAGE:
+    return empty_language()
+  if e.name == EMPTY_STRING:
+    return f
+  if f.name == EMPTY_STRING:
+    return e
+  if e.name == CONCAT:
+    assert e.left is not None and e.right is not None
+    return _concat(e.left, _concat(e.right, f))
+  return concat(e, f)
+
+def derivative(expr: sexpr, a: str, memo: dict[tuple[sexpr, str], sexpr] | None = None) -> sexpr:
+  '''
+  the Brzozowski derivative of expr by the symbol a: the strings w with aw in expr
+
+  derivatives are kept similar-reduced (unions up to ACI, concatenation
+  with ε and ∅ simplified), so an expression has finitely many of them
+
+  Args:
+      expr (sexpr): the expression
+      a (str): a symbol
+      memo (dict[tuple[sexpr, str], sexpr] | None): derivatives already computed
+
+  Returns:
+      sexpr: the derivative
+  '''
+  if memo is None:
+    memo = {}
+  key = (expr, a)
+  if key in memo:
+    return memo[key]
+  e, f = expr.left, expr.right
+  match expr.name:
+    case 'union':
+      assert e is not None and f is not None
+      result = _union(derivative(e, a, memo), derivative(f, a, memo))
+    case 'concat':
+      assert e is not None and f is not None
+      result = _concat(derivative(e, a, memo), f)
+      if nullable(e):
+        result = _union(result, derivative(f, a, memo))
+    case 'star' | 'some':
+      assert e is not None
+      result = _concat(derivative(e, a, memo), star(e))
+    case 'option':
+      assert e is not None
+      result = derivative(e, a, memo)
+    case _:
+      result = empty_string() if expr.name == a else empty_language()
+  memo[key] = result
+  return result
+
 def test_pretty() -> None:
   # (concat b a) => ba
   pre = concat(literal('b'), literal('a'))
@@ -431,7 +709,8 @@ def test_brzozowski() -> None:
       (4,'1'): {4},
     }
   )
-  assert pretty(opt(ans)) == '(0|10)*(1(1(0|10)*)?)?', f"got {pretty(opt(ans))}"
+  # (0|10) is factored by (e|fe) => f?e, as (1|0+1) is in test_simplify
+  assert pretty(opt(ans)) == '(1?0)*(1(1(1?0)*)?)?', f"got {pretty(opt(ans))}"
 
   ans = brzozowski(
     5,
@@ -450,7 +729,8 @@ def test_brzozowski() -> None:
       (4,'1'): {4},
     }
   )
-  assert pretty(opt(ans)) == '(0|10)*(1(1(00*1)*)?)?', f"got {pretty(opt(ans))}"
+  # 0(0*1) => 0+1, as in test_simplify
+  assert pretty(opt(ans)) == '(1?0)*(1(1(0+1)*)?)?', f"got {pretty(opt(ans))}"
 
 def test() -> None:
   test_simplify()
@@ -0,0 +1,107 @@
+'''
+CachingTeacher
+'''
+
+import sqlite3
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+from teacher import Teacher
+from acceptor import Acceptor
+
+class CachingTeacher(Teacher):
+  '''
+  A teacher that remembers the answers of another teacher
+
+  answers are kept in a bounded in-memory LRU layer backed by a sqlite store,
+  keyed by the identity of the oracle, so later runs against the same oracle
+  (a human, most of all) never ask the same string twice
+  '''
+  def __init__(self, teacher: Teacher, oracle: str, store: Path | str = ':memory:', capacity: int = 1 << 16):
+    '''
+    Args:
+        teacher (Teacher): the teacher to ask on a miss
+        oracle (str): identity of the language behind the teacher;
+          answers are only shared between teachers with the same identity
+        store (Path | str): sqlite database file (default: not persisted)
+        capacity (int): maximum number of answers held in memory
+    '''
+    self.teacher = teacher
+    self.oracle = oracle
+    self.capacity = capacity
+    self.hits = 0
+    self.disk_hits = 0
+    self.misses = 0
+    self._memory: OrderedDict[str, bool] = OrderedDict()
+    self._query_history: list[str] = []
+    self._db = sqlite3.connect(str(store))
+    self._db.execute(
+      'CREATE TABLE IF NOT EXISTS answers ('
+      'oracle TEXT NOT NULL, string TEXT NOT NULL, answer INTEGER NOT NULL, '
+      'PRIMARY KEY (oracle, string))')
+    self._db.commit()
+
+  def _remember(self, string: str, answer: bool) -> None:
+    self._memory[string] = answer
+    self._memory.move_to_end(string)
+    if len(self._memory) > self.capacity:
+      self._memory.popitem(last=False)
+
+  def _recall(self, string: str) -> Optional[bool]:
+    '''
+    the cached answer for string, or None on a miss
+    '''
+    if string in self._memory:
+      self.hits += 1
+      self._memory.move_to_end(string)
+      return self._memory[string]
+    row = self._db.execute(
+      'SELECT answer FROM answers WHERE oracle = ? AND string = ?',
+      (self.oracle, string)).fetchone()
+    if row is None:
+      return None
+    self.disk_hits += 1
+    answer = bool(row[0])
+    self._remember(string, answer)
+    return answer
+
+  def _store(self, strings: list[str], answers: list[bool]) -> None:
+    self._db.executemany(
+      'INSERT OR REPLACE INTO answers (oracle, string, answer) VALUES (?, ?, ?)',
+      [(self.oracle, string, int(answer)) for string, answer in zip(strings, answers)])
+    self._db.commit()
+    for string, answer in zip(strings, answers):
+      self._remember(string, answer)
+
+  def membership_query(self, string: str) -> bool:
+    return self.membership_queries([string])[0]
+
+  def membership_queries(self, strings: list[str]) -> list[bool]:
+    self._query_history.extend(strings)
+    answers: list[Optional[bool]] = [self._recall(string) for string in strings]
+    missing = list(dict.fromkeys(s for s, answer in zip(strings, answers) if answer is None))
+    if missing:
+      self.misses += len(missing)
+      fresh = self.teacher.membership_queries(missing)
+      self._store(missing, fresh)
+      found = dict(zip(missing, fresh))
+      answers = [found[s] if answer is None else answer for s, answer in zip(strings, answers)]
+    return [bool(answer) for answer in answers]
+
+  def respond_to_conjecture(self, conjecture: Acceptor) -> Optional[str]:
+    return self.teacher.respond_to_conjecture(conjecture)
+
+  def query_history(self) -> list[str]:
+    return self._query_history
+
+  def close(self) -> None:
+    '''
+    close the store
+    '''
+    self._db.close()
+
+  def __enter__(self) -> 'CachingTeacher':
+    return self
+
+  def __exit__(self, *_) -> None:
+    self.close()
@@ -0,0 +1,179 @@
+'''
+CompiledAcceptor
+'''
+
+from collections.abc import Iterable
+from itertools import islice
+from typing import Optional
+import numpy as np
+import numpy.typing as npt
+from my_types import Alphabet, State
+from acceptor import Acceptor
+
+class CompiledAcceptor(Acceptor):
+  '''
+  a DFA with states 0..n-1 and a dense int32 transition table
+
+  column i of the table is the i-th symbol of the alphabet; two more columns
+  leave the state unchanged (for λ) and go to the sink n (for foreign symbols).
+  the sink replaces missing transitions and never accepts
+  '''
+  def __init__(self, alphabet: Alphabet, transitions: npt.NDArray[np.int32], accepting: npt.NDArray[np.bool_], q0: State = 0):
+    '''
+    Args:
+        alphabet (Alphabet): input alphabet, one column per symbol
+        transitions (npt.NDArray[np.int32]): n x |alphabet| next states, n for the sink
+        accepting (npt.NDArray[np.bool_]): whether each of the n states accepts
+        q0 (State): initial state
+    '''
+    # pylint: disable=super-init-not-called
+    n, k = transitions.shape
+    if k != len(alphabet) or len(accepting) != n:
+      raise ValueError('the table does not match the alphabet and the accepting states')
+    table = np.empty((n + 1, k + 2), dtype=np.int32)
+    table[:n, :k] = transitions
+    table[n, :k] = n
+    table[:, k] = np.arange(n + 1)
+    table[:, k + 1] = n
+    self._attach(alphabet, table, np.append(np.asarray(accepting, dtype=bool), False), q0)
+
+  def _attach(self, alphabet: Alphabet, table: npt.NDArray[np.int32], accepting: npt.NDArray[np.bool_], q0: State) -> None:
+    self.alphabet = alphabet
+    self.symbol_index: dict[str, int] = {a: i for i, a in enumerate(alphabet)}
+    self.symbol_index['λ'] = len(alphabet)
+    self.sink = len(table) - 1
+    self.table = table
+    self.accepting = accepting
+    self.initial = q0
+    self._width = len(alphabet) + 2
+    self._flat: Optional[list[int]] = None
+    self._d: Optional[dict[tuple[State, str], State]] = None
+
+  @classmethod
+  def from_table(
+      cls,
+      alphabet: Alphabet,
+      table: npt.NDArray[np.int32],
+      accepting: npt.NDArray[np.bool_],
+      q0: State = 0) -> 'CompiledAcceptor':
+    '''
+    wrap a complete table without copying it, e.g. a view of a mapped file
+
+    Args:
+        alphabet (Alphabet): input alphabet
+        table (npt.NDArray[np.int32]): (n+1) x (|alphabet|+2) next states,
+          with the sink n as the last row and the λ and foreign-symbol columns last
+        accepting (npt.NDArray[np.bool_]): whether each of the n+1 states accepts
+        q0 (State): initial state
+
+    Returns:
+        CompiledAcceptor: the acceptor of the table
+    '''
+    if table.ndim != 2 or table.shape[1] != len(alphabet) + 2 or len(accepting) != len(table):
+      raise ValueError('the table does not match the alphabet and the accepting states')
+    acceptor = cls.__new__(cls)
+    acceptor._attach(alphabet, table, accepting, q0)
+    return acceptor
+
+  @classmethod
+  def compile(cls, acceptor: Acceptor, alphabet: Optional[Alphabet] = None) -> 'CompiledAcceptor':
+    '''
+    renumber the states of an acceptor densely (q0 becomes 0) and tabulate its transitions
+
+    Args:
+        acceptor (Acceptor): the acceptor to compile
+        alphabet (Optional[Alphabet]): input alphabet (default: the acceptor's)
+
+    Returns:
+        CompiledAcceptor: an equivalent acceptor
+    '''
+    if alphabet is None:
+      alphabet = acceptor.get_alphabet()
+    states = [acceptor.q0, *sorted(acceptor.Q - {acceptor.q0})]
+    number = {q: i for i, q in enumerate(states)}
+    n = len(states)
+    transitions = np.full((n, len(alphabet)), n, dtype=np.int32)
+    for (q, a), p in acceptor.d.items():
+      if a in alphabet and q in number:
+        transitions[number[q], alphabet.index(a)] = number[p]
+    accepting = np.array([q in acceptor.F for q in states], dtype=bool)
+    return cls(alphabet, transitions, accepting)
+
+  @property
+  def Q(self) -> set[State]:  # type: ignore[override]
+    return set(range(self.sink))
+
+  @property
+  def q0(self) -> State:  # type: ignore[override]
+    return self.initial
+
+  @property
+  def F(self) -> set[State]:  # type: ignore[override]
+    return {int(q) for q in np.flatnonzero(self.accepting[:self.sink])}
+
+  @property
+  def d(self) -> dict[tuple[State, str], State]:  # type: ignore[override]
+    '''
+    the transitions as a dict, without those into the sink
+    '''
+    if self._d is None:
+      self._d = {
+        (q, a): int(self.table[q, i])
+        for q in range(self.sink)
+        for i, a in enumerate(self.alphabet)
+        if self.table[q, i] != self.sink}
+    return self._d
+
+  def get_alphabet(self) -> str:
+    return ''.join(sorted(self.alphabet))
+
+  def accepts(self, string: str) -> bool:
+    if self._flat is None:
+      # a flat copy for the per-symbol loop, where lists beat NumPy scalars
+      self._flat = self.table.ravel().tolist()
+    flat, width, index, foreign = self._flat, self._width, self.symbol_index, self._width - 1
+    q = self.initial
+    for a in string:
+      q = flat[q * width + index.get(a, foreign)]
+    return bool(self.accepting[q])
+
+  def accepts_many(self, strings: Iterable[str], chunk: int = 1 << 14) -> npt.NDArray[np.bool_]:
+    '''
+    run the acceptor on many strings
+
+    strings are read a chunk at a time and run in lockstep: at step t, every
+    string longer than t takes its t-th transition in one vectorized lookup
+
+    Args:
+        strings (Iterable[str]): strings to test
+        chunk (int): strings per lockstep run
+
+    Returns:
+        npt.NDArray[np.bool_]: True where the string is accepted
+    '''
+    # code point -> column, for every code point up to the largest symbol
+    top = max(map(ord, self.symbol_index)) + 1
+    columns = np.full(top + 1, self._width - 1, dtype=np.int32)
+    for a, i in self.symbol_index.items():
+      columns[ord(a)] = i
+    results: list[npt.NDArray[np.bool_]] = []
+    iterator = iter(strings)
+    while batch := list(islice(iterator, chunk)):
+      # one buffer of code points per chunk; lone surrogates (e.g. from surrogateescape) are foreign symbols
+      codes = np.frombuffer(''.join(batch).encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+      codes = columns[np.minimum(codes, top)]
+      lengths = np.fromiter(map(len, batch), dtype=np.int64, count=len(batch))
+      starts = np.cumsum(lengths) - lengths
+      # longest first, so the strings still running are always a prefix
+      order = np.argsort(-lengths, kind='stable')
+      lengths, starts = lengths[order], starts[order]
+      states = np.full(len(batch), self.initial, dtype=np.int32)
+      running = len(batch)
+      for t in range(int(lengths[0]) if len(batch) else 0):
+        while running and lengths[running - 1] <= t:
+          running -= 1
+        states[:running] = self.table[states[:running], codes[starts[:running] + t]]
+      accepted = np.empty(len(batch), dtype=bool)
+      accepted[order] = self.accepting[states]
+      results.append(accepted)
+    return np.concatenate(results) if results else np.zeros(0, dtype=bool)
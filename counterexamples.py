@@ -0,0 +1,100 @@
+'''
+counterexample processing strategies for L*
+
+each strategy refines the observation table with a counterexample to the
+current conjecture; the caller extends the table afterwards
+'''
+
+from collections.abc import Callable
+from teacher import Teacher
+from obervation_table import ObservationTable
+from helpers import compact, prefixes
+
+CounterexampleHandler = Callable[[ObservationTable, str, Teacher], None]
+
+def _symbols(t: str) -> str:
+  '''
+  t without λs ('' for the empty string)
+  '''
+  return t.replace('λ', '')
+
+def add_prefixes(table: ObservationTable, t: str, _teacher: Teacher) -> None:
+  '''
+  Angluin: add the (non-empty) prefixes of t to S
+  '''
+  for p in prefixes(t):
+    table.add_to_S(p)
+
+def add_suffixes(table: ObservationTable, t: str, _teacher: Teacher) -> None:
+  '''
+  Maler-Pnueli: add every suffix of t to E
+  '''
+  w = _symbols(t)
+  for i in range(len(w)):
+    table.add_to_E(w[i:])
+
+def shahbaz(table: ObservationTable, t: str, _teacher: Teacher) -> None:
+  '''
+  Shahbaz: remove the longest prefix of t that is in (S U S*A)
+  and add every suffix of what remains to E
+  '''
+  w = _symbols(t)
+  i = len(w)
+  while i > 0 and compact(w[:i - 1]) not in table.S:
+    i -= 1
+  for j in range(i, len(w)):
+    table.add_to_E(w[j:])
+
+def _alpha(table: ObservationTable, w: str, i: int, teacher: Teacher) -> bool:
+  '''
+  T(access(w[:i]) * w[i:])
+  '''
+  u = table.access_string(w[:i])
+  return table.query(compact(f'{u}{w[i:]}'), teacher)
+
+def _add_suffix(table: ObservationTable, t: str, v: str, teacher: Teacher) -> None:
+  '''
+  add the distinguishing suffix v of t to E, or fall back to add_prefixes
+  if it is already there (the table was not closed and consistent)
+  '''
+  if compact(v) in table.E:
+    add_prefixes(table, t, teacher)
+  else:
+    table.add_to_E(v)
+
+def rivest_schapire(table: ObservationTable, t: str, teacher: Teacher) -> None:
+  '''
+  Rivest-Schapire: binary search for a single distinguishing suffix of t
+  and add it to E, using O(log |t|) membership queries
+
+  falls back to add_prefixes if t is not a counterexample
+  '''
+  w = _symbols(t)
+  lo, hi = 0, len(w)
+  a_lo, a_hi = _alpha(table, w, lo, teacher), _alpha(table, w, hi, teacher)
+  if a_lo == a_hi:
+    add_prefixes(table, t, teacher)
+    return
+  # invariant: alpha(lo) != alpha(hi)
+  while hi - lo > 1:
+    mid = (lo + hi) // 2
+    if _alpha(table, w, mid, teacher) == a_lo:
+      lo = mid
+    else:
+      hi = mid
+  _add_suffix(table, t, w[hi:], teacher)
+
+def linear(table: ObservationTable, t: str, teacher: Teacher) -> None:
+  '''
+  like rivest_schapire, but scanning t from the left for the first suffix
+  that distinguishes; uses O(|t|) membership queries but favours long suffixes
+
+  falls back to add_prefixes if t is not a counterexample
+  '''
+  w = _symbols(t)
+  a_0 = _alpha(table, w, 0, teacher)
+  for i in range(1, len(w) + 1):
+    if _alpha(table, w, i, teacher) != a_0:
+      _add_suffix(table, t, w[i:], teacher)
+      return
+  add_prefixes(table, t, teacher)
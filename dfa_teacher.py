@@ -0,0 +1,120 @@
+'''
+DFATeacher
+'''
+
+from collections import deque
+from typing import Optional
+from teacher import Teacher
+from acceptor import Acceptor
+from my_types import Alphabet, State
+from helpers import compact
+
+def _step(m: Acceptor, q: Optional[State], a: str) -> Optional[State]:
+  # a missing transition goes to an implicit rejecting sink (None)
+  return None if q is None else m.d.get((q, a))
+
+def _accepting(m: Acceptor, q: Optional[State]) -> bool:
+  return q is not None and q in m.F
+
+def equivalent(m1: Acceptor, m2: Acceptor, alphabet: Alphabet) -> bool:
+  '''
+  Hopcroft-Karp: merge the initial states and propagate with union-find;
+  the acceptors are equivalent iff no merged class mixes accepting and rejecting states
+
+  Args:
+      m1 (Acceptor): an acceptor
+      m2 (Acceptor): another acceptor
+      alphabet (Alphabet): input alphabet of both
+
+  Returns:
+      bool: True iff m1 and m2 accept the same language
+  '''
+  # states of m1 and m2 are told apart by tagging them with 1 and 2
+  parent: dict[tuple[int, Optional[State]], tuple[int, Optional[State]]] = {}
+  def find(x: tuple[int, Optional[State]]) -> tuple[int, Optional[State]]:
+    root = x
+    while parent.get(root, root) != root:
+      root = parent[root]
+    while x != root:
+      parent[x], x = root, parent.get(x, x)
+    return root
+  todo = [(m1.q0, m2.q0)]
+  parent[(2, m2.q0)] = (1, m1.q0)
+  while todo:
+    p, q = todo.pop()
+    if _accepting(m1, p) != _accepting(m2, q):
+      return False
+    for a in alphabet:
+      x = find((1, _step(m1, p, a)))
+      y = find((2, _step(m2, q, a)))
+      if x != y:
+        parent[y] = x
+        todo.append((_step(m1, p, a), _step(m2, q, a)))
+  return True
+
+def shortest_difference(m1: Acceptor, m2: Acceptor, alphabet: Alphabet) -> Optional[str]:
+  '''
+  a shortest string accepted by exactly one of m1 and m2,
+  by breadth-first search over the reachable part of their product
+
+  Args:
+      m1 (Acceptor): an acceptor
+      m2 (Acceptor): another acceptor
+      alphabet (Alphabet): input alphabet of both
+
+  Returns:
+      Optional[str]: a shortest distinguishing string, or None if they are equivalent
+  '''
+  start = (m1.q0, m2.q0)
+  # product state -> (previous product state, symbol)
+  parent: dict[tuple[Optional[State], Optional[State]], Optional[tuple[tuple[Optional[State], Optional[State]], str]]] = {start: None}
+  queue = deque([start])
+  while queue:
+    pair = queue.popleft()
+    p, q = pair
+    if _accepting(m1, p) != _accepting(m2, q):
+      symbols: list[str] = []
+      back = parent[pair]
+      while back is not None:
+        pair, a = back
+        symbols.append(a)
+        back = parent[pair]
+      return compact(''.join(reversed(symbols)))
+    if p is None and q is None:
+      continue
+    for a in alphabet:
+      target = (_step(m1, p, a), _step(m2, q, a))
+      if target not in parent:
+        parent[target] = (pair, a)
+        queue.append(target)
+  return None
+
+class DFATeacher(Teacher):
+  '''
+  A teacher for the language of a reference acceptor
+
+  membership queries run the reference; conjectures are checked exactly,
+  and counterexamples are as short as possible
+  '''
+  def __init__(self, reference: Acceptor, alphabet: Optional[Alphabet] = None):
+    '''
+    Args:
+        reference (Acceptor): the target DFA (missing transitions reject)
+        alphabet (Optional[Alphabet]): input alphabet (default: the reference's)
+    '''
+    self.reference = reference
+    self.alphabet = alphabet if alphabet is not None else reference.get_alphabet()
+    self._query_history: list[str] = []
+
+  def membership_query(self, string: str) -> bool:
+    self._query_history.append(string)
+    return self.reference.accepts(string)
+
+  def respond_to_conjecture(self, conjecture: Acceptor) -> Optional[str]:
+    # union-find is near-linear; only search for a shortest string on a mismatch
+    if equivalent(self.reference, conjecture, self.alphabet):
+      return None
+    return shortest_difference(self.reference, conjecture, self.alphabet)
+
+  def query_history(self) -> list[str]:
+    return self._query_history
@@ -0,0 +1,167 @@
+'''
+DiscriminationTree
+'''
+
+from my_types import Alphabet, State, Word
+from teacher import Teacher
+from acceptor import Acceptor
+from word_trie import WordTrie
+
+EMPTY = -1
+
+class DiscriminationTree:
+  '''
+  the states of a conjecture, classified by a binary tree of suffixes
+
+  each inner node holds a discriminator v and sends u to the child
+  T(u*v); each leaf holds one state, named by its access string.
+  every membership query goes through T, so no string is asked twice
+  '''
+  def __init__(self, A: Alphabet):
+    self.A = A
+    self.T: WordTrie = WordTrie(A)
+    # state -> node of its access string in T
+    self.access: list[int] = []
+    # state -> target state for each a in A (EMPTY until sifted)
+    self.delta: list[list[State]] = []
+    # state -> its leaf in the tree
+    self.leaves: list[int] = []
+    # tree node -> discriminator (None for leaves)
+    self.discriminators: list[Word | None] = [()]
+    # tree node -> [child if T(u*v) is False, child if True] (inner nodes only)
+    self.children: list[list[int]] = [[EMPTY, EMPTY]]
+    # tree node -> state (leaves only)
+    self.states: list[State] = [EMPTY]
+    # transitions (state, a) that still have to be sifted
+    self._todo: list[tuple[State, int]] = []
+
+  def query(self, node: int, teacher: Teacher) -> bool:
+    '''
+    T(u) for the node of u in T, asking the teacher only if it is not yet known
+    '''
+    answer = self.T.values[node]
+    if answer is None:
+      answer = teacher.membership_query(self.T.string(node))
+      self.T.set(node, answer)
+    return answer
+
+  def _new_node(self, discriminator: Word | None, state: State) -> int:
+    self.discriminators.append(discriminator)
+    self.children.append([EMPTY, EMPTY])
+    self.states.append(state)
+    return len(self.states) - 1
+
+  def _new_state(self, u: int) -> State:
+    '''
+    add a state with access string u; its leaf is placed by the caller
+    '''
+    q = len(self.access)
+    self.access.append(u)
+    self.delta.append([EMPTY] * len(self.A))
+    self.leaves.append(EMPTY)
+    self._todo.extend((q, a) for a in range(len(self.A)))
+    return q
+
+  def sift(self, u: int, teacher: Teacher, start: int = 0) -> State:
+    '''
+    the state whose leaf u reaches from the tree node start
+
+    reaching an empty child of the root discovers a new state with access string u
+
+    Args:
+        u (int): node of u in T
+        teacher (Teacher): a minimally adequate teacher
+        start (int): tree node to sift from
+
+    Returns:
+        State: a state of the conjecture
+    '''
+    node = start
+    while True:
+      v = self.discriminators[node]
+      if v is None:
+        return self.states[node]
+      b = self.query(self.T.walk(u, v), teacher)
+      child = self.children[node][b]
+      if child == EMPTY:
+        q = self._new_state(u)
+        child = self._new_node(None, q)
+        self.children[node][b] = child
+        self.leaves[q] = child
+        return q
+      node = child
+
+  def close(self, teacher: Teacher) -> None:
+    '''
+    sift every transition that is not yet known
+    '''
+    while self._todo:
+      q, a = self._todo.pop()
+      self.delta[q][a] = self.sift(self.T.child(self.access[q], a), teacher)
+
+  def split(self, q: State, u: int, v: Word, teacher: Teacher) -> State:
+    '''
+    add the state with access string u, separated from q by the discriminator v,
+    and re-sift the transitions into q
+
+    Args:
+        q (State): state that u was confused with
+        u (int): node of the new access string in T
+        v (Word): suffix that separates u from the access string of q
+        teacher (Teacher): a minimally adequate teacher
+
+    Returns:
+        State: the new state
+    '''
+    inner = self.leaves[q]
+    b = self.query(self.T.walk(self.access[q], v), teacher)
+    if self.query(self.T.walk(u, v), teacher) == b:
+      raise ValueError(f'{self.T.decode(v)} does not separate {self.T.string(u)} from {self.T.string(self.access[q])}')
+    self.discriminators[inner] = v
+    self.states[inner] = EMPTY
+    old_leaf = self._new_node(None, q)
+    self.leaves[q] = old_leaf
+    self.children[inner][b] = old_leaf
+    new = self._new_state(u)
+    new_leaf = self._new_node(None, new)
+    self.leaves[new] = new_leaf
+    self.children[inner][not b] = new_leaf
+    for p, targets in enumerate(self.delta):
+      for a, target in enumerate(targets):
+        if target == q:
+          self.delta[p][a] = self.sift(self.T.child(self.access[p], a), teacher, inner)
+    return new
+
+  def run(self, word: Word) -> list[State]:
+    '''
+    the states of the conjecture on each prefix of word (λ first)
+    '''
+    q = 0
+    path = [q]
+    for a in word:
+      q = self.delta[q][a]
+      path.append(q)
+    return path
+
+  def to_acceptor(self, teacher: Teacher, compiled: bool = False) -> Acceptor:
+    '''
+    the conjecture: one state per leaf, transitions as sifted
+
+    Args:
+        teacher (Teacher): a minimally adequate teacher
+        compiled (bool): emit a CompiledAcceptor with states 0..n-1
+
+    Returns:
+        Acceptor: a DFA
+    '''
+    Q: set[State] = set(range(len(self.access)))
+    F: set[State] = {q for q in Q if self.query(self.access[q], teacher)}
+    d: dict[tuple[State, str], State] = {}
+    for q, targets in enumerate(self.delta):
+      for a, target in enumerate(targets):
+        d[(q, self.A[a])] = target
+    if compiled:
+      # NumPy is only needed by the compiled form
+      from compiled_acceptor import CompiledAcceptor  # pylint: disable=import-outside-toplevel
+      return CompiledAcceptor.compile(Acceptor(Q, 0, F, d), self.A)
+    return Acceptor(Q, 0, F, d)
@@ -0,0 +1,218 @@
+'''
+equivalence oracles for teachers that only have a membership function
+
+each oracle builds a test suite from the conjecture and looks for a test
+word on which the conjecture and the membership function disagree
+'''
+
+import random
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterator
+from itertools import product
+from typing import Optional
+from acceptor import Acceptor
+from my_types import Alphabet, State
+from helpers import compact
+
+Membership = Callable[[list[str]], list[bool]]
+
+def run(conjecture: Acceptor, q: Optional[State], string: str) -> Optional[State]:
+  '''
+  the state reached from q on string (None once a transition is missing)
+  '''
+  for a in string:
+    if q is None:
+      return None
+    if a != 'λ':
+      q = conjecture.d.get((q, a))
+  return q
+
+def access_sequences(conjecture: Acceptor, alphabet: Alphabet) -> dict[State, str]:
+  '''
+  a shortest string reaching each reachable state, by breadth-first search
+  '''
+  access: dict[State, str] = {conjecture.q0: 'λ'}
+  frontier = [conjecture.q0]
+  while frontier:
+    next_frontier: list[State] = []
+    for q in frontier:
+      for a in alphabet:
+        p = conjecture.d.get((q, a))
+        if p is not None and p not in access:
+          access[p] = compact(f'{access[q]}{a}')
+          next_frontier.append(p)
+    frontier = next_frontier
+  return access
+
+def characterizing_set(conjecture: Acceptor, alphabet: Alphabet) -> list[str]:
+  '''
+  W: suffixes such that any two inequivalent reachable states
+  disagree on acceptance of some w in W (Moore's refinement, keeping witnesses)
+  '''
+  states: list[Optional[State]] = list(access_sequences(conjecture, alphabet))
+  states.append(None)  # the implicit sink
+  W = ['λ']
+  def signature(q: Optional[State]) -> tuple[bool, ...]:
+    return tuple(run(conjecture, q, w) in conjecture.F for w in W)
+  changed = True
+  while changed:
+    changed = False
+    signatures = {q: signature(q) for q in states}
+    classes: dict[tuple[bool, ...], list[Optional[State]]] = {}
+    for q in states:
+      classes.setdefault(signatures[q], []).append(q)
+    for members in classes.values():
+      first, *rest = members
+      for a in alphabet:
+        s1 = signatures[run(conjecture, first, a)]
+        for q in rest:
+          s2 = signatures[run(conjecture, q, a)]
+          if s1 != s2:
+            w = next(w for w, t1, t2 in zip(W, s1, s2) if t1 != t2)
+            W.append(compact(f'{a}{w}'))
+            changed = True
+            break
+        if changed:
+          break
+      if changed:
+        break
+  return W
+
+def words_up_to(alphabet: Alphabet, length: int) -> Iterator[str]:
+  '''
+  every string of at most length symbols, shortest first
+  '''
+  for n in range(length + 1):
+    for symbols in product(alphabet, repeat=n):
+      yield compact(''.join(symbols))
+
+class EquivalenceOracle(ABC):
+  '''
+  Abstract base class for equivalence oracles that test a conjecture
+  with membership queries
+  '''
+  def __init__(self, alphabet: Alphabet, budget: Optional[int] = None, batch_size: int = 64):
+    '''
+    Args:
+        alphabet (Alphabet): input alphabet
+        budget (Optional[int]): maximum number of test words per conjecture (default: no limit)
+        batch_size (int): test words sent to the membership function at a time
+    '''
+    self.alphabet = alphabet
+    self.budget = budget
+    self.batch_size = batch_size
+
+  @abstractmethod
+  def test_words(self, conjecture: Acceptor) -> Iterator[str]:
+    '''
+    the test suite for a conjecture, in the order it should be run
+    '''
+
+  def find_counterexample(self, conjecture: Acceptor, membership: Membership) -> Optional[str]:
+    '''
+    run the test suite in batches, stopping at the first mismatch
+
+    Args:
+        conjecture (Acceptor): the acceptor in question
+        membership (Membership): answers a batch of membership queries
+
+    Returns:
+        Optional[str]: a counterexample, or None if every test word passed
+    '''
+    seen: set[str] = set()
+    batch: list[str] = []
+    def check() -> Optional[str]:
+      for word, answer in zip(batch, membership(batch)):
+        if conjecture.accepts(word) != answer:
+          return word
+      batch.clear()
+      return None
+    for word in self.test_words(conjecture):
+      if word in seen:
+        continue
+      if self.budget is not None and len(seen) >= self.budget:
+        break
+      seen.add(word)
+      batch.append(word)
+      if len(batch) >= self.batch_size:
+        counterexample = check()
+        if counterexample is not None:
+          return counterexample
+    return check() if batch else None
+
+class WMethodOracle(EquivalenceOracle):
+  '''
+  the W-method (Chow): P * A^{<=depth} * W, where P is the transition cover;
+  finds every counterexample if the target has at most depth more states than the conjecture
+  '''
+  def __init__(self, alphabet: Alphabet, depth: int = 1, budget: Optional[int] = None, batch_size: int = 64):
+    super().__init__(alphabet, budget, batch_size)
+    self.depth = depth
+
+  def test_words(self, conjecture: Acceptor) -> Iterator[str]:
+    access = list(access_sequences(conjecture, self.alphabet).values())
+    cover = access + [compact(f'{u}{a}') for u in access for a in self.alphabet]
+    W = characterizing_set(conjecture, self.alphabet)
+    for middle in words_up_to(self.alphabet, self.depth):
+      for u in cover:
+        for w in W:
+          yield compact(f'{u}{middle}{w}')
+
+class WpMethodOracle(EquivalenceOracle):
+  '''
+  the Wp-method (Fujiwara et al.): Q * W, then (P - Q) * A^{<=depth} * W_q,
+  where W_q only separates the state q reached from every other state
+  '''
+  def __init__(self, alphabet: Alphabet, depth: int = 1, budget: Optional[int] = None, batch_size: int = 64):
+    super().__init__(alphabet, budget, batch_size)
+    self.depth = depth
+
+  def test_words(self, conjecture: Acceptor) -> Iterator[str]:
+    access = access_sequences(conjecture, self.alphabet)
+    W = characterizing_set(conjecture, self.alphabet)
+    states: list[Optional[State]] = [*access, None]
+    accepted = {q: [run(conjecture, q, w) in conjecture.F for w in W] for q in states}
+    identifying: dict[Optional[State], list[str]] = {}
+    for q in states:
+      # greedily pick suffixes of W until q is separated from every other state
+      others = [p for p in states if p != q and accepted[p] != accepted[q]]
+      chosen: list[str] = []
+      for i, w in enumerate(W):
+        if not others:
+          break
+        if any(accepted[p][i] != accepted[q][i] for p in others):
+          chosen.append(w)
+          others = [p for p in others if accepted[p][i] == accepted[q][i]]
+      identifying[q] = chosen or ['λ']
+    for u in access.values():
+      for w in W:
+        yield compact(f'{u}{w}')
+    for middle in words_up_to(self.alphabet, self.depth):
+      for u in access.values():
+        for a in self.alphabet:
+          prefix = compact(f'{u}{a}{middle}')
+          for w in identifying[run(conjecture, conjecture.q0, prefix)]:
+            yield compact(f'{prefix}{w}')
+
+class RandomWordsOracle(EquivalenceOracle):
+  '''
+  random words with lengths drawn uniformly from [min_length, max_length]
+  '''
+  def __init__(
+      self,
+      alphabet: Alphabet,
+      count: int = 1000,
+      max_length: int = 20,
+      min_length: int = 0,
+      seed: Optional[int] = None,
+      batch_size: int = 64):
+    super().__init__(alphabet, count, batch_size)
+    self.count = count
+    self.max_length = max_length
+    self.min_length = min_length
+    self.random = random.Random(seed)
+
+  def test_words(self, conjecture: Acceptor) -> Iterator[str]:
+    for _ in range(self.count):
+      n = self.random.randint(self.min_length, self.max_length)
+      yield compact(''.join(self.random.choice(self.alphabet) for _ in range(n)))
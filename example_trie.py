@@ -0,0 +1,141 @@
+'''
+ExampleTrie
+'''
+
+from collections import deque
+from typing import Optional
+from acceptor import Acceptor
+from my_types import Alphabet, State
+from helpers import compact
+
+POSITIVE = 1
+NEGATIVE = 2
+
+class ExampleTrie:
+  '''
+  positive and negative examples in a prefix trie
+
+  an example may contain a wildcard that stands for any one symbol;
+  it is stored as a single edge, so a pattern like 11XXXXXXXXXX11 costs
+  one node per character instead of |A|^10 strings.
+  nodes are labelled POSITIVE and/or NEGATIVE (both if examples conflict)
+  '''
+  ROOT = 0
+
+  def __init__(self, wildcard: Optional[str] = None):
+    '''
+    Args:
+        wildcard (Optional[str]): the symbol that matches any symbol, e.g. 'X' (default: none)
+    '''
+    self.wildcard = wildcard
+    # node -> symbol -> child
+    self.children: list[dict[str, int]] = [{}]
+    # node -> POSITIVE | NEGATIVE bits of the examples ending there
+    self.labels: list[int] = [0]
+    self._size = 0
+
+  @classmethod
+  def from_examples(cls, examples: dict[str, set[str]], wildcard: Optional[str] = None) -> 'ExampleTrie':
+    '''
+    the trie of examples['P'] and examples['N']
+    '''
+    trie = cls(wildcard)
+    for p in examples['P']:
+      trie.add(p, True)
+    for n in examples['N']:
+      trie.add(n, False)
+    return trie
+
+  def add(self, example: str, accept: bool) -> None:
+    '''
+    add a positive (accept) or negative example; λ stands for the empty string
+    '''
+    node = self.ROOT
+    for a in compact(example):
+      if a == 'λ':
+        continue
+      child = self.children[node].get(a)
+      if child is None:
+        child = len(self.children)
+        self.children.append({})
+        self.labels.append(0)
+        self.children[node][a] = child
+      node = child
+    label = POSITIVE if accept else NEGATIVE
+    if not self.labels[node] & label:
+      self._size += 1
+    self.labels[node] |= label
+
+  def __len__(self) -> int:
+    return self._size
+
+  def lookup(self, string: str) -> Optional[bool]:
+    '''
+    the label of a string: True if a positive example matches it,
+    else False if a negative example does, else None
+    '''
+    nodes = {self.ROOT}
+    for a in string:
+      if a == 'λ':
+        continue
+      following: set[int] = set()
+      for node in nodes:
+        child = self.children[node].get(a)
+        if child is not None:
+          following.add(child)
+        if self.wildcard is not None:
+          child = self.children[node].get(self.wildcard)
+          if child is not None:
+            following.add(child)
+      if not following:
+        return None
+      nodes = following
+    label = 0
+    for node in nodes:
+      label |= self.labels[node]
+    if label & POSITIVE:
+      return True
+    if label & NEGATIVE:
+      return False
+    return None
+
+  def find_mismatch(self, conjecture: Acceptor, alphabet: Optional[Alphabet] = None) -> Optional[str]:
+    '''
+    a shortest string matching an example that the conjecture classifies wrongly
+
+    searches the product of the trie and the conjecture breadth-first,
+    so each (node, state) pair is visited once whatever the wildcards
+
+    Args:
+        conjecture (Acceptor): the acceptor in question
+        alphabet (Optional[Alphabet]): symbols a wildcard stands for (default: the conjecture's)
+
+    Returns:
+        Optional[str]: a counterexample, or None if the conjecture agrees with every example
+    '''
+    if alphabet is None:
+      alphabet = conjecture.get_alphabet()
+    start: tuple[int, Optional[State]] = (self.ROOT, conjecture.q0)
+    parent: dict[tuple[int, Optional[State]], Optional[tuple[tuple[int, Optional[State]], str]]] = {start: None}
+    queue = deque([start])
+    while queue:
+      pair = queue.popleft()
+      node, q = pair
+      label = self.labels[node]
+      if label:
+        accepted = q is not None and q in conjecture.F
+        if (label & NEGATIVE and accepted) or (label & POSITIVE and not accepted):
+          symbols: list[str] = []
+          back = parent[pair]
+          while back is not None:
+            pair, a = back
+            symbols.append(a)
+            back = parent[pair]
+          return compact(''.join(reversed(symbols)))
+      for a, child in self.children[node].items():
+        for b in (alphabet if a == self.wildcard else a):
+          target = (child, None if q is None else conjecture.d.get((q, b)))
+          if target not in parent:
+            parent[target] = (pair, b)
+            queue.append(target)
+    return None
@@ -2,27 +2,44 @@
 ExamplesTeacher
 '''
 
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 from teacher import Teacher
 from acceptor import Acceptor
 from human_teacher import HumanTeacher
+from example_trie import ExampleTrie
+if TYPE_CHECKING:
+  # NumPy is only needed by the mapped examples
+  from mapped_examples import MappedExamples
 
 class ExamplesTeacher(Teacher):
   '''
   A teacher with examples
+
+  examples may contain a wildcard (e.g. X) that stands for any one symbol;
+  they are kept in an ExampleTrie, never expanded, or read in place from
+  a file by MappedExamples (then positives and negatives only hold the
+  answers given by the human)
   '''
-  def __init__(self, examples: dict[str, set[str]]):
-    self.positives: set[str] = examples['P']
-    self.negatives: set[str] = examples['N']
+  def __init__(self, examples: 'dict[str, set[str]] | MappedExamples', wildcard: Optional[str] = None):
+    self.examples: 'ExampleTrie | MappedExamples'
+    if isinstance(examples, dict):
+      self.positives: set[str] = examples['P']
+      self.negatives: set[str] = examples['N']
+      self.examples = ExampleTrie.from_examples(examples, wildcard)
+    else:
+      self.positives = set()
+      self.negatives = set()
+      self.examples = examples
     self._query_history: list[str] = []
     self.human = HumanTeacher()
 
   def membership_query(self, string: str) -> bool:
     self._query_history.append(string)
-    if string in self.positives:
+    known = self.examples.lookup(string)
+    if known is True:
       print(f'[DEBUG] query: {string} -> accept')
       return True
-    if string in self.negatives:
+    if known is False:
       print(f'[DEBUG] query: {string} -> reject')
       return False
     # not in the examples -> don't know -> {yes, no, random, ask a human}
@@ -33,18 +50,18 @@ class ExamplesTeacher(Teacher):
       self.positives.add(string)
     else:
       self.negatives.add(string)
+    self.examples.add(string, answer)
     return answer
 
   def respond_to_conjecture(self, conjecture: Acceptor) -> Optional[str]:
     # conjecture.print_acceptor()
-    for n in self.negatives:
-      if conjecture.accepts(n):
-        print(f'[DEBUG] conjecture rejected: failed to reject {n}')
-        return n
-    for p in self.positives:
-      if conjecture.rejects(p):
-        print(f'[DEBUG] conjecture rejected: failed to accept {p}')
-        return p
+    t = self.examples.find_mismatch(conjecture)
+    if t is not None:
+      if conjecture.accepts(t):
+        print(f'[DEBUG] conjecture rejected: failed to reject {t}')
+      else:
+        print(f'[DEBUG] conjecture rejected: failed to accept {t}')
+      return t
     # accepts all p in P, rejects all n in N -> "correct"
     return None  # None -> no counterexample -> "correct"
 
@@ -6,23 +6,26 @@ from typing import Optional
 from teacher import Teacher
 from acceptor import Acceptor
 from human_teacher import HumanTeacher
+from example_trie import ExampleTrie
 
 class HumanExamplesTeacher(Teacher):
   '''
   A minimally adequate teacher with examples, backed up by a humn
   '''
-  def __init__(self, P: set[str], N: set[str]):
+  def __init__(self, P: set[str], N: set[str], wildcard: Optional[str] = None):
     self.P: set[str] = set(P)
     self.N: set[str] = set(N)
+    self.examples = ExampleTrie.from_examples({'P': self.P, 'N': self.N}, wildcard)
     self.human = HumanTeacher()
     self._query_history: list[str] = []
 
   def membership_query(self, string: str) -> bool:
     self._query_history.append(string)
-    if string in self.P:
+    known = self.examples.lookup(string)
+    if known is True:
       # print(f'[DEBUG] query: {string} -> accept')
       return True
-    if string in self.N:
+    if known is False:
       # print(f'[DEBUG] query: {string} -> reject')
       return False
     answer = self.human.membership_query(string)
@@ -30,18 +33,15 @@ class HumanExamplesTeacher(Teacher):
       self.P.add(string)
     else:
       self.N.add(string)
+    self.examples.add(string, answer)
     return answer
 
   def respond_to_conjecture(self, conjecture: Acceptor) -> Optional[str]:
     # conjecture.print_acceptor()
-    for n in self.N:
-      if conjecture.accepts(n):
-        # print(f'[DEBUG] conjecture rejected: failed to reject {n}')
-        return n
-    for p in self.P:
-      if conjecture.rejects(p):
-        # print(f'[DEBUG] conjecture rejected: failed to accept {p}')
-        return p
+    t = self.examples.find_mismatch(conjecture)
+    if t is not None:
+      # print(f'[DEBUG] conjecture rejected: {t}')
+      return t
     return self.human.respond_to_conjecture(conjecture)
 
   def query_history(self) -> list[str]:
@@ -7,15 +7,17 @@ from typing import Optional
 from teacher import Teacher
 from acceptor import Acceptor
 from human_teacher import HumanTeacher
+from example_trie import ExampleTrie
 
 class HumanLambdaExamplesTeacher(Teacher):
   '''
   A minimally adequate teacher with a membership function and examples, backed up by a human
   '''
-  def __init__(self, membership: Callable[[str], bool], examples: dict[str, set[str]]):
+  def __init__(self, membership: Callable[[str], bool], examples: dict[str, set[str]], wildcard: Optional[str] = None):
     self.membership = membership
     self.positive_examples: set[str] = examples['P']
     self.negative_examples: set[str] = examples['N']
+    self.examples = ExampleTrie.from_examples(examples, wildcard)
     self.human = HumanTeacher()
     self._query_history: list[str] = []
 
@@ -26,14 +28,13 @@ class HumanLambdaExamplesTeacher(Teacher):
     return answer
 
   def respond_to_conjecture(self, conjecture: Acceptor) -> Optional[str]:
-    for n in self.negative_examples:
-      if conjecture.accepts(n):
-        print(f'[DEBUG] conjecture rejected: failed to reject {n}')
-        return n
-    for p in self.positive_examples:
-      if conjecture.rejects(p):
-        print(f'[DEBUG] conjecture rejected: failed to accept {p}')
-        return p
+    t = self.examples.find_mismatch(conjecture)
+    if t is not None:
+      if conjecture.accepts(t):
+        print(f'[DEBUG] conjecture rejected: failed to reject {t}')
+      else:
+        print(f'[DEBUG] conjecture rejected: failed to accept {t}')
+      return t
     return self.human.respond_to_conjecture(conjecture)
 
   def query_history(self) -> list[str]:
@@ -0,0 +1,61 @@
+'''
+The Learner KV
+from An Introduction to Computational Learning Theory
+by Michael Kearns and Umesh Vazirani
+'''
+
+from teacher import Teacher
+from my_types import Alphabet
+from discrimination_tree import DiscriminationTree
+from acceptor import Acceptor
+
+def kearns_vazirani(alphabet: Alphabet, teacher: Teacher) -> Acceptor:
+  '''
+  learn a regular language with a discrimination tree
+
+  asks each membership query at most once and processes counterexamples
+  by binary search (Rivest-Schapire), so each one adds exactly one state
+
+  Args:
+      alphabet (Alphabet): input alphabet
+      teacher (Teacher): a minimally adequate teacher
+
+  Returns:
+      Acceptor: a DFA for the language
+  '''
+  # the root of the tree discriminates by λ;
+  # sifting λ discovers the initial state
+  tree = DiscriminationTree(alphabet)
+  tree.sift(tree.T.ROOT, teacher)
+
+  while True:
+    # sift every transition; this may discover new states
+    tree.close(teacher)
+
+    # make the conjecture
+    M = tree.to_acceptor(teacher)
+    t = teacher.respond_to_conjecture(M)
+    if t is None:
+      return M
+
+    # find i such that
+    #   alpha(i) != alpha(i+1), where alpha(i) = T(access(w[:i]) * w[i:])
+    w = tree.T.encode(t)
+    path = tree.run(w)
+    def alpha(i: int) -> bool:
+      return tree.query(tree.T.walk(tree.access[path[i]], w[i:]), teacher)
+    lo, hi = 0, len(w)
+    a_lo = alpha(lo)
+    if a_lo == alpha(hi):
+      raise ValueError(f'{t} is not a counterexample')
+    while hi - lo > 1:
+      mid = (lo + hi) // 2
+      if alpha(mid) == a_lo:
+        lo = mid
+      else:
+        hi = mid
+
+    # access(w[:lo]) * w[lo] reaches the state of w[:hi],
+    # but w[hi:] tells them apart: it is a new state
+    u = tree.T.child(tree.access[path[lo]], w[lo])
+    tree.split(path[hi], u, w[hi:], teacher)
@@ -5,22 +5,78 @@ by Dana Angluin
 '''
 
 from sys import argv
+from typing import Generator
 from teacher import Teacher
 from human_teacher import HumanTeacher
 from my_types import Alphabet
 from obervation_table import ObservationTable
 from acceptor import Acceptor
-from helpers import prefixes
+from counterexamples import CounterexampleHandler, add_prefixes
 
-def l_star(alphabet: Alphabet, teacher: Teacher) -> Acceptor:
+def refine(table: ObservationTable) -> Generator[None, None, None]:
+  '''
+  make the table closed and consistent
+
+  yields after each change to S or E; the caller must extend T before resuming
+
+  Args:
+      table (ObservationTable): the observation table
+  '''
+  # table.print_table()
+  is_closed = table.closed()
+  is_consistent = table.consistent()
+  while not is_closed or not is_consistent:
+    if not is_consistent:
+      # print('[INFO] is NOT consistent')
+      # find s1, s2 in S, a in A, and e in E such that
+      #   row(s1) = row(s2) and T(s1*a*e) != T(s2*a*e)
+      ae = table.find_not_consistent()
+      # add ae to E
+      # print(f'add {ae} to E')
+      table.add_to_E(ae)
+      yield
+    # else:
+      # print('[INFO] is consistent')
+    if not is_closed:
+      # print('[INFO] is NOT closed')
+      # find s1 in S and a in A such that
+      #   row(s1*a) is different from row(s) for all s in S
+      s1a = table.find_not_closed()
+      # print(f'[INFO] row({s1a}) is different from all row(s)')
+      # add s1a to S
+      # print(f'add {s1a} to S')
+      table.add_to_S(f'{s1a}')
+      yield
+    # else:
+      # print('[INFO] is closed')
+    # table.print_table()
+    is_closed = table.closed()
+    is_consistent = table.consistent()
+
+def l_star(
+    alphabet: Alphabet,
+    teacher: Teacher,
+    table_type: type[ObservationTable] = ObservationTable,
+    counterexample_handler: CounterexampleHandler = add_prefixes) -> Acceptor:
   '''
   learn a regular language
+
+  Args:
+      alphabet (Alphabet): input alphabet
+      teacher (Teacher): a minimally adequate teacher
+      table_type (type[ObservationTable]): observation table backend,
+        e.g. BitMatrixObservationTable for large alphabets and E
+      counterexample_handler (CounterexampleHandler): how counterexamples
+        refine the table, e.g. rivest_schapire to add a single suffix to E
+
+  Returns:
+      Acceptor: a DFA for the language
   '''
 
   # construct the initial obervation table (S,E,T)
   #   (T is a finite function mapping (S U S*A) * E) to {0,1})
   # initialize S and E to {λ}
-  table = ObservationTable(alphabet)
+  table = table_type(alphabet)
 
   # ask membership queries for λ and each a in A
   table.init(teacher)
@@ -29,38 +85,10 @@ def l_star(alphabet: Alphabet, teacher: Teacher) -> Acceptor:
   # repeat until Teacher replies yes to conjecture m
   M = None
   while M is None:
-    # table.print_table()
-    is_closed = table.closed()
-    is_consistent = table.consistent()
-    while not is_closed or not is_consistent:
-      if not is_consistent:
-        # print('[INFO] is NOT consistent')
-        # find s1, s2 in S, a in A, and e in E such that
-        #   row(s1) = row(s2) and T(s1*a*e) != T(s2*a*e)
-        ae = table.find_not_consistent()
-        # add ae to E
-        # print(f'add {ae} to E')
-        table.add_to_E(ae)
-        # extend T to (S U S*A) * E using membership queries
-        table.extend(teacher)
-      # else:
-        # print('[INFO] is consistent')
-      if not is_closed:
-        # print('[INFO] is NOT closed')
-        # find s1 in S and a in A such that
-        #   row(s1*a) is different from row(s) for all s in S
-        s1a = table.find_not_closed()
-        # print(f'[INFO] row({s1a}) is different from all row(s)')
-        # add s1a to S
-        # print(f'add {s1a} to S')
-        table.add_to_S(f'{s1a}')
-        # extend T to (S U S*A) * E using membership queries
-        table.extend(teacher)
-      # else:
-        # print('[INFO] is closed')
-      # table.print_table()
-      is_closed = table.closed()
-      is_consistent = table.consistent()
+    # extend T to (S U S*A) * E using membership queries
+    #   whenever the table is refined
+    for _ in refine(table):
+      table.extend(teacher)
 
     # (S,E,T) is now closed and consistent
     # make the conjecture
@@ -69,9 +97,8 @@ def l_star(alphabet: Alphabet, teacher: Teacher) -> Acceptor:
     # if the teacher replies with a counterexample t, then
     if t is not None:
       # add t and all its (non-empty) prefixes to S
-      for p in prefixes(t):
-        # print(f'[DEBUG] add {p} to S')
-        table.add_to_S(p)
+      #   (or whatever the counterexample handler does instead)
+      counterexample_handler(table, t, teacher)
       # extend T to (S U S*A) * E using membership queries
       table.extend(teacher)
       M = None
@@ -6,15 +6,25 @@ from collections.abc import Callable
 from typing import Optional
 from teacher import Teacher
 from acceptor import Acceptor
+from equivalence_oracles import EquivalenceOracle
+from example_trie import ExampleTrie
 
 class LambdaExamplesTeacher(Teacher):
   '''
   A teacher with a membership function and examples that accepts the first conjecture
+  consistent with the examples, unless an equivalence oracle finds a counterexample
   '''
-  def __init__(self, membership: Callable[[str], bool], examples: dict[str, set[str]]):
+  def __init__(
+      self,
+      membership: Callable[[str], bool],
+      examples: dict[str, set[str]],
+      equivalence_oracle: Optional[EquivalenceOracle] = None,
+      wildcard: Optional[str] = None):
     self.membership = membership
+    self.equivalence_oracle = equivalence_oracle
     self.positive_examples: set[str] = examples['P']
     self.negative_examples: set[str] = examples['N']
+    self.examples = ExampleTrie.from_examples(examples, wildcard)
     self._query_history: list[str] = []
 
   def membership_query(self, string: str) -> bool:
@@ -24,14 +34,15 @@ class LambdaExamplesTeacher(Teacher):
     return answer
 
   def respond_to_conjecture(self, conjecture: Acceptor) -> Optional[str]:
-    for n in self.negative_examples:
-      if conjecture.accepts(n):
-        print(f'[DEBUG] conjecture rejected: failed to reject {n}')
-        return n
-    for p in self.positive_examples:
-      if conjecture.rejects(p):
-        print(f'[DEBUG] conjecture rejected: failed to accept {p}')
-        return p
+    t = self.examples.find_mismatch(conjecture)
+    if t is not None:
+      if conjecture.accepts(t):
+        print(f'[DEBUG] conjecture rejected: failed to reject {t}')
+      else:
+        print(f'[DEBUG] conjecture rejected: failed to accept {t}')
+      return t
+    if self.equivalence_oracle is not None:
+      return self.equivalence_oracle.find_counterexample(conjecture, self.membership_queries)
     # accept
     return None
   
@@ -6,13 +6,16 @@ from collections.abc import Callable
 from typing import Optional
 from teacher import Teacher
 from acceptor import Acceptor
+from equivalence_oracles import EquivalenceOracle
 
 class LambdaTeacher(Teacher):
   '''
-  A teacher with a membership function that accepts the first conjecture
+  A teacher with a membership function that accepts the first conjecture,
+  unless an equivalence oracle finds a counterexample
   '''
-  def __init__(self, membership: Callable[[str], bool]):
+  def __init__(self, membership: Callable[[str], bool], equivalence_oracle: Optional[EquivalenceOracle] = None):
     self.membership = membership
+    self.equivalence_oracle = equivalence_oracle
     self._query_history: list[str] = []
 
   def membership_query(self, string: str) -> bool:
@@ -22,6 +25,8 @@ class LambdaTeacher(Teacher):
     return answer
 
   def respond_to_conjecture(self, conjecture: Acceptor) -> Optional[str]:
+    if self.equivalence_oracle is not None:
+      return self.equivalence_oracle.find_counterexample(conjecture, self.membership_queries)
     return None
   
   def query_history(self) -> list[str]:
@@ -0,0 +1,44 @@
+'''
+LatencyTeacher
+'''
+
+import asyncio
+from typing import Optional
+from async_teacher import AsyncTeacher
+from teacher import Teacher
+from acceptor import Acceptor
+
+class LatencyTeacher(AsyncTeacher):
+  '''
+  An in-process stand-in for a remote teacher:
+  answers with a synchronous teacher after an injected delay
+  '''
+  def __init__(self, teacher: Teacher, latency: float = 0.0):
+    '''
+    Args:
+        teacher (Teacher): the teacher that answers
+        latency (float): seconds to wait before each answer
+    '''
+    self.teacher = teacher
+    self.latency = latency
+    self._query_history: list[str] = []
+    self.in_flight = 0
+    self.max_in_flight = 0
+
+  async def membership_query(self, string: str) -> bool:
+    self.in_flight += 1
+    self.max_in_flight = max(self.max_in_flight, self.in_flight)
+    try:
+      await asyncio.sleep(self.latency)
+      answer = self.teacher.membership_query(string)
+    finally:
+      self.in_flight -= 1
+    self._query_history.append(string)
+    return answer
+
+  async def respond_to_conjecture(self, conjecture: Acceptor) -> Optional[str]:
+    await asyncio.sleep(self.latency)
+    return self.teacher.respond_to_conjecture(conjecture)
+
+  def query_history(self) -> list[str]:
+    return self._query_history
@@ -5,6 +5,8 @@ by Dana Angluin
 '''
 
 import sys
+import argparse
+from contextlib import ExitStack
 from human_teacher import HumanTeacher
 from human_examples_teacher import HumanExamplesTeacher
 from human_lambda_teacher import HumanLambdaTeacher
@@ -103,23 +105,24 @@ def get_alphabet(examples: dict[str, set[str]]) -> str:
   alphabet.discard('λ')
   return str(''.join(sorted(alphabet)))
 
-def use_examples_teacher(examples_file: Path):
-  examples = read_examples(examples_file)
-  alphabet = get_alphabet(examples)
-  # print(f"{alphabet=}")
-  examples['P'] = inflate_all(examples['P'], alphabet)
-  examples['N'] = inflate_all(examples['N'], alphabet)
-  # print(f"{EXAMPLES=}")
-  return alphabet, ExamplesTeacher(examples)
+def use_examples_teacher(examples_file: Path, stack: ExitStack):
+  '''
+  a teacher for the examples of a file; the file stays mapped until stack is closed
+  '''
+  # NumPy is only needed by the mapped examples
+  from mapped_examples import MappedExamples  # pylint: disable=import-outside-toplevel
+  # the file is memory-mapped and indexed once, in examples_file.idx;
+  # X stays a wildcard: the teacher matches it without inflating the examples
+  examples = stack.enter_context(MappedExamples(examples_file, wildcard='X'))
+  print(examples.description)
+  # print(f"{examples.alphabet=}")
+  return examples.alphabet, ExamplesTeacher(examples)
 
 def use_lambda_examples_teacher(membership: Callable[[str], bool], examples_file: Path):
   examples = read_examples(examples_file)
   alphabet = get_alphabet(examples)
   # print(f"{alphabet=}")
-  examples['P'] = inflate_all(examples['P'], alphabet)
-  examples['N'] = inflate_all(examples['N'], alphabet)
-  # print(f"{EXAMPLES=}")
-  return alphabet, HumanLambdaExamplesTeacher(membership, examples)
+  return alphabet, HumanLambdaExamplesTeacher(membership, examples, wildcard='X')
 
 def print_acceptor(teacher: Teacher, acceptor: Acceptor):
   print(f'{len(teacher.query_history())} queries')
@@ -133,14 +136,53 @@ def print_acceptor(teacher: Teacher, acceptor: Acceptor):
       print(q)
   acceptor.print_acceptor()
 
+def scan(argv: list[str]) -> int:
+  '''
+  scan files with a saved model
+
+  usage: main.py scan [--matches] MODEL FILE...
+
+  prints each accepted line as LINE:TEXT, or with --matches each
+  leftmost-longest match as LINE:START:END:TEXT (byte offsets);
+  files are memory mapped, and a FILE of - reads standard input
+
+  Returns:
+      int: exit status, 0 if anything matched (as grep)
+  '''
+  parser = argparse.ArgumentParser(prog='main.py scan')
+  parser.add_argument('--matches', action='store_true', help='report matches within lines')
+  parser.add_argument('model', type=Path, help='acceptor saved by serialization.save or save_json')
+  parser.add_argument('files', nargs='+')
+  args = parser.parse_args(argv)
+  # NumPy is only needed to scan
+  from scanner import Scanner  # pylint: disable=import-outside-toplevel
+  from serialization import load, load_json  # pylint: disable=import-outside-toplevel
+  acceptor = load_json(args.model) if args.model.suffix == '.json' else load(args.model)
+  scanner = Scanner(acceptor)
+  found = False
+  for name in args.files:
+    prefix = f'{name}:' if len(args.files) > 1 else ''
+    # files are memory mapped, standard input is read a chunk at a time
+    source = sys.stdin.buffer if name == '-' else Path(name)
+    for match, text in scanner.found(source, args.matches):
+      found = True
+      span = f'{match.start}:{match.end}:' if args.matches else ''
+      print(f'{prefix}{match.line}:{span}{text.decode(errors="replace")}')
+  return 0 if found else 1
+
 if __name__ == '__main__':
+  if len(sys.argv) > 1 and sys.argv[1] == 'scan':
+    sys.exit(scan(sys.argv[2:]))
+
   # if len(sys.argv) == 1:
   #   print('error: missing required examples filename')
   #   sys.exit(1)
 
   # examples_file = sys.argv[-1]
 
-  # ALPHABET, TEACHER = use_examples_teacher(examples_file)
+  # the examples file of use_examples_teacher stays mapped until learning is done
+  STACK = ExitStack()
+  # ALPHABET, TEACHER = use_examples_teacher(examples_file, STACK)
 
   # def starts_and_ends_with_11(string: str) -> bool:
   #   return string.startswith('11') and string.endswith('11')
@@ -158,6 +200,7 @@ if __name__ == '__main__':
   ACCEPTOR = l_star(ALPHABET, TEACHER)
 
   print_acceptor(TEACHER, ACCEPTOR)
+  STACK.close()
 
   # teacher = HumanTeacher()
   # P: set[str] = set()
@@ -0,0 +1,315 @@
+'''
+MappedExamples
+'''
+
+import hashlib
+import mmap
+import os
+import struct
+from pathlib import Path
+from types import TracebackType
+from typing import Iterator, Optional
+import numpy as np
+import numpy.typing as npt
+from acceptor import Acceptor
+from example_trie import ExampleTrie
+from my_types import Alphabet, State
+
+MAGIC = b'EXI\0'
+VERSION = 2
+# magic, version, flags, file size, file mtime (ns), sorted examples, overlay examples, alphabet size
+HEADER = struct.Struct('<4sHHQQQQI')
+HEADER_SIZE = 48
+POSITIVE = 1
+NEGATIVE = 2
+
+def _padded(size: int) -> int:
+  return (size + 7) // 8 * 8
+
+def _hash(key: bytes) -> int:
+  # stable across runs, unlike hash()
+  return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), 'little')
+
+class MappedExamples:
+  '''
+  the examples of an examples file, read in place through a memory map
+
+  the file is a description line, then examples, one per line, in sections
+  after '++' (positive, the default) and '--' (negative); an empty line is λ.
+
+  plain examples are indexed by (offset, length) pairs sorted by their bytes,
+  and by a sorted array of their hashes, so a lookup is one search in NumPy
+  and a comparison in place for each example with the same hash.
+  the index is cached next to the file, in FILE.idx, and rebuilt when the
+  file's size or modification time changes. examples with a wildcard or λ,
+  and examples added later, go to an ExampleTrie overlay.
+
+  the file stays mapped until close(), or the end of a with block
+  '''
+  def __init__(self, path: Path | str, wildcard: Optional[str] = 'X'):
+    '''
+    Args:
+        path (Path | str): the examples file
+        wildcard (Optional[str]): the symbol that matches any symbol (default: X)
+    '''
+    self.path = Path(path)
+    self.wildcard = wildcard
+    self.overlay = ExampleTrie(wildcard)
+    self._buffer: bytes | mmap.mmap = b''
+    self._index: Optional[mmap.mmap] = None
+    with open(self.path, 'rb') as f:
+      # an empty file cannot be mapped, and has no examples anyway
+      if f.seek(0, 2) > 0:
+        self._buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    self._view = memoryview(self._buffer)
+    end = self._buffer.find(b'\n')
+    self.description = self._buffer[:end if end >= 0 else len(self._buffer)].decode('utf-8').strip()
+    self.index_path = self.path.with_name(self.path.name + '.idx')
+    self.alphabet: Alphabet = ''
+    # in sorted order
+    self.offsets: npt.NDArray[np.uint64]
+    self.lengths: npt.NDArray[np.uint32]
+    self.lcps: npt.NDArray[np.uint32]
+    self.labels: npt.NDArray[np.uint8]
+    # in hash order: the hash of each example and its position in sorted order
+    self.hashes: npt.NDArray[np.uint64]
+    self.order: npt.NDArray[np.uint64]
+    if not self._load_index():
+      self._build_index()
+
+  def __enter__(self) -> 'MappedExamples':
+    return self
+
+  def __exit__(
+      self,
+      exc_type: Optional[type[BaseException]],
+      exc: Optional[BaseException],
+      traceback: Optional[TracebackType]) -> None:
+    self.close()
+
+  def close(self) -> None:
+    '''
+    unmap the file and its index; the overlay is still usable
+    '''
+    empty = np.zeros(0, dtype=np.uint64)
+    # the arrays are views of the index, which cannot be closed while they exist
+    self.offsets = self.hashes = self.order = empty
+    self.lengths = self.lcps = empty.astype(np.uint32)
+    self.labels = empty.astype(np.uint8)
+    self._view.release()
+    self._view = memoryview(b'')
+    for mapped in (self._buffer, self._index):
+      if isinstance(mapped, mmap.mmap):
+        mapped.close()
+    self._buffer, self._index = b'', None
+
+  def _stamp(self) -> tuple[int, int]:
+    stat = os.stat(self.path)
+    return stat.st_size, stat.st_mtime_ns
+
+  def _overlay_line(self, start: int, length: int, label: int) -> None:
+    self.overlay.add(self._buffer[start:start + length].decode('utf-8'), label == POSITIVE)
+
+  def _load_index(self) -> bool:
+    '''
+    map the cached index, if there is one for this version of the file
+
+    the layout after the header and the padded alphabet is: offsets, hashes
+    and order (u8 each), lengths and lcps (u4), labels (u1, padded to 8 bytes),
+    then the offsets (u8), lengths (u4) and labels (u1) of the overlay examples
+    '''
+    try:
+      with open(self.index_path, 'rb') as f:
+        index = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+      return False
+    if len(index) < HEADER_SIZE:
+      index.close()
+      return False
+    magic, version, _, size, mtime, count, extra, alphabet_size = HEADER.unpack_from(index)
+    offset = HEADER_SIZE + _padded(alphabet_size)
+    if magic != MAGIC or version != VERSION or (size, mtime) != self._stamp() \
+        or len(index) < offset + 24 * count + 8 * count + _padded(count) + 13 * extra:
+      index.close()
+      return False
+    self.alphabet = index[HEADER_SIZE:HEADER_SIZE + alphabet_size].decode('utf-8')
+
+    def array(dtype: str, n: int) -> npt.NDArray[np.generic]:
+      nonlocal offset
+      a = np.frombuffer(index, dtype=dtype, count=n, offset=offset)
+      offset += a.nbytes
+      return a
+
+    self.offsets, self.hashes, self.order = array('<u8', count), array('<u8', count), array('<u8', count)
+    self.lengths, self.lcps = array('<u4', count), array('<u4', count)
+    self.labels = array('u1', count)
+    offset = _padded(offset)
+    extra_offsets, extra_lengths, extra_labels = array('<u8', extra), array('<u4', extra), array('u1', extra)
+    for start, length, label in zip(extra_offsets.tolist(), extra_lengths.tolist(), extra_labels.tolist()):
+      self._overlay_line(start, length, label)
+    del extra_offsets, extra_lengths, extra_labels
+    self._index = index
+    return True
+
+  def _build_index(self, chunk_size: int = 1 << 20) -> None:
+    '''
+    index the file once and cache the index next to it
+
+    this is the only pass that reads every line
+    '''
+    buffer = self._buffer
+    special = [b for b in ('λ'.encode('utf-8'), self.wildcard.encode('utf-8') if self.wildcard else None) if b]
+    entries: list[tuple[bytes, int, int, int]] = []
+    extra: list[tuple[int, int, int]] = []
+    symbols: set[str] = set()
+    label = POSITIVE
+    # the description line is not an example
+    start = buffer.find(b'\n') + 1 or len(buffer)
+    while start < len(buffer):
+      # a block of whole lines at a time, split without going through the mmap per line
+      end = buffer.find(b'\n', start + chunk_size)
+      block = buffer[start:end + 1 if end >= 0 else len(buffer)]
+      lines = block.split(b'\n')
+      if block.endswith(b'\n'):
+        lines.pop()
+      marked = any(b in block for b in special)
+      for line in lines:
+        stripped = line.strip()
+        first = start if len(stripped) == len(line) else start + len(line) - len(line.lstrip())
+        start += len(line) + 1
+        if stripped == b'++':
+          label = POSITIVE
+        elif stripped == b'--':
+          label = NEGATIVE
+        elif marked and any(b in stripped for b in special):
+          extra.append((first, len(stripped), label))
+          self._overlay_line(first, len(stripped), label)
+          symbols.update(stripped.decode('utf-8'))
+        else:
+          entries.append((stripped, first, len(stripped), label))
+          symbols.update(stripped.decode('utf-8'))
+      start = min(start, len(buffer))
+    # equal examples sort positive first, as lookups prefer them
+    entries.sort(key=lambda entry: (entry[0], entry[3]))
+    symbols.discard('λ')
+    if self.wildcard is not None:
+      symbols.discard(self.wildcard)
+    self.alphabet = ''.join(sorted(symbols))
+    count = len(entries)
+    self.offsets = np.fromiter((e[1] for e in entries), dtype='<u8', count=count)
+    self.lengths = np.fromiter((e[2] for e in entries), dtype='<u4', count=count)
+    self.labels = np.fromiter((e[3] for e in entries), dtype=np.uint8, count=count)
+    hashes = np.fromiter((_hash(e[0]) for e in entries), dtype='<u8', count=count)
+    self.order = np.argsort(hashes, kind='stable').astype('<u8')
+    self.hashes = hashes[self.order]
+    # the prefix each example shares with the one before it, in bytes
+    lcps = [0] * count
+    for i in range(1, count):
+      a, b = entries[i - 1][0], entries[i][0]
+      limit = min(len(a), len(b))
+      # the first differing bit of the two prefixes, read as big-endian integers
+      x = int.from_bytes(a[:limit], 'big') ^ int.from_bytes(b[:limit], 'big')
+      n = limit - (x.bit_length() + 7) // 8
+      # never split a UTF-8 sequence
+      while 0 < n < len(b) and b[n] & 0xc0 == 0x80:
+        n -= 1
+      lcps[i] = n
+    self.lcps = np.array(lcps, dtype='<u4')
+    alphabet = self.alphabet.encode('utf-8')
+    size, mtime = self._stamp()
+    try:
+      with open(self.index_path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, 0, size, mtime, count, len(extra), len(alphabet)).ljust(HEADER_SIZE, b'\0'))
+        f.write(alphabet.ljust(_padded(len(alphabet)), b'\0'))
+        for array in (self.offsets, self.hashes, self.order, self.lengths, self.lcps, self.labels):
+          f.write(array.tobytes())
+        f.write(b'\0' * (_padded(count) - count))
+        f.write(np.array([e[0] for e in extra], dtype='<u8').tobytes())
+        f.write(np.array([e[1] for e in extra], dtype='<u4').tobytes())
+        f.write(np.array([e[2] for e in extra], dtype=np.uint8).tobytes())
+    except OSError:
+      # without a writable directory, the next run indexes the file again
+      pass
+
+  def __len__(self) -> int:
+    return len(self.labels) + len(self.overlay)
+
+  def add(self, example: str, accept: bool) -> None:
+    '''
+    add a positive (accept) or negative example, in memory only
+    '''
+    self.overlay.add(example, accept)
+
+  def _search(self, key: bytes) -> Optional[bool]:
+    '''
+    the label of the indexed examples equal to key, preferring positive
+    '''
+    h = _hash(key)
+    view, hashes = self._view, self.hashes
+    found: Optional[bool] = None
+    i = int(np.searchsorted(hashes, np.uint64(h)))
+    while i < len(hashes) and hashes[i] == h:
+      j = int(self.order[i])
+      start, length = int(self.offsets[j]), int(self.lengths[j])
+      # compared in place, without copying the line
+      if length == len(key) and view[start:start + length] == key:
+        if self.labels[j] == POSITIVE:
+          return True
+        found = False
+      i += 1
+    return found
+
+  def lookup(self, string: str) -> Optional[bool]:
+    '''
+    the label of a string: True if a positive example matches it,
+    else False if a negative example does, else None
+    '''
+    indexed = self._search(string.replace('λ', '').encode('utf-8'))
+    if indexed is True:
+      return True
+    overlaid = self.overlay.lookup(string)
+    return overlaid if overlaid is not None else indexed
+
+  def _entries(self, chunk: int = 1 << 16) -> Iterator[tuple[int, int, int, int]]:
+    '''
+    (offset, length, lcp, label) of each indexed example, in sorted order
+    '''
+    for i in range(0, len(self.labels), chunk):
+      yield from zip(
+        self.offsets[i:i + chunk].tolist(),
+        self.lengths[i:i + chunk].tolist(),
+        self.lcps[i:i + chunk].tolist(),
+        self.labels[i:i + chunk].tolist())
+
+  def find_mismatch(self, conjecture: Acceptor, alphabet: Optional[Alphabet] = None) -> Optional[str]:
+    '''
+    a shortest example that the conjecture classifies wrongly
+
+    the sorted examples are run in order, keeping the states along the current
+    one: each example only runs the part it does not share with the one before
+
+    Args:
+        conjecture (Acceptor): the acceptor in question
+        alphabet (Optional[Alphabet]): symbols a wildcard stands for (default: the conjecture's)
+
+    Returns:
+        Optional[str]: a counterexample, or None if the conjecture agrees with every example
+    '''
+    best = self.overlay.find_mismatch(conjecture, alphabet)
+    best_length = None if best is None else len(best.replace('λ', '').encode('utf-8'))
+    buffer, d, F = self._buffer, conjecture.d, conjecture.F
+    # states[i]: the state after the first i bytes of the current example
+    states: list[Optional[State]] = [conjecture.q0]
+    for start, length, lcp, label in self._entries():
+      if best_length == 0:
+        break
+      del states[lcp + 1:]
+      q = states[-1]
+      if length > lcp:
+        for a in buffer[start + lcp:start + length].decode('utf-8'):
+          q = None if q is None else d.get((q, a))
+          states.extend([q] * (1 if a < '\x80' else len(a.encode('utf-8'))))
+      if (q is not None and q in F) != (label == POSITIVE) and (best_length is None or length < best_length):
+        best = buffer[start:start + length].decode('utf-8') or 'λ'
+        best_length = length
+    return best
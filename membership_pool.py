@@ -0,0 +1,69 @@
+'''
+MembershipPool
+'''
+
+import os
+import pickle
+import weakref
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+class MembershipPool:
+  '''
+  evaluates a membership function over batches of strings in a process pool
+
+  the membership function is sent to the worker processes, so it must be
+  picklable: a module-level function (or an instance of a module-level class),
+  not a lambda or a closure.
+  the workers are started on the first batch and shut down by close(),
+  or when the pool is garbage collected
+  '''
+  def __init__(
+      self,
+      membership: Callable[[str], bool],
+      workers: Optional[int] = None,
+      chunksize: Optional[int] = None):
+    '''
+    Args:
+        membership (Callable[[str], bool]): picklable membership function
+        workers (Optional[int]): number of worker processes (default: one per CPU)
+        chunksize (Optional[int]): queries sent to a worker at a time
+          (default: about 4 chunks per worker per batch)
+    '''
+    try:
+      pickle.dumps(membership)
+    except (pickle.PicklingError, AttributeError, TypeError) as e:
+      raise TypeError(f'membership function {membership!r} cannot be pickled') from e
+    self.membership = membership
+    self.workers = workers
+    self.chunksize = chunksize
+    self._executor: Optional[ProcessPoolExecutor] = None
+    self._finalizer: Optional[weakref.finalize] = None
+
+  def map(self, strings: list[str]) -> list[bool]:
+    '''
+    the membership of each string, in the same order
+    '''
+    if len(strings) < 2:
+      return [self.membership(string) for string in strings]
+    if self._executor is None:
+      self._executor = ProcessPoolExecutor(max_workers=self.workers)
+      self._finalizer = weakref.finalize(self, self._executor.shutdown, wait=False)
+    chunksize = self.chunksize
+    if chunksize is None:
+      workers = self.workers or os.cpu_count() or 1
+      chunksize = max(1, len(strings) // (4 * workers))
+    # map yields the answers in the order of the strings
+    return list(self._executor.map(self.membership, strings, chunksize=chunksize))
+
+  def close(self) -> None:
+    '''
+    shut down the worker processes
+    '''
+    if self._finalizer is not None:
+      self._finalizer.detach()
+      self._finalizer = None
+    if self._executor is not None:
+      self._executor.shutdown()
+      self._executor = None
@@ -4,7 +4,9 @@ types
 
 Alphabet = str
 Row = dict[str, bool]
+Signature = tuple[bool | None, ...]
 State = int
 Symbol = str
+Word = tuple[int, ...]
 TransitionFunction = dict[tuple[Symbol, Symbol], State]
 
@@ -1,7 +1,9 @@
-from my_types import Alphabet, State
+from typing import Generator, Optional
+from my_types import Alphabet, Signature, State, Word
 from teacher import Teacher
 from helpers import compact
 from acceptor import Acceptor
+from word_trie import WordTrie
 
 Row = dict[str, bool]
 
@@ -14,22 +16,98 @@ class ObservationTable:
     self.A = A
     self.S: set[str] = {'λ'}
     self.E: set[str] = {'λ'}
-    self.T: dict[str, bool] = {}
+    self.T: WordTrie = WordTrie(A)
+    # E in the order its members were added, as strings and as words
+    self._columns: list[str] = ['λ']
+    self._column_words: list[Word] = [()]
+    # node of s in T for each s in S
+    self._s_nodes: dict[str, int] = {'λ': WordTrie.ROOT}
+    # node of u -> [T(u*e) for e in _columns] for each u in (S U S*A), None until known
+    self._rows: dict[int, list[bool | None]] = {}
+    # node of s*e -> cells (node of u, column) of _rows that are waiting for T(s*e)
+    self._pending: dict[int, list[tuple[int, int]]] = {}
+    # signature -> members of S with that signature, rebuilt lazily after S, E or T change
+    self._index: Optional[dict[Signature, set[str]]] = None
+    self._add_rows(WordTrie.ROOT)
 
   def init(self, teacher: Teacher) -> None:
-    for symbol in f'λ{self.A}':
-      self.T[symbol] = teacher.membership_query(symbol)
+    '''
+    ask membership queries for λ and each a in A
+    '''
+    self.extend(teacher)
+
+  def _add_rows(self, node: int) -> None:
+    '''
+    cache rows for the node of s in S and the node of each s*a
+    '''
+    self._add_row(node)
+    for a in range(len(self.A)):
+      self._add_row(self.T.child(node, a))
+
+  def _has_row(self, node: int) -> bool:
+    return node in self._rows
+
+  def _row_nodes(self) -> list[int]:
+    '''
+    nodes of each u in (S U S*A), in the order their rows were added
+    '''
+    return list(self._rows)
+
+  def _add_row(self, node: int) -> None:
+    if not self._has_row(node):
+      self._rows[node] = []
+      for column, word in enumerate(self._column_words):
+        self._add_cell(node, column, word)
+
+  def _add_cell(self, node: int, column: int, word: Word) -> None:
+    '''
+    add the cell T(u*e) to the cached row of u, queueing it if unknown
+    '''
+    t = self.T.walk(node, word)
+    known = self.T.values[t]
+    if known is None:
+      self._pending.setdefault(t, []).append((node, column))
+    self._set_cell(node, column, known)
+
+  def _set_cell(self, node: int, column: int, value: bool | None) -> None:
+    r = self._rows[node]
+    if column == len(r):
+      r.append(value)
+    else:
+      r[column] = value
+
+  def _row(self, node: int) -> Signature:
+    return tuple(self._rows[node])
 
   def row(self, s: str) -> Row:
     '''
     the finite function f: E -> {0,1} defined by f(e) = T(s*e)
     '''
-    r: Row = {}
-    for e in self.E:
-      t = compact(f'{s}{e}')
-      if t in self.T:
-        r[e] = self.T[t]
-    return r
+    return {e: t for e, t in zip(self._columns, self.signature(s)) if t is not None}
+
+  def signature(self, s: str) -> Signature:
+    '''
+    row(s) as an immutable, hashable key: T(s*e) for each e in E (None if unknown)
+
+    two signatures are only comparable while E is unchanged
+    '''
+    node = self.T.find(WordTrie.ROOT, self.T.encode(s))
+    if node is not None and self._has_row(node):
+      return self._row(node)
+    return tuple(self.T.get(compact(f'{s}{e}')) for e in self._columns)
+
+  def index(self) -> dict[Signature, set[str]]:
+    '''
+    group the members of S by signature
+
+    Returns:
+        dict[Signature, set[str]]: signature -> members of S that share it
+    '''
+    if self._index is None:
+      self._index = {}
+      for s, node in self._s_nodes.items():
+        self._index.setdefault(self._row(node), set()).add(s)
+    return self._index
 
   def closed(self) -> bool:
     '''
@@ -39,23 +117,11 @@ class ObservationTable:
     Returns:
         bool: True iff table is closed
     '''
-    for s in self.S:
-      for a in self.A:
-        t = compact(f'{s}{a}')
-        # print(f'[DEBUG] {t=}')
-        row_t = self.row(t)
-        # print(f'[DEBUG] row({t}) = {row_t}')
-        good = False
-        for r in self.S:
-          if row_t == self.row(r):
-            good = True
-            # print(f'[DEBUG] row({t}) = row({r})')
-            break
-        if not good:
-          # print(f'[DEBUG] no s such that row({t}) = row(s)')
-          return False
-    return True
-    # return all(any(row(t, table) == row(s, table) for s in table.S) for t in (compact(f'{s}{a}') for s in table.S for a in A))
+    index = self.index()
+    return all(
+      self._row(child) in index
+      for node in self._s_nodes.values()
+      for child in self.T.children[node].values())
 
   def consistent(self) -> bool:
     '''
@@ -66,12 +132,25 @@ class ObservationTable:
     Returns:
         bool: True iff table is consistent
     '''
-    for s1 in self.S:
-      for s2 in self.S:
-        if self.row(s1) == self.row(s2):
-          if not all(self.row(compact(f'{s1}{a}')) == self.row(compact(f'{s2}{a}')) for a in self.A):
-            return False
-    return True
+    return next(self._inconsistencies(), None) is None
+
+  def _inconsistencies(self) -> Generator[str, None, None]:
+    '''
+    only members of S in the same index bucket have equal rows,
+    so each is compared against the first member of its bucket
+    '''
+    for bucket in self.index().values():
+      if len(bucket) < 2:
+        continue
+      s1, *rest = (self._s_nodes[s] for s in bucket)
+      for i, a in enumerate(self.A):
+        row1 = self._row(self.T.children[s1][i])
+        for s2 in rest:
+          row2 = self._row(self.T.children[s2][i])
+          if row1 != row2:
+            for e, t1, t2 in zip(self._columns, row1, row2):
+              if t1 != t2:
+                yield compact(f'{a}{e}')
 
   def find_not_consistent(self) -> str:
     '''
@@ -82,16 +161,10 @@ class ObservationTable:
         str: ae that improves consistency
 
     '''
-    for s1 in self.S:
-      for s2 in self.S:
-        if self.row(s1) == self.row(s2):
-          for a in self.A:
-            for e in self.E:
-              t1 = compact(f'{s1}{a}{e}')
-              t2 = compact(f'{s2}{a}{e}')
-              if self.T[t1] != self.T[t2]:
-                return compact(f'{a}{e}')
-    raise ValueError('failed to find s1,s2,a,e to increase consistency')
+    ae = next(self._inconsistencies(), None)
+    if ae is None:
+      raise ValueError('failed to find s1,s2,a,e to increase consistency')
+    return ae
 
   def find_not_closed(self) -> str:
     '''
@@ -101,65 +174,157 @@ class ObservationTable:
     Returns:
         str: s1, a that improves closure
     '''
-    for s1 in self.S:
-      for a in self.A:
-        t = compact(f'{s1}{a}')
-        r = self.row(t)
-        if all(r != self.row(s) for s in self.S):
-          return t
+    index = self.index()
+    for node in self._s_nodes.values():
+      for child in self.T.children[node].values():
+        if self._row(child) not in index:
+          return self.T.string(child)
     raise ValueError('failed to find s1,a to increase closure')
 
+  def query(self, string: str, teacher: Teacher) -> bool:
+    '''
+    T(string), asking the teacher only if it is not yet known
+
+    Args:
+        string (str): string in question
+        teacher (Teacher): a minimally adequate teacher
+
+    Returns:
+        bool: True iff string is in the language
+    '''
+    node = self.T.node(string)
+    answer = self.T.values[node]
+    if answer is None:
+      answer = teacher.membership_query(self.T.string(node))
+      self.T.set(node, answer)
+    return answer
+
+  def access_string(self, string: str) -> str:
+    '''
+    the member of S for the state that the conjecture reaches on string
+
+    the table must be closed and consistent
+
+    Args:
+        string (str): string over A
+
+    Returns:
+        str: a member of S
+    '''
+    index = self.index()
+    node = WordTrie.ROOT
+    for symbol in self.T.encode(string):
+      bucket = index[self._row(self.T.children[node][symbol])]
+      node = self._s_nodes[next(iter(bucket))]
+    return self.T.string(node)
+
   def add_to_S(self, s: str) -> None:
-    if len(s) == 0:
-      s = 'λ'
+    '''
+    add s to S, caching rows for s and each s*a
+    '''
+    s = compact(s)
+    if s in self.S:
+      return
+    node = self.T.node(s)
     self.S.add(s)
+    self._s_nodes[s] = node
+    self._add_rows(node)
+    self._index = None
 
   def add_to_E(self, e: str) -> None:
-    if len(e) == 0:
-      e = 'λ'
+    '''
+    add e to E, appending its cell to each cached row
+    '''
+    e = compact(e)
+    if e in self.E:
+      return
+    word = self.T.encode(e)
     self.E.add(e)
+    self._columns.append(e)
+    self._column_words.append(word)
+    column = len(self._columns) - 1
+    for node in self._row_nodes():
+      self._add_cell(node, column, word)
+    self._index = None
+
+  def pending_queries(self) -> list[str]:
+    '''
+    the words that T still needs in order to fill the cells queued since the last extension
+
+    Returns:
+        list[str]: strings for membership queries, in the order extend_with expects answers
+    '''
+    values = self.T.values
+    return [self.T.string(t) for t in self._pending if values[t] is None]
+
+  def extend_with(self, answers: list[bool]) -> None:
+    '''
+    extend T to (S U S*A) * E with the answers to pending_queries()
+
+    Args:
+        answers (list[bool]): the answer for each pending query, in the same order
+    '''
+    values = self.T.values
+    missing = [t for t in self._pending if values[t] is None]
+    if len(answers) != len(missing):
+      raise ValueError(f'expected {len(missing)} answers, got {len(answers)}')
+    for t, answer in zip(missing, answers):
+      self.T.set(t, answer)
+    for t, cells in self._pending.items():
+      for node, column in cells:
+        self._set_cell(node, column, values[t])
+    self._pending.clear()
+    self._index = None
 
   def extend(self, teacher: Teacher) -> None:
     '''
     extend T to (S U S*A) * E using membership queries for missing elements
 
+    only the cells queued since the last extension are visited,
+    and all of their missing words are sent to the teacher as one batch
+
     Args:
         teacher (Teacher): a minimally adequate teacher
     '''
-    for u in self.S.union(set(compact(f'{s}{a}') for s in self.S for a in self.A)):
-      for e in self.E:
-        t = compact(f'{u}{e}')
-        if t not in self.T:
-          self.T[t] = teacher.membership_query(t)
+    if not self._pending:
+      return
+    strings = self.pending_queries()
+    self.extend_with(teacher.membership_queries(strings) if strings else [])
+
+  def to_acceptor(self, compiled: bool = False) -> Acceptor:
+    '''
+    the conjecture of a closed and consistent table
+
+    Args:
+        compiled (bool): emit a CompiledAcceptor with states 0..n-1
 
-  def to_acceptor(self) -> Acceptor:
+    Returns:
+        Acceptor: a DFA with one state per distinct row of S,
+          numbered 0..n-1 in breadth-first order (see Acceptor.canonical)
+    '''
     Q: set[State] = set()
     q0: State = -1
     F: set[State] = set()
     d: dict[tuple[State, str], State] = {}
+    number: dict[Signature, State] = {}
+
+    def state_of(node: int) -> State:
+      return number.setdefault(self._row(node), len(number))
 
-    list_e = list(self.E)
-    for s in self.S:
-      r = self.row(s)
-      state = 0
-      for e in list_e:
-        state *= 2
-        if r[e]:
-          state += 1
+    for s, node in self._s_nodes.items():
+      state = state_of(node)
       Q.add(state)
       if s == 'λ':
         q0 = state
-      if self.T[s]:
+      if self.T.values[node]:
         F.add(state)
-      for a in self.A:
-        r2 = self.row(f'{s}{a}')
-        next_state = 0
-        for e in list_e:
-          next_state *= 2
-          if r2[e]:
-            next_state += 1
-        d[(state, a)] = next_state
-    return Acceptor(Q, q0, F, d)
+      for i, a in enumerate(self.A):
+        d[(state, a)] = state_of(self.T.children[node][i])
+    if compiled:
+      # NumPy is only needed by the compiled form
+      from compiled_acceptor import CompiledAcceptor  # pylint: disable=import-outside-toplevel
+      return CompiledAcceptor.compile(Acceptor(Q, q0, F, d).canonical(self.A), self.A)
+    return Acceptor(Q, q0, F, d).canonical(self.A)
 
   def print_table(self) -> None:
     '''
@@ -172,19 +337,18 @@ class ObservationTable:
     print(f'E: {self.E}')
     width = max(len(t) for t in self.T)
     print(f' T{" "*(width-1)}', end='')
-    for e in self.E:
+    for e in self._columns:
       print(f' | {e}{" "*(5-len(e))}', end='')
     print()
     print('-'*(width+2+8*len(self.E)))
     v: set[str] = set()
-    for s in self.S:
+    for s, node in self._s_nodes.items():
       print(f' {s}' + ' '*(width-len(s)), end ='')
-      for e in self.E:
-        t = compact(f'{s}{e}')
-        if t in self.T:
-          fn = str(self.T[t])
+      for e, known in zip(self._columns, self._row(node)):
+        if known is not None:
+          fn = str(known)
           print(f' | {fn}{" "*(5-len(fn))}', end='')
-          v.add(t)
+          v.add(compact(f'{s}{e}'))
         else:
           print(' |   ?  ', end='')
       print()
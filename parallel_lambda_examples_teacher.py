@@ -0,0 +1,44 @@
+'''
+ParallelLambdaExamplesTeacher
+'''
+
+from collections.abc import Callable
+from typing import Optional
+from lambda_examples_teacher import LambdaExamplesTeacher
+from membership_pool import MembershipPool
+from equivalence_oracles import EquivalenceOracle
+
+class ParallelLambdaExamplesTeacher(LambdaExamplesTeacher):
+  '''
+  A LambdaExamplesTeacher that answers batches of membership queries in a process pool
+
+  the membership function must be picklable (see MembershipPool).
+  use it as a context manager or call close() to stop the workers;
+  otherwise they are stopped when the teacher is garbage collected
+  '''
+  def __init__(
+      self,
+      membership: Callable[[str], bool],
+      examples: dict[str, set[str]],
+      workers: Optional[int] = None,
+      chunksize: Optional[int] = None,
+      equivalence_oracle: Optional[EquivalenceOracle] = None):
+    super().__init__(membership, examples, equivalence_oracle)
+    self.pool = MembershipPool(membership, workers, chunksize)
+
+  def membership_queries(self, strings: list[str]) -> list[bool]:
+    answers = self.pool.map(strings)
+    self._query_history.extend(strings)
+    return answers
+
+  def close(self) -> None:
+    '''
+    shut down the worker processes
+    '''
+    self.pool.close()
+
+  def __enter__(self) -> 'ParallelLambdaExamplesTeacher':
+    return self
+
+  def __exit__(self, *_) -> None:
+    self.close()
@@ -0,0 +1,43 @@
+'''
+ParallelLambdaTeacher
+'''
+
+from collections.abc import Callable
+from typing import Optional
+from lambda_teacher import LambdaTeacher
+from membership_pool import MembershipPool
+from equivalence_oracles import EquivalenceOracle
+
+class ParallelLambdaTeacher(LambdaTeacher):
+  '''
+  A LambdaTeacher that answers batches of membership queries in a process pool
+
+  the membership function must be picklable (see MembershipPool).
+  use it as a context manager or call close() to stop the workers;
+  otherwise they are stopped when the teacher is garbage collected
+  '''
+  def __init__(
+      self,
+      membership: Callable[[str], bool],
+      workers: Optional[int] = None,
+      chunksize: Optional[int] = None,
+      equivalence_oracle: Optional[EquivalenceOracle] = None):
+    super().__init__(membership, equivalence_oracle)
+    self.pool = MembershipPool(membership, workers, chunksize)
+
+  def membership_queries(self, strings: list[str]) -> list[bool]:
+    answers = self.pool.map(strings)
+    self._query_history.extend(strings)
+    return answers
+
+  def close(self) -> None:
+    '''
+    shut down the worker processes
+    '''
+    self.pool.close()
+
+  def __enter__(self) -> 'ParallelLambdaTeacher':
+    return self
+
+  def __exit__(self, *_) -> None:
+    self.close()
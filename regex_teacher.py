@@ -0,0 +1,105 @@
+'''
+RegexTeacher
+'''
+
+from typing import Optional
+from teacher import Teacher
+from acceptor import Acceptor
+from brzozowski import derivative, nullable, parse, simplify
+from dfa_teacher import equivalent, shortest_difference
+from my_types import Alphabet, State
+from sexpr import sexpr
+
+class LazyDFA:
+  '''
+  the DFA of a regular expression, built as it is run
+
+  each state is a distinct derivative of the expression, and each
+  transition is computed the first time it is taken
+  '''
+  def __init__(self, regex: str | sexpr, alphabet: Alphabet):
+    '''
+    Args:
+        regex (str | sexpr): an expression in the syntax of pretty()
+        alphabet (Alphabet): input alphabet
+    '''
+    self.alphabet = alphabet
+    self.symbol_index = {a: i for i, a in enumerate(alphabet)}
+    expr = parse(regex) if isinstance(regex, str) else regex
+    self._memo: dict[tuple[sexpr, str], sexpr] = {}
+    self.states: list[sexpr] = []
+    self.number: dict[sexpr, State] = {}
+    self.accepting: list[bool] = []
+    # state -> next state for each symbol (None until taken)
+    self.delta: list[list[Optional[State]]] = []
+    self.q0 = self._state(simplify(expr))
+
+  def _state(self, expr: sexpr) -> State:
+    if expr not in self.number:
+      self.number[expr] = len(self.states)
+      self.states.append(expr)
+      self.accepting.append(nullable(expr))
+      self.delta.append([None] * len(self.alphabet))
+    return self.number[expr]
+
+  def step(self, q: State, a: str) -> State:
+    '''
+    the state after a from q, computing it if it is new
+    '''
+    i = self.symbol_index[a]
+    p = self.delta[q][i]
+    if p is None:
+      p = self._state(derivative(self.states[q], a, self._memo))
+      self.delta[q][i] = p
+    return p
+
+  def accepts(self, string: str) -> bool:
+    q = self.q0
+    for a in string:
+      if a == 'λ':
+        continue
+      if a not in self.symbol_index:
+        return False
+      q = self.step(q, a)
+    return self.accepting[q]
+
+  def to_acceptor(self) -> Acceptor:
+    '''
+    the complete DFA: every derivative reachable from the expression
+    '''
+    q = 0
+    while q < len(self.states):
+      for a in self.alphabet:
+        self.step(q, a)
+      q += 1
+    Q = set(range(len(self.states)))
+    F = {q for q in Q if self.accepting[q]}
+    d = {(q, a): self.step(q, a) for q in Q for a in self.alphabet}
+    return Acceptor(Q, self.q0, F, d)
+
+class RegexTeacher(Teacher):
+  '''
+  A teacher for the language of a regular expression
+
+  membership queries run the lazy DFA of its derivatives; conjectures are
+  checked exactly, with shortest counterexamples (see DFATeacher)
+  '''
+  def __init__(self, regex: str | sexpr, alphabet: Alphabet):
+    self.dfa = LazyDFA(regex, alphabet)
+    self.alphabet = alphabet
+    self._reference: Optional[Acceptor] = None
+    self._query_history: list[str] = []
+
+  def membership_query(self, string: str) -> bool:
+    self._query_history.append(string)
+    return self.dfa.accepts(string)
+
+  def respond_to_conjecture(self, conjecture: Acceptor) -> Optional[str]:
+    if self._reference is None:
+      self._reference = self.dfa.to_acceptor()
+    if equivalent(self._reference, conjecture, self.alphabet):
+      return None
+    return shortest_difference(self._reference, conjecture, self.alphabet)
+
+  def query_history(self) -> list[str]:
+    return self._query_history
@@ -0,0 +1,156 @@
+'''
+Scanner
+'''
+
+import mmap
+from collections.abc import Iterator
+from pathlib import Path
+from typing import BinaryIO, NamedTuple, Optional
+from acceptor import Acceptor
+from compiled_acceptor import CompiledAcceptor
+from my_types import Alphabet
+
+Source = bytes | bytearray | memoryview | mmap.mmap | BinaryIO | Path | str
+
+class Match(NamedTuple):
+  '''
+  a match on line (numbered from 1), as byte offsets [start, end) into the input
+  '''
+  line: int
+  start: int
+  end: int
+
+class Scanner:
+  '''
+  runs an acceptor over the lines of a byte stream
+
+  every symbol of the alphabet must be a single byte in Latin-1 (e.g. ASCII);
+  any other byte rejects. lines are split on b'\\n' (a trailing b'\\r' is dropped)
+  and each is translated to table columns with one bytes.translate call,
+  so no per-candidate strings are built
+  '''
+  def __init__(self, acceptor: Acceptor, alphabet: Optional[Alphabet] = None):
+    '''
+    Args:
+        acceptor (Acceptor): the acceptor to scan with
+        alphabet (Optional[Alphabet]): input alphabet (default: the acceptor's)
+    '''
+    compiled = acceptor if isinstance(acceptor, CompiledAcceptor) and alphabet is None \
+      else CompiledAcceptor.compile(acceptor, alphabet)
+    if any(ord(a) > 0xff for a in compiled.alphabet):
+      raise ValueError(f'{compiled.alphabet} is not a single-byte alphabet')
+    width = len(compiled.alphabet) + 2
+    columns = bytearray([width - 1] * 256)
+    for i, a in enumerate(compiled.alphabet):
+      columns[ord(a)] = i
+    self.columns = bytes(columns)
+    self.width = width
+    self.q0 = compiled.q0
+    self.delta: list[int] = compiled.table.ravel().tolist()
+    self.accepting: list[bool] = compiled.accepting.tolist()
+    # states from which no string is accepted end a match early
+    predecessors: list[list[int]] = [[] for _ in self.accepting]
+    for q in range(len(self.accepting)):
+      for p in self.delta[q * width:(q + 1) * width]:
+        predecessors[p].append(q)
+    self.live = list(self.accepting)
+    todo = [q for q, live in enumerate(self.live) if live]
+    while todo:
+      for q in predecessors[todo.pop()]:
+        if not self.live[q]:
+          self.live[q] = True
+          todo.append(q)
+
+  def _run(self, codes: bytes) -> bool:
+    delta, width, live = self.delta, self.width, self.live
+    q = self.q0
+    for c in codes:
+      q = delta[q * width + c]
+      if not live[q]:
+        return False
+    return self.accepting[q]
+
+  def _longest(self, codes: bytes) -> Iterator[tuple[int, int]]:
+    delta, width, live, accepting = self.delta, self.width, self.live, self.accepting
+    i, n = 0, len(codes)
+    while i < n:
+      q, end = self.q0, -1
+      for j in range(i, n):
+        q = delta[q * width + codes[j]]
+        if not live[q]:
+          break
+        if accepting[q]:
+          end = j + 1
+      if end > i:
+        yield i, end
+        i = end
+      else:
+        i += 1
+
+  def found(self, source: Source, matches: bool = False) -> Iterator[tuple[Match, bytes]]:
+    '''
+    each accepted line, or with matches each match within a line, with its bytes
+
+    unlike lines() and matches(), this needs no buffer to slice the text from,
+    so it also reports what it finds in a stream
+    '''
+    for number, offset, line in _lines(source):
+      codes = line.translate(self.columns)
+      if matches:
+        for start, end in self._longest(codes):
+          yield Match(number, offset + start, offset + end), line[start:end]
+      elif self._run(codes):
+        yield Match(number, offset, offset + len(line)), line
+
+  def lines(self, source: Source) -> Iterator[Match]:
+    '''
+    the lines that the acceptor accepts as a whole
+    '''
+    for match, _ in self.found(source):
+      yield match
+
+  def matches(self, source: Source) -> Iterator[Match]:
+    '''
+    leftmost-longest, non-overlapping, non-empty matches within each line
+
+    each line is read once, but a match attempt from each start runs until
+    no extension can be accepted, so the cost per line is the sum of its
+    live runs: linear when runs are short, as for tokens, and quadratic in
+    the worst case, e.g. (0+1)*2 on a line of 0s, where every start runs
+    to the end of the line
+    '''
+    for match, _ in self.found(source, matches=True):
+      yield match
+
+def _lines(source: Source, chunk_size: int = 1 << 20) -> Iterator[tuple[int, int, bytes]]:
+  '''
+  (line number, byte offset, line) for each line of a buffer, a binary file or a path;
+  paths are memory mapped and files are read a chunk at a time
+  '''
+  if isinstance(source, (Path, str)):
+    with open(source, 'rb') as f:
+      if f.seek(0, 2) == 0:
+        return
+      with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        yield from _lines(buffer)
+    return
+  if isinstance(source, (bytes, bytearray, memoryview, mmap.mmap)):
+    buffer = source if not isinstance(source, memoryview) else source.tobytes()
+    start, number = 0, 1
+    while start < len(buffer):
+      end = buffer.find(b'\n', start)
+      if end < 0:
+        end = len(buffer)
+      line = buffer[start:end]
+      yield number, start, line[:-1] if line.endswith(b'\r') else line
+      start, number = end + 1, number + 1
+    return
+  offset, number, rest = 0, 1, b''
+  while chunk := source.read(chunk_size):
+    rest += chunk
+    *complete, rest = rest.split(b'\n')
+    for line in complete:
+      yield number, offset, line[:-1] if line.endswith(b'\r') else line
+      offset, number = offset + len(line) + 1, number + 1
+  if rest:
+    yield number, offset, rest[:-1] if rest.endswith(b'\r') else rest
@@ -0,0 +1,145 @@
+'''
+saving and loading acceptors
+
+the binary format (all integers little-endian) is
+  header     32 bytes: magic b'DFA\\0', version u16, flags u16 (0),
+             n u32 (states, without the sink), k u32 (symbols), q0 u32,
+             alphabet length u32 (bytes), padding
+  alphabet   k symbols in UTF-8, padded to a multiple of 8 bytes
+  table      (n+1) x (k+2) int32, as CompiledAcceptor.table
+  accepting  n+1 bits, least significant bit first
+
+so the table can be used in place from a memory map
+'''
+
+import json
+import mmap
+import struct
+from pathlib import Path
+from typing import Any
+import numpy as np
+from acceptor import Acceptor
+from compiled_acceptor import CompiledAcceptor
+from my_types import Alphabet
+
+MAGIC = b'DFA\0'
+VERSION = 1
+HEADER = struct.Struct('<4sHHIIII')
+HEADER_SIZE = 32
+
+def _padded(size: int) -> int:
+  return (size + 7) // 8 * 8
+
+def _compiled(acceptor: Acceptor, alphabet: Alphabet | None) -> CompiledAcceptor:
+  if isinstance(acceptor, CompiledAcceptor) and alphabet in (None, acceptor.alphabet):
+    return acceptor
+  return CompiledAcceptor.compile(acceptor, alphabet)
+
+def save(acceptor: Acceptor, path: Path | str, alphabet: Alphabet | None = None) -> None:
+  '''
+  write an acceptor in the binary format
+
+  Args:
+      acceptor (Acceptor): the acceptor to save
+      path (Path | str): file to write
+      alphabet (Alphabet | None): input alphabet (default: the acceptor's)
+  '''
+  compiled = _compiled(acceptor, alphabet)
+  symbols = compiled.alphabet.encode('utf-8')
+  n, k = compiled.sink, len(compiled.alphabet)
+  header = HEADER.pack(MAGIC, VERSION, 0, n, k, compiled.q0, len(symbols))
+  with open(path, 'wb') as f:
+    f.write(header.ljust(HEADER_SIZE, b'\0'))
+    f.write(symbols.ljust(_padded(len(symbols)), b'\0'))
+    f.write(compiled.table.astype('<i4', copy=False).tobytes())
+    f.write(np.packbits(compiled.accepting, bitorder='little').tobytes())
+
+def load(path: Path | str) -> CompiledAcceptor:
+  '''
+  map an acceptor in the binary format into memory
+
+  the transition table is a read-only view of the file, so it is not copied,
+  and processes share its pages; it is only read once, to check that every
+  transition goes to a state
+
+  Args:
+      path (Path | str): file to read
+
+  Returns:
+      CompiledAcceptor: the saved acceptor
+  '''
+  with open(path, 'rb') as f:
+    buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+  if len(buffer) < HEADER_SIZE:
+    raise ValueError(f'{path} is not an acceptor')
+  magic, version, _, n, k, q0, alphabet_size = HEADER.unpack_from(buffer)
+  if magic != MAGIC:
+    raise ValueError(f'{path} is not an acceptor')
+  if version != VERSION:
+    raise ValueError(f'{path} has format version {version}, expected {VERSION}')
+  offset = HEADER_SIZE
+  alphabet = bytes(buffer[offset:offset + alphabet_size]).decode('utf-8')
+  offset += _padded(alphabet_size)
+  cells = (n + 1) * (k + 2)
+  if len(alphabet) != k or len(buffer) < offset + 4 * cells + (n + 8) // 8:
+    raise ValueError(f'{path} is truncated')
+  table = np.frombuffer(buffer, dtype='<i4', count=cells, offset=offset).reshape(n + 1, k + 2)
+  offset += 4 * cells
+  # one pass over the table, so a corrupt file fails here rather than in accepts
+  if q0 > n or table.min() < 0 or table.max() > n:
+    raise ValueError(f'{path} has transitions to states that do not exist')
+  bits = np.frombuffer(buffer, dtype=np.uint8, count=(n + 8) // 8, offset=offset)
+  accepting = np.unpackbits(bits, count=n + 1, bitorder='little').astype(bool)
+  return CompiledAcceptor.from_table(alphabet, table, accepting, q0)
+
+def to_json(acceptor: Acceptor, alphabet: Alphabet | None = None) -> dict[str, Any]:
+  '''
+  an acceptor as plain JSON data; missing transitions are left out
+  '''
+  return {
+    'version': VERSION,
+    'alphabet': alphabet if alphabet is not None else acceptor.get_alphabet(),
+    'states': sorted(acceptor.Q),
+    'initial': acceptor.q0,
+    'accepting': sorted(acceptor.F),
+    'transitions': [[q, a, p] for (q, a), p in sorted(acceptor.d.items())],
+  }
+
+def from_json(data: dict[str, Any], alphabet: Alphabet | None = None) -> Acceptor:
+  '''
+  the acceptor of JSON data written by to_json
+
+  Args:
+      data (dict[str, Any]): the JSON data
+      alphabet (Alphabet | None): the expected input alphabet (default: the saved one)
+
+  Returns:
+      Acceptor: the saved acceptor
+  '''
+  if data.get('version') != VERSION:
+    raise ValueError(f'format version {data.get("version")}, expected {VERSION}')
+  saved: Alphabet = data['alphabet']
+  if alphabet is not None and sorted(alphabet) != sorted(saved):
+    raise ValueError(f'the acceptor is over {saved}, expected {alphabet}')
+  Q = set(data['states'])
+  d = {(q, a): p for q, a, p in data['transitions']}
+  if any(a not in saved for _, a in d):
+    raise ValueError(f'transitions on symbols outside {saved}')
+  if data['initial'] not in Q or not Q.issuperset(data['accepting']) \
+      or any(q not in Q or p not in Q for (q, _), p in d.items()):
+    raise ValueError('transitions or accepting states that are not states')
+  return Acceptor(Q, data['initial'], set(data['accepting']), d)
+
+def save_json(acceptor: Acceptor, path: Path | str, alphabet: Alphabet | None = None) -> None:
+  '''
+  write an acceptor as JSON
+  '''
+  with open(path, 'w', encoding='utf-8') as f:
+    json.dump(to_json(acceptor, alphabet), f, ensure_ascii=False)
+
+def load_json(path: Path | str, alphabet: Alphabet | None = None) -> Acceptor:
+  '''
+  read an acceptor written by save_json, over the given alphabet if any
+  '''
+  with open(path, encoding='utf-8') as f:
+    return from_json(json.load(f), alphabet)
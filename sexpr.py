@@ -1,10 +1,40 @@
-from typing import Any
+from typing import Any, Optional
+from weakref import WeakValueDictionary
 
 class sexpr:
-  def __init__(self, name: str):
-    self.name: str = name
-    self.left: sexpr | None
-    self.right: sexpr | None
+  '''
+  an immutable s-expression node
+
+  nodes are hash-consed: building a node equal to one that is still alive
+  returns that node, so equality is identity, shared subexpressions are
+  stored once, and the hash and size are computed once per node
+  '''
+  __slots__ = ('name', 'left', 'right', 'size', '_hash', '__weakref__')
+
+  name: str
+  left: Optional['sexpr']
+  right: Optional['sexpr']
+  size: int
+
+  # (class, name, left, right) -> the live node with that structure
+  _interned: 'WeakValueDictionary[tuple[Any, ...], sexpr]' = WeakValueDictionary()
+
+  def __new__(cls, name: str, left: Optional['sexpr'] = None, right: Optional['sexpr'] = None) -> Any:
+    key = (cls, name, left, right)
+    node = sexpr._interned.get(key)
+    if node is None:
+      node = object.__new__(cls)
+      object.__setattr__(node, 'name', name)
+      object.__setattr__(node, 'left', left)
+      object.__setattr__(node, 'right', right)
+      size = 1 + (left.size if left is not None else 0) + (right.size if right is not None else 0)
+      object.__setattr__(node, 'size', size)
+      object.__setattr__(node, '_hash', hash(key))
+      sexpr._interned[key] = node
+    return node
+
+  def __setattr__(self, name: str, value: Any) -> None:
+    raise AttributeError(f'{type(self).__name__} is immutable')
 
   def __str__(self) -> str:
     if self.left is None:
@@ -13,5 +43,11 @@ class sexpr:
       return f"({self.name} {self.left})"
     return f"({self.name} {self.left} {self.right})"
 
+  def __repr__(self) -> str:
+    return str(self)
+
   def __eq__(self, other: Any) -> bool:
-    return str(self) == str(other)
+    return self is other
+
+  def __hash__(self) -> int:
+    return self._hash
@@ -0,0 +1,88 @@
+'''
+ShorteningTeacher
+'''
+
+from collections.abc import Callable, Iterable
+from typing import Optional
+from teacher import Teacher
+from acceptor import Acceptor
+from helpers import compact
+
+def shorten(
+    conjecture: Acceptor,
+    counterexample: str,
+    membership: Callable[[list[str]], list[bool]],
+    batch_size: int = 16) -> str:
+  '''
+  shorten a counterexample: take its shortest prefix that is still a counterexample,
+  then delete single symbols while it stays one
+
+  the result has no proper prefix and no one-symbol deletion that is a counterexample
+
+  Args:
+      conjecture (Acceptor): the acceptor in question
+      counterexample (str): a string on which the conjecture is wrong
+      membership (Callable[[list[str]], list[bool]]): answers a batch of membership queries
+      batch_size (int): candidates asked at a time
+
+  Returns:
+      str: a counterexample no longer than the given one
+  '''
+  def first_counterexample(candidates: Iterable[str]) -> Optional[str]:
+    batch: list[str] = []
+    def check() -> Optional[str]:
+      for s, answer in zip(batch, membership(batch)):
+        if conjecture.accepts(s) != answer:
+          return s
+      batch.clear()
+      return None
+    for s in candidates:
+      batch.append(s)
+      if len(batch) >= batch_size:
+        found = check()
+        if found is not None:
+          return found
+    return check() if batch else None
+
+  t = compact(counterexample).replace('λ', '')
+  # the whole string is known to be a counterexample, so only proper prefixes are asked
+  found = first_counterexample(compact(t[:k]) for k in range(len(t)))
+  if found is not None:
+    t = found.replace('λ', '')
+  while t:
+    # skip deletions that give the same string twice (in runs of a symbol)
+    candidates = (compact(t[:i] + t[i + 1:]) for i in range(len(t)) if i == 0 or t[i] != t[i - 1])
+    found = first_counterexample(candidates)
+    if found is None:
+      break
+    t = found.replace('λ', '')
+  return compact(t)
+
+class ShorteningTeacher(Teacher):
+  '''
+  A teacher that shortens the counterexamples of another teacher
+  with its own membership queries, so that the learner adds fewer rows
+  '''
+  def __init__(self, teacher: Teacher, batch_size: int = 16):
+    '''
+    Args:
+        teacher (Teacher): the teacher whose counterexamples are shortened
+        batch_size (int): candidates asked at a time
+    '''
+    self.teacher = teacher
+    self.batch_size = batch_size
+
+  def membership_query(self, string: str) -> bool:
+    return self.teacher.membership_query(string)
+
+  def membership_queries(self, strings: list[str]) -> list[bool]:
+    return self.teacher.membership_queries(strings)
+
+  def respond_to_conjecture(self, conjecture: Acceptor) -> Optional[str]:
+    t = self.teacher.respond_to_conjecture(conjecture)
+    if t is None:
+      return None
+    return shorten(conjecture, t, self.teacher.membership_queries, self.batch_size)
+
+  def query_history(self) -> list[str]:
+    return self.teacher.query_history()
@@ -22,6 +22,20 @@ class Teacher(ABC):
         bool: _description_
     '''
 
+  def membership_queries(self, strings: list[str]) -> list[bool]:
+    '''
+    ask the teacher about several strings at once
+
+    override this to amortize the cost of an expensive oracle over a batch
+
+    Args:
+        strings (list[str]): strings in question
+
+    Returns:
+        list[bool]: the answer for each string, in the same order
+    '''
+    return [self.membership_query(string) for string in strings]
+
   @abstractmethod
   def respond_to_conjecture(self, conjecture: Acceptor) -> Optional[str]:
     '''
@@ -0,0 +1,52 @@
+'''
+target languages and teachers shared by the tests
+'''
+
+import random
+from acceptor import Acceptor
+from lambda_examples_teacher import LambdaExamplesTeacher
+
+def zeros_multiple_of_3(string: str) -> bool:
+  '''
+  the number of 0s is a multiple of 3
+  '''
+  return string.replace('λ', '').count('0') % 3 == 0
+
+def second_symbol_1(string: str) -> bool:
+  '''
+  the second symbol is 1
+  '''
+  return len(string) > 1 and string[1] == '1'
+
+# zeros_multiple_of_3, with counterexamples long enough to matter
+ZEROS_EXAMPLES = {
+  'P': {'λ', '1' * 20 + '000' + '1' * 20},
+  'N': {'1' * 20 + '0' + '1' * 20, '1' * 20 + '00' + '1' * 20},
+}
+
+SECOND_SYMBOL_EXAMPLES = {
+  'P': {'01', '11', '010', '011', '110', '111'},
+  'N': {'λ', '0', '1', '00', '10', '000', '001', '100', '101'},
+}
+
+def copy_examples(examples: dict[str, set[str]]) -> dict[str, set[str]]:
+  '''
+  a copy that a teacher may add to
+  '''
+  return {k: set(v) for k, v in examples.items()}
+
+def zeros_teacher() -> LambdaExamplesTeacher:
+  '''
+  a fresh teacher for zeros_multiple_of_3
+  '''
+  return LambdaExamplesTeacher(zeros_multiple_of_3, copy_examples(ZEROS_EXAMPLES))
+
+def random_acceptor(n: int, alphabet: str, seed: int) -> Acceptor:
+  '''
+  a complete DFA with random transitions and about half its states accepting
+  '''
+  rng = random.Random(seed)
+  Q = set(range(n))
+  F = {q for q in Q if rng.random() < 0.5}
+  d = {(q, a): rng.randrange(n) for q in Q for a in alphabet}
+  return Acceptor(Q, 0, F, d)
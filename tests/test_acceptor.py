@@ -0,0 +1,48 @@
+import random
+from acceptor import Acceptor
+from dfa_teacher import equivalent
+from l_star import l_star
+from bit_matrix_observation_table import BitMatrixObservationTable
+from languages import zeros_teacher
+
+def test_minimize():
+  '''
+  should merge equivalent states and number them canonically
+  '''
+  # the number of 0s mod 3 is 0, with states duplicated mod 6 and an unreachable state
+  d = {(q, '0'): (q + 1) % 6 for q in range(6)}
+  d.update({(q, '1'): q for q in range(6)})
+  d.update({(9, '0'): 9, (9, '1'): 9})
+  acceptor = Acceptor(set(range(6)) | {9}, 0, {0, 3, 9}, d)
+  minimal = acceptor.minimize()
+  assert minimal.Q == {0, 1, 2} and minimal.q0 == 0 and minimal.F == {0}
+  assert minimal.d[(0, '0')] == 1 and minimal.d[(1, '0')] == 2
+  assert equivalent(acceptor, minimal, '01')
+  # partial: only 1 followed by 0s; a complete version with its dead state
+  partial = Acceptor({0, 1}, 0, {1}, {(0, '1'): 1, (1, '0'): 1})
+  assert partial.minimize().d == partial.d
+  complete = Acceptor({0, 1, 2}, 0, {1}, {(0, '1'): 1, (1, '0'): 1, (0, '0'): 2, (1, '1'): 2, (2, '0'): 2, (2, '1'): 2})
+  assert len(complete.minimize().Q) == 3
+
+def test_minimize_random():
+  '''
+  should be equivalent to random acceptors and never larger
+  '''
+  rng = random.Random(0)
+  for _ in range(50):
+    n = rng.randrange(1, 20)
+    d = {(q, a): rng.randrange(n) for q in range(n) for a in 'ab' if rng.random() < 0.9}
+    acceptor = Acceptor(set(range(n)), 0, {q for q in range(n) if rng.random() < 0.3}, d)
+    minimal = acceptor.minimize('ab')
+    assert equivalent(acceptor, minimal, 'ab')
+    assert len(minimal.minimize('ab').Q) == len(minimal.Q) <= n
+    assert minimal.Q == set(range(len(minimal.Q)))
+
+def test_to_acceptor():
+  '''
+  should number states the same way whatever the table backend
+  '''
+  m1 = l_star('01', zeros_teacher())
+  m2 = l_star('01', zeros_teacher(), BitMatrixObservationTable)
+  assert m1.Q == m2.Q == {0, 1, 2}
+  assert m1.q0 == m2.q0 == 0 and m1.F == m2.F and m1.d == m2.d
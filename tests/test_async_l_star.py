@@ -0,0 +1,26 @@
+import asyncio
+from async_l_star import async_l_star
+from l_star import l_star
+from latency_teacher import LatencyTeacher
+from counterexamples import rivest_schapire
+from languages import zeros_teacher
+
+def test_async_l_star():
+  '''
+  should learn what l_star learns, with bounded concurrent queries
+  '''
+  teacher = LatencyTeacher(zeros_teacher(), latency=0.001)
+  m1 = asyncio.run(async_l_star('01', teacher, concurrency=3))
+  m2 = l_star('01', zeros_teacher())
+  assert m1.Q == m2.Q and m1.q0 == m2.q0 and m1.F == m2.F and m1.d == m2.d
+  assert 1 < teacher.max_in_flight <= 3
+  assert sorted(teacher.query_history()) == sorted(teacher.teacher.query_history())
+
+def test_async_l_star_rivest_schapire():
+  '''
+  should process counterexamples with a handler that asks membership queries
+  '''
+  teacher = LatencyTeacher(zeros_teacher(), latency=0.001)
+  m1 = asyncio.run(async_l_star('01', teacher, counterexample_handler=rivest_schapire))
+  m2 = l_star('01', zeros_teacher(), counterexample_handler=rivest_schapire)
+  assert m1.Q == m2.Q and m1.q0 == m2.q0 and m1.F == m2.F and m1.d == m2.d
@@ -0,0 +1,44 @@
+from itertools import product
+import pytest
+from l_star import l_star
+from lambda_examples_teacher import LambdaExamplesTeacher
+from lambda_teacher import LambdaTeacher
+from languages import SECOND_SYMBOL_EXAMPLES, copy_examples, second_symbol_1
+from obervation_table import ObservationTable
+
+pytest.importorskip('numpy')
+from bit_matrix_observation_table import BitMatrixObservationTable
+
+def test_same_checks():
+  '''
+  should agree with the dict-based table on closedness and consistency
+  '''
+  tables = [ObservationTable('01'), BitMatrixObservationTable('01')]
+  teacher = LambdaTeacher(second_symbol_1)
+  for table in tables:
+    table.init(teacher)
+    for s in ('0', '01'):
+      table.add_to_S(s)
+    table.extend(teacher)
+  assert [table.closed() for table in tables] == [True, True]
+  assert [table.consistent() for table in tables] == [False, False]
+  assert [table.find_not_consistent() for table in tables] == ['1', '1']
+  for table in tables:
+    table.add_to_E('1')
+    table.extend(teacher)
+  assert [table.consistent() for table in tables] == [True, True]
+  assert tables[0].index() == tables[1].index()
+
+def test_same_acceptor():
+  '''
+  should learn the same acceptor as the dict-based table
+  '''
+  m1 = l_star('01', LambdaExamplesTeacher(second_symbol_1, copy_examples(SECOND_SYMBOL_EXAMPLES)))
+  m2 = l_star(
+    '01',
+    LambdaExamplesTeacher(second_symbol_1, copy_examples(SECOND_SYMBOL_EXAMPLES)),
+    BitMatrixObservationTable)
+  assert len(m1.Q) == len(m2.Q)
+  for n in range(6):
+    for string in map(''.join, product('01', repeat=n)):
+      assert m1.accepts(string) == m2.accepts(string)
@@ -0,0 +1,57 @@
+import re
+import sys
+from collections import Counter
+from itertools import product
+from acceptor import Acceptor
+from brzozowski import brzozowski, opt, pretty, simplify, literal, concat, star, union
+from languages import random_acceptor
+
+def regex_of(acceptor: Acceptor, alphabet: str) -> str:
+  states = [acceptor.q0, *sorted(acceptor.Q - {acceptor.q0})]
+  number = {q: i for i, q in enumerate(states)}
+  trans = {(number[q], a): {number[p]} for (q, a), p in acceptor.d.items()}
+  return pretty(opt(brzozowski(len(states), alphabet, {number[q] for q in acceptor.F}, trans)))
+
+def test_language():
+  '''
+  should extract a regular expression for the language of each acceptor
+  '''
+  for seed in range(10):
+    acceptor = random_acceptor(5, 'ab', seed)
+    regex = regex_of(acceptor, 'ab')
+    pattern = re.compile(regex.replace('ε', '').replace('∅', '[^\\s\\S]'))
+    for n in range(7):
+      for symbols in product('ab', repeat=n):
+        string = ''.join(symbols)
+        assert (pattern.fullmatch(string) is not None) == acceptor.accepts(string), (regex, string)
+
+def test_deep():
+  '''
+  should simplify expressions deeper than the recursion limit, and count rewrites
+  '''
+  expr = literal('a')
+  for _ in range(sys.getrecursionlimit() + 100):
+    expr = concat(star(literal('a')), union(expr, expr))
+  rewrites: Counter[str] = Counter()
+  simplified = simplify(expr, rewrites)
+  assert rewrites['(e|e)'] > sys.getrecursionlimit()
+  assert simplified.size < expr.size
+
+def test_orders():
+  '''
+  should extract the same language in every elimination order,
+  with the weight heuristic smaller than the index order overall
+  '''
+  total: Counter[str] = Counter()
+  for seed in range(5):
+    acceptor = random_acceptor(12, 'ab', seed).minimize('ab')
+    trans = {(q, a): {p} for (q, a), p in acceptor.d.items()}
+    for order in ('index', 'min_degree', 'weight', lambda out, inn, candidates: min(candidates)):
+      expr = opt(brzozowski(len(acceptor.Q), 'ab', acceptor.F, trans, order))
+      pattern = re.compile(pretty(expr).replace('ε', '').replace('∅', '[^\\s\\S]'))
+      for n in range(7):
+        for symbols in product('ab', repeat=n):
+          string = ''.join(symbols)
+          assert (pattern.fullmatch(string) is not None) == acceptor.accepts(string)
+      total[order if isinstance(order, str) else 'custom'] += expr.size
+  assert total['weight'] < total['index']
@@ -0,0 +1,34 @@
+from caching_teacher import CachingTeacher
+from lambda_teacher import LambdaTeacher
+from l_star import l_star
+from languages import zeros_multiple_of_3, zeros_teacher
+
+def test_memory():
+  '''
+  should ask the wrapped teacher once per string and count hits and misses
+  '''
+  inner = LambdaTeacher(zeros_multiple_of_3)
+  with CachingTeacher(inner, 'zeros') as teacher:
+    assert teacher.membership_queries(['0', '000', '0']) == [False, True, False]
+    assert teacher.membership_query('000')
+    assert inner.query_history() == ['0', '000']
+    assert teacher.query_history() == ['0', '000', '0', '000']
+    assert (teacher.hits, teacher.disk_hits, teacher.misses) == (1, 0, 2)
+
+def test_store(tmp_path):
+  '''
+  should reuse the answers of an earlier run with the same oracle, and only that oracle
+  '''
+  store = tmp_path / 'answers.sqlite'
+  with CachingTeacher(zeros_teacher(), 'zeros', store) as teacher:
+    l_star('01', teacher)
+    first = teacher.misses
+  inner = zeros_teacher()
+  with CachingTeacher(inner, 'zeros', store, capacity=4) as teacher:
+    l_star('01', teacher)
+    assert teacher.misses == 0
+    assert teacher.disk_hits >= first
+    assert inner.query_history() == []
+  with CachingTeacher(LambdaTeacher(zeros_multiple_of_3), 'other', store) as teacher:
+    teacher.membership_query('0')
+    assert teacher.misses == 1
@@ -0,0 +1,52 @@
+import random
+import numpy as np
+from acceptor import Acceptor
+from compiled_acceptor import CompiledAcceptor
+from l_star import l_star, refine
+from obervation_table import ObservationTable
+from languages import zeros_teacher
+
+def test_compile():
+  '''
+  should agree with the acceptor it was compiled from, including λ, missing and foreign symbols
+  '''
+  # only 1 followed by 0s, with a partial transition function and a sparse numbering
+  acceptor = Acceptor({5, 7}, 7, {5}, {(7, '1'): 5, (5, '0'): 5})
+  compiled = CompiledAcceptor.compile(acceptor, '01')
+  assert compiled.Q == {0, 1} and compiled.q0 == 0 and compiled.F == {1}
+  assert compiled.d == {(0, '1'): 1, (1, '0'): 1}
+  assert compiled.get_alphabet() == '01'
+  rng = random.Random(0)
+  strings = ['', 'λ', '1λ0', '12', '10ab', *(''.join(rng.choice('01λx') for _ in range(rng.randrange(8))) for _ in range(500))]
+  expected = [acceptor.accepts(s) for s in strings]
+  assert [compiled.accepts(s) for s in strings] == expected
+  assert compiled.accepts_many(strings).tolist() == expected
+  assert compiled.accepts_many(iter(strings), chunk=7).tolist() == expected
+  assert compiled.accepts_many([]).shape == (0,)
+
+def test_surrogates():
+  '''
+  should treat lone surrogates, as decoded with surrogateescape, as foreign symbols
+  '''
+  compiled = CompiledAcceptor.compile(Acceptor({0, 1}, 0, {1}, {(0, 'a'): 1, (1, 'b'): 1}), 'ab')
+  strings = ['ab', 'a\udcff', b'a\xffb'.decode('utf-8', 'surrogateescape'), '\ud800']
+  assert compiled.accepts_many(strings).tolist() == [compiled.accepts(s) for s in strings] == [True, False, False, False]
+
+def test_to_acceptor():
+  '''
+  should let the observation table emit a compiled conjecture
+  '''
+  teacher = zeros_teacher()
+  acceptor = l_star('01', teacher)
+  table = ObservationTable('01')
+  table.init(teacher)
+  table.add_to_E('0')
+  table.add_to_E('00')
+  table.extend(teacher)
+  for _ in refine(table):
+    table.extend(teacher)
+  compiled = table.to_acceptor(compiled=True)
+  assert isinstance(compiled, CompiledAcceptor)
+  assert len(compiled.Q) == 3
+  strings = [format(i, 'b') for i in range(256)]
+  assert np.array_equal(compiled.accepts_many(strings), [acceptor.accepts(s) for s in strings])
@@ -0,0 +1,24 @@
+from l_star import l_star
+from counterexamples import add_prefixes, add_suffixes, shahbaz, rivest_schapire, linear
+from languages import ZEROS_EXAMPLES, zeros_teacher
+
+def learn(handler) -> tuple[int, int]:
+  teacher = zeros_teacher()
+  acceptor = l_star('01', teacher, counterexample_handler=handler)
+  for examples, expected in ((ZEROS_EXAMPLES['P'], True), (ZEROS_EXAMPLES['N'], False)):
+    for example in examples:
+      assert acceptor.accepts(example) == expected
+  return len(acceptor.Q), len(teacher.query_history())
+
+def test_handlers():
+  '''
+  should learn the same automaton with every strategy
+  '''
+  for handler in (add_prefixes, add_suffixes, shahbaz, rivest_schapire, linear):
+    assert learn(handler)[0] == 3
+
+def test_rivest_schapire():
+  '''
+  should need far fewer queries than adding every prefix of a long counterexample
+  '''
+  assert learn(rivest_schapire)[1] * 4 < learn(add_prefixes)[1]
@@ -0,0 +1,35 @@
+from acceptor import Acceptor
+from dfa_teacher import DFATeacher, equivalent, shortest_difference
+from l_star import l_star
+from counterexamples import rivest_schapire
+from kearns_vazirani import kearns_vazirani
+from languages import random_acceptor
+
+def test_shortest_difference():
+  '''
+  should find a shortest distinguishing string, treating missing transitions as rejecting
+  '''
+  # strings ending in 1
+  ends_1 = Acceptor({0, 1}, 0, {1}, {(0, '0'): 0, (0, '1'): 1, (1, '0'): 0, (1, '1'): 1})
+  # only 1
+  only_1 = Acceptor({0, 1}, 0, {1}, {(0, '1'): 1})
+  assert not equivalent(ends_1, only_1, '01')
+  assert shortest_difference(ends_1, only_1, '01') == '01'
+  assert equivalent(ends_1, ends_1, '01')
+  assert shortest_difference(ends_1, ends_1, '01') is None
+  teacher = DFATeacher(only_1)
+  assert teacher.alphabet == '1'
+  assert teacher.membership_queries(['1', '11', 'λ']) == [True, False, False]
+
+def test_learn_random():
+  '''
+  should let l_star and kearns_vazirani learn random targets exactly
+  '''
+  for seed in range(5):
+    target = random_acceptor(60, 'abc', seed)
+    for learn in (
+        lambda t: l_star('abc', t, counterexample_handler=rivest_schapire),
+        lambda t: kearns_vazirani('abc', t)):
+      teacher = DFATeacher(target)
+      acceptor = learn(teacher)
+      assert teacher.respond_to_conjecture(acceptor) is None
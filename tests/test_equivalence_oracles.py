@@ -0,0 +1,48 @@
+from l_star import l_star
+from lambda_teacher import LambdaTeacher
+from equivalence_oracles import WMethodOracle, WpMethodOracle, RandomWordsOracle, characterizing_set
+from languages import zeros_multiple_of_3
+
+def fourth_last_symbol_1(string: str) -> bool:
+  '''
+  the fourth symbol from the end is 1 (16 states)
+  '''
+  string = string.replace('λ', '')
+  return len(string) >= 4 and string[-4] == '1'
+
+def check(acceptor, membership, n=10):
+  for i in range(1 << n):
+    s = format(i, f'0{n}b')
+    for k in range(n + 1):
+      assert acceptor.accepts(s[:k]) == membership(s[:k]), s[:k]
+
+def test_w_method():
+  '''
+  a lambda teacher with a W-method oracle should learn the exact language
+  '''
+  for oracle in (WMethodOracle('01', depth=3), WpMethodOracle('01', depth=3)):
+    teacher = LambdaTeacher(fourth_last_symbol_1, oracle)
+    acceptor = l_star('01', teacher)
+    assert len(acceptor.Q) == 16
+    check(acceptor, fourth_last_symbol_1)
+    assert len(characterizing_set(acceptor, '01')) >= 4
+
+def test_random_words():
+  '''
+  random words should stop at the first mismatch and respect the budget
+  '''
+  asked: list[int] = []
+  def membership(strings):
+    asked.append(len(strings))
+    return [zeros_multiple_of_3(s) for s in strings]
+  teacher = LambdaTeacher(zeros_multiple_of_3)
+  wrong = l_star('01', teacher)
+  oracle = RandomWordsOracle('01', count=100, max_length=10, seed=1, batch_size=8)
+  t = oracle.find_counterexample(wrong, membership)
+  assert t is not None and wrong.accepts(t) != zeros_multiple_of_3(t)
+  assert sum(asked) < 100
+  acceptor = l_star('01', LambdaTeacher(zeros_multiple_of_3, oracle))
+  check(acceptor, zeros_multiple_of_3)
+  asked.clear()
+  assert oracle.find_counterexample(acceptor, membership) is None
+  assert sum(asked) <= 100
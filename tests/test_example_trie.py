@@ -0,0 +1,87 @@
+import shutil
+from contextlib import ExitStack
+from itertools import product
+from pathlib import Path
+from acceptor import Acceptor
+from example_trie import ExampleTrie
+from examples_teacher import ExamplesTeacher
+from lambda_examples_teacher import LambdaExamplesTeacher
+from human_examples_teacher import HumanExamplesTeacher
+from human_lambda_examples_teacher import HumanLambdaExamplesTeacher
+from l_star import l_star
+from mapped_examples import MappedExamples
+from main import inflate_all, use_examples_teacher
+from languages import copy_examples, second_symbol_1
+
+# strings that end in 1
+ENDS_1 = Acceptor({0, 1}, 0, {1}, {(0, '0'): 0, (0, '1'): 1, (1, '0'): 0, (1, '1'): 1})
+
+def test_lookup():
+  '''
+  should match wildcards without expanding them, preferring positive examples
+  '''
+  trie = ExampleTrie.from_examples({'P': {'11XXXXXXXXXX11', 'λ'}, 'N': {'0X', 'X0', '00'}}, 'X')
+  assert len(trie) == 5
+  assert len(trie.children) < 30
+  assert trie.lookup('11' + '01' * 5 + '11') is True
+  assert trie.lookup('11' + '01' * 5 + '10') is None
+  assert trie.lookup('λ') is True and trie.lookup('') is True
+  assert trie.lookup('01') is False and trie.lookup('10') is False and trie.lookup('11') is None
+  assert ExampleTrie.from_examples({'P': {'X'}, 'N': {'X'}}).lookup('a') is None
+
+def test_find_mismatch():
+  '''
+  should find a shortest mismatch, as if the examples were inflated
+  '''
+  examples = {'P': {'X1', '1X0', 'XX1X'}, 'N': {'0', 'XX0X', '10X0'}}
+  trie = ExampleTrie.from_examples(examples, 'X')
+  t = trie.find_mismatch(ENDS_1)
+  inflated = inflate_all(examples['P'], '01') | inflate_all(examples['N'], '01')
+  wrong = [s for s in inflated if (s in inflate_all(examples['P'], '01')) != ENDS_1.accepts(s)]
+  assert t is not None and len(t) == min(map(len, wrong)) and t in wrong
+  assert ExampleTrie.from_examples({'P': {'X1'}, 'N': {'0', 'X0'}}, 'X').find_mismatch(ENDS_1) is None
+
+def test_examples_teacher():
+  '''
+  should learn from wildcard examples without asking a human
+  '''
+  examples: dict[str, set[str]] = {'P': set(), 'N': {'λ', 'X'}}
+  for n in range(9):
+    examples['P'].add('X1' + 'X' * n)
+    examples['N'].add('X0' + 'X' * n)
+  teacher = ExamplesTeacher(examples, wildcard='X')
+  acceptor = l_star('01', teacher)
+  for n in range(8):
+    for symbols in product('01', repeat=n):
+      string = ''.join(symbols)
+      assert acceptor.accepts(string) == second_symbol_1(string)
+
+def test_use_examples_teacher(monkeypatch, tmp_path):
+  '''
+  should keep the wildcards of an examples file symbolic
+  '''
+  monkeypatch.setattr('builtins.print', lambda *args, **kwargs: None)
+  examples_file = tmp_path / 'starts_and_ends_with_11'
+  shutil.copy(Path(__file__).parent.parent / 'examples' / 'starts_and_ends_with_11', examples_file)
+  with ExitStack() as stack:
+    alphabet, teacher = use_examples_teacher(examples_file, stack)
+    assert alphabet == '01'
+    assert isinstance(teacher.examples, MappedExamples) and len(teacher.examples) > 0
+    assert teacher.membership_query('1101011') and not teacher.membership_query('110101')
+
+def test_siblings():
+  '''
+  should return the shortest mismatching example from every examples teacher
+  '''
+  examples = {'P': {'1', '0001', '0' * 30 + '1'}, 'N': {'λ', '10', '0' * 20 + '1' * 2 + '0'}}
+  teachers = [
+    ExamplesTeacher(copy_examples(examples)),
+    LambdaExamplesTeacher(ENDS_1.accepts, copy_examples(examples)),
+    HumanExamplesTeacher(examples['P'], examples['N']),
+    HumanLambdaExamplesTeacher(ENDS_1.accepts, copy_examples(examples)),
+  ]
+  # everything but the empty string
+  everything = Acceptor({0, 1}, 0, {1}, {(0, '0'): 1, (0, '1'): 1, (1, '0'): 1, (1, '1'): 1})
+  for teacher in teachers:
+    assert teacher.respond_to_conjecture(everything) == '10'
+  assert LambdaExamplesTeacher(ENDS_1.accepts, copy_examples(examples)).respond_to_conjecture(ENDS_1) is None
@@ -0,0 +1,15 @@
+from kearns_vazirani import kearns_vazirani
+from languages import zeros_teacher
+
+def test_kearns_vazirani():
+  '''
+  should learn a minimal acceptor without repeating a membership query
+  '''
+  teacher = zeros_teacher()
+  acceptor = kearns_vazirani('01', teacher)
+  assert acceptor.Q == {0, 1, 2}
+  assert acceptor.q0 == 0
+  for n in range(7):
+    assert acceptor.accepts('0' * n + '1') == (n % 3 == 0)
+  history = teacher.query_history()
+  assert len(history) == len(set(history))
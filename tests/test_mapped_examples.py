@@ -0,0 +1,111 @@
+import os
+from itertools import product
+from acceptor import Acceptor
+from example_trie import ExampleTrie
+from mapped_examples import MappedExamples
+from main import read_examples
+from languages import random_acceptor
+
+EXAMPLES = '''a few examples
+++
+11
+1X1
+λ
+0110
+--
+10
+
+0110
+010
+1
+'''
+
+def write(tmp_path, text=EXAMPLES):
+  path = tmp_path / 'examples'
+  path.write_text(text, encoding='utf-8')
+  return path
+
+def test_lookup(tmp_path, monkeypatch):
+  '''
+  should label every string as the examples read by read_examples do
+  '''
+  monkeypatch.setattr('builtins.print', lambda *args, **kwargs: None)
+  path = write(tmp_path)
+  examples = MappedExamples(path)
+  trie = ExampleTrie.from_examples(read_examples(path), 'X')
+  assert examples.description == 'a few examples'
+  assert examples.alphabet == '01'
+  assert len(examples) == len(trie) == 9
+  for n in range(6):
+    for symbols in product('01', repeat=n):
+      string = ''.join(symbols)
+      assert examples.lookup(string) == trie.lookup(string), string
+  assert examples.lookup('λ') is True and examples.lookup('0110') is True
+  assert examples.lookup('2') is None
+  examples.add('2', False)
+  assert examples.lookup('2') is False and len(examples) == 10
+
+def test_index(tmp_path):
+  '''
+  should cache the index next to the file and rebuild it when the file changes
+  '''
+  path = write(tmp_path)
+  MappedExamples(path)
+  index = path.with_name('examples.idx')
+  stamp = index.stat().st_mtime_ns
+  examples = MappedExamples(path)
+  assert index.stat().st_mtime_ns == stamp
+  assert examples.lookup('111') is True and examples.lookup('010') is False
+  path.write_text(EXAMPLES.replace('010', '0100'), encoding='utf-8')
+  os.utime(path, ns=(stamp + 10**9, stamp + 10**9))
+  examples = MappedExamples(path)
+  assert examples.lookup('010') is None and examples.lookup('0100') is False
+  index.write_bytes(b'garbage')
+  assert MappedExamples(path).lookup('0100') is False
+
+def test_find_mismatch(tmp_path):
+  '''
+  should find the shortest mismatching example, as the ExampleTrie does
+  '''
+  strings = [''.join(symbols) for n in range(7) for symbols in product('ab', repeat=n)]
+  path = write(tmp_path, 'some strings\n++\n' + '\n'.join(s for s in strings if s.count('a') % 3 == 0)
+    + '\n--\n' + '\n'.join(s for s in strings if s.count('a') % 3 == 1) + '\n')
+  examples = MappedExamples(path, wildcard=None)
+  trie = ExampleTrie.from_examples(read_examples(path))
+  for seed in range(20):
+    conjecture = random_acceptor(5, 'ab', seed)
+    found, expected = examples.find_mismatch(conjecture), trie.find_mismatch(conjecture)
+    assert (found is None) == (expected is None)
+    if found is not None:
+      assert len(found) == len(expected) and trie.lookup(found) != conjecture.accepts(found)
+  everything = Acceptor({0}, 0, {0}, {(0, 'a'): 0, (0, 'b'): 0})
+  assert MappedExamples(write(tmp_path)).find_mismatch(everything) == 'λ'
+
+def test_empty(tmp_path):
+  '''
+  should read an empty file as no examples
+  '''
+  with MappedExamples(write(tmp_path, '')) as examples:
+    assert examples.description == '' and len(examples) == 0
+    assert examples.lookup('0') is None
+    assert examples.find_mismatch(Acceptor({0}, 0, {0}, {})) is None
+
+def test_close(tmp_path):
+  '''
+  should unmap the file and its index, whether built or loaded
+  '''
+  path = write(tmp_path)
+  for _ in range(2):
+    with MappedExamples(path) as examples:
+      assert examples.lookup('0110') is True
+    assert examples.lookup('0110') is None and examples.lookup('1X1') is True
+
+def test_collisions(tmp_path, monkeypatch):
+  '''
+  should compare every example with the same hash
+  '''
+  monkeypatch.setattr('mapped_examples._hash', lambda key: len(key))
+  path = write(tmp_path)
+  with MappedExamples(path) as examples:
+    assert examples.lookup('11') is True and examples.lookup('10') is False and examples.lookup('01') is None
+    assert examples.lookup('0110') is True and examples.lookup('010') is False
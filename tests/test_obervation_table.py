@@ -0,0 +1,109 @@
+from obervation_table import ObservationTable
+from lambda_teacher import LambdaTeacher
+from languages import second_symbol_1
+
+def make_table() -> tuple[ObservationTable, LambdaTeacher]:
+  teacher = LambdaTeacher(second_symbol_1)
+  table = ObservationTable('01')
+  table.init(teacher)
+  return table, teacher
+
+def test_index():
+  '''
+  should group members of S with equal rows
+  '''
+  table, teacher = make_table()
+  table.add_to_S('0')
+  table.add_to_S('01')
+  table.extend(teacher)
+  index = table.index()
+  assert index[table.signature('λ')] == {'λ', '0'}
+  assert index[table.signature('01')] == {'01'}
+
+def test_closed():
+  '''
+  should find a row of S*A that is missing from S
+  '''
+  table, teacher = make_table()
+  table.add_to_S('0')
+  table.extend(teacher)
+  assert not table.closed()
+  assert table.find_not_closed() in ('01', '11')
+  table.add_to_S(table.find_not_closed())
+  table.extend(teacher)
+  assert table.closed()
+
+def test_consistent():
+  '''
+  should find a suffix that separates two members of S with equal rows
+  '''
+  table, teacher = make_table()
+  for s in ('0', '01'):
+    table.add_to_S(s)
+  table.extend(teacher)
+  assert not table.consistent()
+  assert table.find_not_consistent() == '1'
+  table.add_to_E('1')
+  table.extend(teacher)
+  assert table.consistent()
+
+def test_extend():
+  '''
+  should only ask about cells added since the last extension
+  '''
+  table, teacher = make_table()
+  assert teacher.query_history() == ['λ', '0', '1']
+  table.extend(teacher)
+  assert len(teacher.query_history()) == 3
+  table.add_to_E('0')
+  table.extend(teacher)
+  assert teacher.query_history()[3:] == ['00', '10']
+  table.add_to_S('1')
+  table.extend(teacher)
+  assert teacher.query_history()[5:] == ['100', '11', '110']
+
+class BatchTeacher(LambdaTeacher):
+  def __init__(self, membership):
+    super().__init__(membership)
+    self.batches: list[list[str]] = []
+
+  def membership_queries(self, strings: list[str]) -> list[bool]:
+    self.batches.append(strings)
+    return super().membership_queries(strings)
+
+def test_extend_batch():
+  '''
+  should send all the missing cells of an extension as one batch
+  '''
+  teacher = BatchTeacher(second_symbol_1)
+  table = ObservationTable('01')
+  table.init(teacher)
+  table.add_to_S('1')
+  table.add_to_E('1')
+  table.extend(teacher)
+  table.extend(teacher)
+  assert teacher.batches == [['λ', '0', '1'], ['10', '11', '01', '101', '111']]
+
+def test_row_cache():
+  '''
+  should add one cell per cached row for a new suffix,
+  and rows only for s and each s*a for a new prefix
+  '''
+  table, teacher = make_table()
+  def cached() -> dict[str, list]:
+    return {table.T.string(node): row for node, row in table._rows.items()}
+  assert cached() == {'λ': [False], '0': [False], '1': [False]}
+  rows_before = dict(table._rows)
+  table.add_to_E('1')
+  assert {s: len(row) for s, row in cached().items()} == {'λ': 2, '0': 2, '1': 2}
+  assert all(table._rows[node] is row for node, row in rows_before.items())
+  table.extend(teacher)
+  assert cached() == {'λ': [False, False], '0': [False, True], '1': [False, True]}
+  table.add_to_S('1')
+  assert set(cached()) == {'λ', '0', '1', '10', '11'}
+  assert cached()['10'] == [None, None]
+  table.extend(teacher)
+  assert cached()['10'] == [False, False]
+  assert cached()['11'] == [True, True]
+  table.add_to_S('1')
+  assert len(cached()) == 5
@@ -0,0 +1,55 @@
+import gc
+import pytest
+from lambda_teacher import LambdaTeacher
+from parallel_lambda_teacher import ParallelLambdaTeacher
+from parallel_lambda_examples_teacher import ParallelLambdaExamplesTeacher
+from l_star import l_star
+from languages import ZEROS_EXAMPLES, copy_examples, zeros_multiple_of_3
+
+def test_membership_queries():
+  '''
+  should answer a batch in order and record it like the serial teacher
+  '''
+  strings = ['λ', '0', '000', '1001', '0100', '1', '00000']
+  serial = LambdaTeacher(zeros_multiple_of_3)
+  with ParallelLambdaTeacher(zeros_multiple_of_3, workers=2, chunksize=2) as parallel:
+    assert parallel.membership_queries(strings) == serial.membership_queries(strings)
+    assert parallel.query_history() == serial.query_history()
+
+def test_l_star():
+  '''
+  should learn the same acceptor as the serial teacher
+  '''
+  serial = LambdaTeacher(zeros_multiple_of_3)
+  with ParallelLambdaTeacher(zeros_multiple_of_3, workers=2) as parallel:
+    m1, m2 = l_star('01', serial), l_star('01', parallel)
+    assert parallel.query_history() == serial.query_history()
+  assert m1.Q == m2.Q and m1.F == m2.F and m1.d == m2.d
+
+def test_unpicklable():
+  '''
+  should reject a membership function that cannot be sent to the workers
+  '''
+  with pytest.raises(TypeError):
+    ParallelLambdaTeacher(lambda string: True)
+
+def test_examples_teacher():
+  '''
+  should answer batches in parallel and check conjectures against the examples
+  '''
+  with ParallelLambdaExamplesTeacher(zeros_multiple_of_3, copy_examples(ZEROS_EXAMPLES), workers=2) as teacher:
+    acceptor = l_star('01', teacher)
+  assert len(acceptor.Q) == 3
+  assert teacher.pool._executor is None
+
+def test_close_without_with():
+  '''
+  should stop the workers when the teacher is garbage collected
+  '''
+  teacher = ParallelLambdaTeacher(zeros_multiple_of_3, workers=2)
+  teacher.membership_queries(['0', '00', '000'])
+  finalizer = teacher.pool._finalizer
+  assert finalizer is not None and finalizer.alive
+  del teacher
+  gc.collect()
+  assert not finalizer.alive
@@ -0,0 +1,57 @@
+import re
+from itertools import product
+import pytest
+from brzozowski import parse, pretty, literal, concat, star, union, some
+from dfa_teacher import equivalent
+from kearns_vazirani import kearns_vazirani
+from l_star import l_star
+from regex_teacher import LazyDFA, RegexTeacher
+from languages import random_acceptor
+
+def test_parse():
+  '''
+  should read what pretty() writes
+  '''
+  assert parse('a(b|c)*') is concat(literal('a'), star(union(literal('b'), literal('c'))))
+  assert parse('a|b|c') is union(literal('a'), union(literal('b'), literal('c')))
+  assert parse('(ab)+') is some(concat(literal('a'), literal('b')))
+  for text in ('(ba|(a|bb)(ab)*(b|aa))*', '(1?0)*(1(1(0+1)*)?)?', '(0|1)*1(0|1)(0|1)'):
+    assert pretty(parse(text)) == text
+  for text in ('(a', 'a)', '*a'):
+    with pytest.raises(ValueError):
+      parse(text)
+
+def test_lazy_dfa():
+  '''
+  should agree with re, with one state per distinct derivative
+  '''
+  for text in ('(ba|(a|bb)(ab)*(b|aa))*', '(a|b)*a(a|b)(a|b)', 'a+b?|(ab)*', 'ε|a∅'):
+    dfa = LazyDFA(text, 'ab')
+    pattern = re.compile(text.replace('ε', '').replace('∅', '[^\\s\\S]'))
+    for n in range(9):
+      for symbols in product('ab', repeat=n):
+        string = ''.join(symbols)
+        assert dfa.accepts(string) == (pattern.fullmatch(string) is not None), (text, string)
+  assert len(LazyDFA('(a|b)*a(a|b)(a|b)', 'ab').to_acceptor().minimize('ab').Q) == 8
+
+def test_learn():
+  '''
+  should let the learners find the exact language of a regular expression
+  '''
+  text = '(a|b)*a(a|b)(a|b)'
+  for learn in (lambda t: l_star('ab', t), lambda t: kearns_vazirani('ab', t)):
+    teacher = RegexTeacher(text, 'ab')
+    acceptor = learn(teacher)
+    assert len(acceptor.minimize('ab').Q) == 8
+    assert teacher.respond_to_conjecture(acceptor) is None
+
+def test_round_trip(capsys):
+  '''
+  should read back the regular expression of print_acceptor() as the same language
+  '''
+  for seed in range(5):
+    acceptor = random_acceptor(6, 'ab', seed)
+    acceptor.print_acceptor()
+    lines = capsys.readouterr().out.splitlines()
+    regex = lines[lines.index('REGEX') + 2]
+    assert equivalent(acceptor, LazyDFA(regex, 'ab').to_acceptor(), 'ab')
@@ -0,0 +1,75 @@
+import io
+from acceptor import Acceptor
+from scanner import Scanner, Match, _lines
+from serialization import save
+import main
+
+# 1 followed by 0s
+ONE_ZEROS = Acceptor({0, 1}, 0, {1}, {(0, '1'): 1, (1, '0'): 1})
+TEXT = b'100\r\n0100x10\n\n1\n1000'
+
+def test_lines():
+  '''
+  should report whole accepted lines, by offset, from buffers and streams alike
+  '''
+  scanner = Scanner(ONE_ZEROS, '01')
+  expected = [Match(1, 0, 3), Match(4, 14, 15), Match(5, 16, 20)]
+  assert list(scanner.lines(TEXT)) == expected
+  assert list(scanner.lines(memoryview(TEXT))) == expected
+  assert list(scanner.lines(io.BytesIO(TEXT))) == expected
+  # lines that span chunks of a stream
+  assert list(_lines(io.BytesIO(TEXT), 3)) == list(_lines(TEXT))
+
+def test_matches():
+  '''
+  should report leftmost-longest matches without crossing lines
+  '''
+  scanner = Scanner(ONE_ZEROS, '01')
+  spans = [(m.line, TEXT[m.start:m.end]) for m in scanner.matches(TEXT)]
+  assert spans == [(1, b'100'), (2, b'100'), (2, b'10'), (4, b'1'), (5, b'1000')]
+
+def test_worst_case():
+  '''
+  should take L(L+1)/2 steps on a line of L symbols that keeps every start live,
+  and at most two per symbol on a line of one-symbol matches
+  '''
+  class Steps(list):
+    count = 0
+    def __getitem__(self, i):
+      Steps.count += 1
+      return super().__getitem__(i)
+  # 0s then 1
+  scanner = Scanner(Acceptor({0, 1}, 0, {1}, {(0, '0'): 0, (0, '1'): 1}), '01')
+  scanner.delta = Steps(scanner.delta)
+  assert not list(scanner.matches(b'0' * 200))
+  assert Steps.count == 200 * 201 // 2
+  Steps.count = 0
+  assert len(list(scanner.matches(b'1' * 200))) == 200
+  assert Steps.count == 2 * 200 - 1
+
+def test_found():
+  '''
+  should report the text of what it finds, from streams too
+  '''
+  scanner = Scanner(ONE_ZEROS, '01')
+  assert [text for _, text in scanner.found(io.BytesIO(TEXT), matches=True)] == [b'100', b'100', b'10', b'1', b'1000']
+  assert [text for _, text in scanner.found(io.BytesIO(TEXT))] == [b'100', b'1', b'1000']
+
+def test_cli(tmp_path, capsys, monkeypatch):
+  '''
+  should scan a file with a saved model
+  '''
+  model = tmp_path / 'model.dfa'
+  log = tmp_path / 'log'
+  save(ONE_ZEROS, model, '01')
+  log.write_bytes(TEXT)
+  assert main.scan([str(model), str(log)]) == 0
+  assert capsys.readouterr().out == '1:100\n4:1\n5:1000\n'
+  assert main.scan(['--matches', str(model), str(log)]) == 0
+  assert capsys.readouterr().out.splitlines()[:2] == ['1:0:3:100', '2:6:9:100']
+  empty = tmp_path / 'empty'
+  empty.write_bytes(b'')
+  assert main.scan([str(model), str(empty)]) == 1
+  monkeypatch.setattr('sys.stdin', io.TextIOWrapper(io.BytesIO(TEXT)))
+  assert main.scan(['--matches', str(model), '-']) == 0
+  assert capsys.readouterr().out.splitlines()[:2] == ['1:0:3:100', '2:6:9:100']
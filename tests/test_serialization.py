@@ -0,0 +1,65 @@
+import pytest
+from acceptor import Acceptor
+from dfa_teacher import equivalent
+from serialization import HEADER_SIZE, save, load, save_json, load_json, to_json, from_json
+from languages import random_acceptor
+
+def test_binary(tmp_path):
+  '''
+  should round-trip through a mapped file, including partial transitions
+  '''
+  path = tmp_path / 'model.dfa'
+  for acceptor in (random_acceptor(100, 'abc', 0), Acceptor({3, 4}, 4, {3}, {(4, '1'): 3, (3, '0'): 3})):
+    save(acceptor, path)
+    loaded = load(path)
+    assert not loaded.table.flags.writeable
+    assert equivalent(acceptor, loaded, acceptor.get_alphabet())
+    assert loaded.accepts_many(['1', '10', '0', 'abc']).tolist() == [acceptor.accepts(s) for s in ['1', '10', '0', 'abc']]
+
+def test_invalid(tmp_path):
+  '''
+  should refuse files that are not acceptors or are truncated
+  '''
+  path = tmp_path / 'model.dfa'
+  path.write_bytes(b'not an acceptor' * 4)
+  with pytest.raises(ValueError):
+    load(path)
+  save(random_acceptor(10, 'ab', 0), path)
+  path.write_bytes(path.read_bytes()[:60])
+  with pytest.raises(ValueError):
+    load(path)
+  # a transition to state 11 of 10, then an initial state out of range
+  save(random_acceptor(10, 'ab', 0), path)
+  data = bytearray(path.read_bytes())
+  cell = HEADER_SIZE + 8
+  data[cell:cell + 4] = (11).to_bytes(4, 'little')
+  path.write_bytes(data)
+  with pytest.raises(ValueError):
+    load(path)
+  save(random_acceptor(10, 'ab', 0), path)
+  data = bytearray(path.read_bytes())
+  data[16:20] = (11).to_bytes(4, 'little')
+  path.write_bytes(data)
+  with pytest.raises(ValueError):
+    load(path)
+
+def test_json(tmp_path):
+  '''
+  should round-trip through JSON
+  '''
+  path = tmp_path / 'model.json'
+  acceptor = random_acceptor(20, 'ab', 1)
+  save_json(acceptor, path)
+  loaded = load_json(path)
+  assert (loaded.Q, loaded.q0, loaded.F, loaded.d) == (acceptor.Q, acceptor.q0, acceptor.F, acceptor.d)
+  assert load_json(path, 'ba').Q == acceptor.Q
+  with pytest.raises(ValueError):
+    load_json(path, 'abc')
+  data = to_json(acceptor)
+  data['transitions'].append([0, 'c', 1])
+  with pytest.raises(ValueError):
+    from_json(data)
+  data = to_json(acceptor)
+  data['initial'] = 20
+  with pytest.raises(ValueError):
+    from_json(data)
@@ -0,0 +1,36 @@
+import gc
+import pytest
+from sexpr import sexpr
+from brzozowski import literal, concat, star, union, combine
+
+def test_interned():
+  '''
+  should build each structure once and compare by identity
+  '''
+  ab = concat(literal('a'), literal('b'))
+  assert ab is concat(literal('a'), literal('b'))
+  assert union(ab, ab).left is union(ab, ab).right
+  assert ab != concat(literal('b'), literal('a'))
+  assert literal('a') is not sexpr('a')
+  assert combine(['a']) is literal('a')
+  assert star(ab).size == 4
+  assert hash(star(ab)) == hash(star(concat(literal('a'), literal('b'))))
+  assert len({ab, concat(literal('a'), literal('b'))}) == 1
+
+def test_immutable():
+  '''
+  should refuse changes, since other expressions may share the node
+  '''
+  with pytest.raises(AttributeError):
+    literal('a').left = literal('b')
+
+def test_collected():
+  '''
+  should not keep nodes that are no longer used
+  '''
+  before = len(sexpr._interned)
+  e = star(concat(literal('x'), literal('y')))
+  assert len(sexpr._interned) >= before + 2
+  del e
+  gc.collect()
+  assert len(sexpr._interned) <= before + 2
@@ -0,0 +1,26 @@
+from l_star import l_star
+from lambda_teacher import LambdaTeacher
+from shortening_teacher import ShorteningTeacher, shorten
+from languages import zeros_multiple_of_3, zeros_teacher
+
+def test_shorten():
+  '''
+  should remove the padding around the part of a counterexample that matters
+  '''
+  wrong = l_star('01', LambdaTeacher(zeros_multiple_of_3))
+  membership = LambdaTeacher(zeros_multiple_of_3).membership_queries
+  assert shorten(wrong, '1' * 20 + '000' + '1' * 20, membership) == '000'
+  assert shorten(wrong, '10100', membership, batch_size=1) == '000'
+
+def test_fewer_queries():
+  '''
+  should learn the same language with fewer membership queries
+  '''
+  plain = zeros_teacher()
+  l_star('01', plain)
+  teacher = ShorteningTeacher(zeros_teacher())
+  acceptor = l_star('01', teacher)
+  assert len(acceptor.Q) == 3
+  for n in range(7):
+    assert acceptor.accepts('1' + '0' * n) == (n % 3 == 0)
+  assert len(teacher.query_history()) < len(plain.query_history())
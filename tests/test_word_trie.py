@@ -0,0 +1,36 @@
+from word_trie import WordTrie
+
+def test_encode_decode():
+  '''
+  should map strings to symbol indices and back
+  '''
+  trie = WordTrie('ab')
+  assert trie.encode('λ') == ()
+  assert trie.encode('aλba') == (0, 1, 0)
+  assert trie.decode(()) == 'λ'
+  assert trie.decode((1, 0)) == 'ba'
+
+def test_walk():
+  '''
+  should share nodes between words with a common prefix
+  '''
+  trie = WordTrie('ab')
+  ab = trie.node('ab')
+  assert trie.walk(trie.node('a'), (1,)) == ab
+  assert trie.find(trie.ROOT, (1, 1)) is None
+  assert trie.string(ab) == 'ab'
+
+def test_mapping():
+  '''
+  should behave like a dict keyed by strings
+  '''
+  trie = WordTrie('ab')
+  trie['ab'] = True
+  trie['λ'] = False
+  assert 'ab' in trie
+  assert 'a' not in trie
+  assert 'c' not in trie
+  assert trie['ab'] is True
+  assert trie.get('a') is None
+  assert len(trie) == 2
+  assert dict(trie.items()) == {'λ': False, 'ab': True}
@@ -0,0 +1,153 @@
+'''
+WordTrie
+'''
+
+from typing import Generator, Optional
+from my_types import Alphabet, Word
+
+class WordTrie:
+  '''
+  a finite function from words to {0,1}, stored as a prefix trie
+
+  words are tuples of symbol indices into the alphabet and each node of
+  the trie is an integer, so u*a and u*e are found by walking from the
+  node of u rather than by building and hashing a new string.
+  the string-keyed methods (in, [], get, items) are kept for the boundary
+  with teachers and for printing
+  '''
+  ROOT = 0
+
+  def __init__(self, alphabet: Alphabet):
+    self.alphabet = alphabet
+    self.symbol_index: dict[str, int] = {a: i for i, a in enumerate(alphabet)}
+    # per node: symbol index -> child node
+    self.children: list[dict[int, int]] = [{}]
+    self.parents: list[int] = [-1]
+    self.symbols: list[int] = [-1]
+    self.values: list[bool | None] = [None]
+    self._size = 0
+
+  def encode(self, string: str) -> Word:
+    '''
+    the word for a string (λs are dropped)
+
+    Args:
+        string (str): string over the alphabet
+
+    Returns:
+        Word: symbol indices of the string
+    '''
+    try:
+      return tuple(self.symbol_index[a] for a in string if a != 'λ')
+    except KeyError as e:
+      raise ValueError(f'{string} is not over the alphabet {self.alphabet}') from e
+
+  def decode(self, word: Word) -> str:
+    '''
+    the string for a word (λ for the empty word)
+    '''
+    return ''.join(self.alphabet[i] for i in word) or 'λ'
+
+  def child(self, node: int, symbol: int) -> int:
+    '''
+    the node for node*symbol, created if needed
+    '''
+    children = self.children[node]
+    c = children.get(symbol)
+    if c is None:
+      c = len(self.values)
+      children[symbol] = c
+      self.children.append({})
+      self.parents.append(node)
+      self.symbols.append(symbol)
+      self.values.append(None)
+    return c
+
+  def walk(self, node: int, word: Word) -> int:
+    '''
+    the node for node*word, created if needed
+    '''
+    for symbol in word:
+      node = self.child(node, symbol)
+    return node
+
+  def find(self, node: int, word: Word) -> Optional[int]:
+    '''
+    the node for node*word, or None if it has not been created
+    '''
+    for symbol in word:
+      c = self.children[node].get(symbol)
+      if c is None:
+        return None
+      node = c
+    return node
+
+  def node(self, string: str) -> int:
+    '''
+    the node for a string, created if needed
+    '''
+    return self.walk(self.ROOT, self.encode(string))
+
+  def word(self, node: int) -> Word:
+    '''
+    the word spelled by the path from the root to node
+    '''
+    symbols: list[int] = []
+    while node != self.ROOT:
+      symbols.append(self.symbols[node])
+      node = self.parents[node]
+    return tuple(reversed(symbols))
+
+  def string(self, node: int) -> str:
+    '''
+    the string spelled by the path from the root to node
+    '''
+    return self.decode(self.word(node))
+
+  def set(self, node: int, value: bool) -> None:
+    '''
+    record T(node)
+    '''
+    if self.values[node] is None:
+      self._size += 1
+    self.values[node] = value
+
+  def _find_string(self, string: str) -> Optional[int]:
+    try:
+      return self.find(self.ROOT, self.encode(string))
+    except ValueError:
+      return None
+
+  def __contains__(self, string: str) -> bool:
+    node = self._find_string(string)
+    return node is not None and self.values[node] is not None
+
+  def __getitem__(self, string: str) -> bool:
+    node = self._find_string(string)
+    value = None if node is None else self.values[node]
+    if value is None:
+      raise KeyError(string)
+    return value
+
+  def __setitem__(self, string: str, value: bool) -> None:
+    self.set(self.node(string), value)
+
+  def get(self, string: str, default: Optional[bool] = None) -> Optional[bool]:
+    node = self._find_string(string)
+    value = None if node is None else self.values[node]
+    return default if value is None else value
+
+  def __len__(self) -> int:
+    return self._size
+
+  def items(self) -> Generator[tuple[str, bool], None, None]:
+    '''
+    (string, T(string)) for each known string, in the order its node was created
+    '''
+    for node, value in enumerate(self.values):
+      if value is not None:
+        yield self.string(node), value
+
+  def __iter__(self) -> Generator[str, None, None]:
+    for string, _ in self.items():
+      yield string